@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Request, Response
+
+from src.app.config import settings
+from src.core.responses import FastJSONRoute
+from src.services.batch import BatchRequest, BatchResponse, dispatch_batch
+
+router = APIRouter(tags=["batch"], route_class=FastJSONRoute)
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def post_batch(request: Request, batch: BatchRequest):
+    """
+    Run many API calls in one round trip. Each result carries the status,
+    headers and body the call would have returned on its own, errors included.
+    """
+    body = await dispatch_batch(
+        request, batch, settings.BATCH_MAX_REQUESTS, settings.BATCH_MAX_CONCURRENCY
+    )
+    return Response(body, media_type="application/json")
@@ -1,10 +1,38 @@
-from fastapi import APIRouter, HTTPException, Header, status, Body, Depends
-from src.app.config import settings
+from fastapi import APIRouter, status
 
-router = APIRouter(prefix="/auth", tags=["auth"], redirect_slashes=False)
+from src.core.health import HealthReport, health_checker
+from src.core.responses import FastJSONResponse, FastJSONRoute
 
+router = APIRouter(
+    prefix="/health", tags=["health"], redirect_slashes=False, route_class=FastJSONRoute
+)
 
-@router.get("/health", status_code=status.HTTP_200_OK)
+_NO_STORE = {"Cache-Control": "no-store"}
+
+
+@router.get("/live", status_code=status.HTTP_200_OK)
 async def get_health():
-    """Return the actual public key for frontend"""
-    return {"Message": "Api is running!"}
\ No newline at end of file
+    """Liveness: the process is up and serving. Touches no dependency."""
+    return FastJSONResponse({"status": "ok"}, headers=_NO_STORE)
+
+
+@router.get(
+    "/ready",
+    response_model=HealthReport,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": HealthReport}},
+)
+async def get_readiness():
+    """
+    Readiness: database ping, pool saturation and event loop lag, with the
+    latency of each probe. Returns 503 while a critical probe fails.
+    """
+    report = await health_checker.check()
+    return FastJSONResponse(
+        report,
+        status_code=(
+            status.HTTP_200_OK
+            if report.healthy
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+        headers=_NO_STORE,
+    )
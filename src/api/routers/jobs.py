@@ -0,0 +1,51 @@
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, status
+from pydantic import BaseModel
+
+from src.core.dependencies.auth import get_current_claims
+from src.core.responses import FastJSONRoute
+from src.services.jobs import JobInfo, JobStatus, job_queue
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+    dependencies=[Depends(get_current_claims)],
+    redirect_slashes=False,
+    route_class=FastJSONRoute,
+)
+
+
+class JobRequest(BaseModel):
+    task: str
+    args: List[Any] = []
+    kwargs: Dict[str, Any] = {}
+    priority: int = 0
+    max_retries: Optional[int] = None
+
+
+@router.post("", response_model=JobInfo, status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(request: JobRequest):
+    """Queue a registered task; poll `GET /jobs/{job_id}` for its status and result."""
+    return await job_queue.submit(
+        request.task,
+        args=request.args,
+        kwargs=request.kwargs,
+        priority=request.priority,
+        max_retries=request.max_retries,
+    )
+
+
+@router.get("", response_model=List[JobInfo])
+async def list_jobs(job_status: Optional[JobStatus] = None):
+    return job_queue.list(job_status)
+
+
+@router.get("/{job_id}", response_model=JobInfo)
+async def get_job(job_id: str):
+    return job_queue.get(job_id)
+
+
+@router.delete("/{job_id}", response_model=JobInfo)
+async def cancel_job(job_id: str):
+    return job_queue.cancel(job_id)
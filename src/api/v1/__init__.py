@@ -1,6 +1,13 @@
 from fastapi import APIRouter
 
+from src.api.routers.batch import router as batch_router
+from src.api.routers.health import router as health_router
+from src.api.routers.jobs import router as jobs_router
+
 # Need to update this base on router files
 # from src.api.routers import *
 
 v1_router = APIRouter(prefix="/base_URL")
+v1_router.include_router(health_router)
+v1_router.include_router(jobs_router)
+v1_router.include_router(batch_router)
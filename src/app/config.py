@@ -1,19 +1,37 @@
-import os
-from dotenv import load_dotenv
-from pydantic.v1 import BaseSettings
-from typing import List
-
-load_dotenv()
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
     """
-    Application configuration using Pydantic's BaseSettings.
+    Application configuration using pydantic-settings' BaseSettings.
+
+    Every attribute can be overridden by an environment variable of the same
+    name or by an entry in `.env`.
 
     Attributes:
         LOG_LEVEL (str): Logging level (e.g., "INFO", "DEBUG").
         LOGGER_NAME (str): Name to use for the application logger.
+        LOG_FORMAT (str): "json" for structured JSON lines or "text".
+        LOG_QUEUE_SIZE (int): Records buffered for the logging thread before dropping.
+        LOG_SAMPLE_RATE (float): Fraction of WARNING+ records kept (1.0 keeps all).
+        LOG_RATE_LIMIT (float): WARNING+ records per second allowed per message (0 disables).
+        LOG_RATE_LIMIT_BURST (int): Burst allowance for LOG_RATE_LIMIT.
         DATABASE_URL (str): Database connection string.
+        DATABASE_READ_URLS (str): Comma-separated read replica connection strings.
+        DB_REPLICA_STRATEGY (str): Replica selection, "round_robin" or "least_connections".
+        DB_REPLICA_MAX_LAG_SECONDS (float): Replicas lagging further behind are ejected.
+        DB_REPLICA_HEALTH_INTERVAL (float): Seconds between replica health checks.
+        DB_ECHO (bool): Log SQL statements (only honoured when DEBUG is enabled).
+        DB_POOL_SIZE (int): Connections kept open in the pool.
+        DB_MAX_OVERFLOW (int): Extra connections allowed beyond the pool size.
+        DB_POOL_TIMEOUT (float): Seconds to wait for a connection before failing.
+        DB_POOL_RECYCLE (int): Seconds after which a connection is replaced.
+        DB_POOL_PRE_PING (bool): Test connections for liveness on checkout.
+        DB_POOL_WARMUP (int): Connections opened per pool at startup.
+        DB_STATEMENT_CACHE_SIZE (int): asyncpg prepared statement cache size (0 behind PgBouncer).
+        DB_BULK_CHUNK_SIZE (int): Rows per multi-row INSERT/IN statement in repository bulk operations.
         ALLOWED_ORIGINS (str): Comma-separated CORS origins.
         ENVIRONMENT (str): Application environment (development, staging, production).
         APP_NAME (str): Display name for the app.
@@ -21,33 +39,266 @@ class Settings(BaseSettings):
         DEBUG (bool): Whether debug mode is enabled.
         PORT (int): Port to run the FastAPI app.
         HOST (str): Host address to bind.
+        WORKERS (int): Worker processes for `src.app.server`; 0 means one per CPU.
+        RELOAD (bool): Run a single auto-reloading process (development only).
+        REUSE_PORT (bool): Give each worker its own SO_REUSEPORT socket where supported.
+        BACKLOG (int): Maximum queued connections on the listening socket.
+        KEEP_ALIVE_TIMEOUT (int): Seconds an idle keep-alive connection is kept open.
+        GRACEFUL_SHUTDOWN_TIMEOUT (int): Seconds to drain in-flight requests on SIGTERM.
+        ACCESS_LOG (bool): Emit uvicorn access logs.
+        JSON_BACKEND (str): JSON encoder for responses: "auto", "orjson", "msgspec" or "json".
+        EXPORT_CHUNK_SIZE (int): Rows fetched per server-side cursor round trip in exports.
+        EXPORT_BUFFER_BYTES (int): Approximate size of each streamed export chunk.
+        EXPORT_GZIP_LEVEL (int): Compression level for gzipped exports.
+        CACHE_BACKEND (str): Response cache backend, "memory" or "redis".
+        CACHE_DEFAULT_TTL (float): Seconds a cached response is kept by default.
+        CACHE_MAX_ENTRIES (int): Maximum entries in the in-process cache.
+        CACHE_MAX_BYTES (int): Maximum total size of values in the in-process cache.
+        CACHE_REDIS_URL (str): Redis URL for the "redis" backend.
+        CACHE_KEY_PREFIX (str): Prefix for keys stored in the shared backend.
+        CURSOR_SECRET_KEY (str): Secret used to sign keyset pagination cursors; the
+            app refuses to start with the default outside development.
+        COUNT_STRATEGY (str): Default total count strategy (exact, estimated, cached).
+        COUNT_ESTIMATE_THRESHOLD (int): Estimates below this are replaced by exact counts.
+        COUNT_CACHE_TTL (float): Seconds a cached exact count stays valid.
+        COUNT_CACHE_MAX_ENTRIES (int): Maximum number of cached counts per process.
+        RATE_LIMIT_ENABLED (bool): Apply the global rate limit middleware.
+        RATE_LIMIT_REQUESTS (int): Requests allowed per client and period (also the burst size).
+        RATE_LIMIT_PERIOD (float): Rate limit period in seconds.
+        RATE_LIMIT_ALGORITHM (str): "token_bucket" or "sliding_window".
+        RATE_LIMIT_KEY (str): What a client is: "ip", "api_key" or "route".
+        RATE_LIMIT_BACKEND (str): "memory" (per process) or "redis" (shared by all workers).
+        RATE_LIMIT_REDIS_URL (str): Redis URL for the "redis" backend.
+        RATE_LIMIT_MAX_KEYS (int): Clients tracked by the in-process backend before eviction.
+        RATE_LIMIT_EXEMPT_PATHS (str): Comma-separated path prefixes the middleware skips.
+        LOAD_SHED_ENABLED (bool): Cap in-flight requests with adaptive concurrency limits.
+        LOAD_SHED_ALGORITHM (str): "aimd" or "gradient".
+        LOAD_SHED_INITIAL_LIMIT (int): Starting concurrency limit per route class.
+        LOAD_SHED_MIN_LIMIT (int): Lowest the adaptive limit may go.
+        LOAD_SHED_MAX_LIMIT (int): Highest the adaptive limit may go.
+        LOAD_SHED_LATENCY_TARGET (float): Seconds above which AIMD treats a request as slow.
+        LOAD_SHED_POOL_WAIT_THRESHOLD (float): Average DB pool wait (s) that counts as saturation.
+        LOAD_SHED_RETRY_AFTER (int): `Retry-After` seconds sent with shed requests.
+        LOAD_SHED_ROUTE_CLASSES (str): Comma-separated `path_prefix=class` pairs with own limits.
+        LOAD_SHED_EXEMPT_PATHS (str): Comma-separated path prefixes never shed (health, metrics).
+        HEALTH_CACHE_TTL (float): Seconds a readiness report is reused before probing again.
+        HEALTH_PROBE_TIMEOUT (float): Seconds each readiness probe may take.
+        HEALTH_MAX_POOL_WAIT (float): Average DB pool checkout wait (s) that fails readiness.
+        HEALTH_MAX_LOOP_LAG (float): Event loop lag (s) that fails readiness.
+        COMPRESSION_ENABLED (bool): Compress responses for clients that accept it.
+        COMPRESSION_ENCODINGS (str): Encodings in order of preference; br/zstd need brotli/zstandard.
+        COMPRESSION_MIN_SIZE (int): Buffered bodies smaller than this (bytes) are sent as-is.
+        COMPRESSION_LEVEL (int): Default compression level.
+        COMPRESSION_LEVELS (str): Comma-separated `content_type=level` overrides (prefix match).
+        COMPRESSION_CONTENT_TYPES (str): Comma-separated compressible content type prefixes.
+        COMPRESSION_CACHE_MAX_ENTRIES (int): Precompressed bodies kept per process.
+        COMPRESSION_CACHE_MAX_BYTES (int): Total size of precompressed bodies kept per process.
+        COMPRESSION_CACHE_TTL (float): Seconds a precompressed body is kept.
+        JWT_ALGORITHMS (str): Comma-separated accepted signing algorithms, e.g. "RS256".
+        JWT_SECRET_KEY (str): Shared secret for HS* tokens.
+        JWT_JWKS_URL (str): URL of the issuer's JWKS, refreshed in the background.
+        JWT_JWKS_FILE (str): Local JWKS (JSON) or PEM public key file, re-read in the background.
+        JWT_AUDIENCE (str): Required `aud` claim; empty to skip the check.
+        JWT_ISSUER (str): Required `iss` claim; empty to skip the check.
+        JWT_LEEWAY (int): Seconds of clock skew tolerated on `exp`/`nbf`.
+        JWT_CACHE_MAX_ENTRIES (int): Verified tokens cached per process.
+        JWT_CACHE_TTL (float): Longest a verified token is cached (also capped by `exp`).
+        JWT_JWKS_REFRESH_INTERVAL (float): Seconds between background JWKS URL / file refreshes.
+        JOBS_PROCESS_WORKERS (int): Worker processes for CPU-bound offload, per server process
+            (0 = CPU count - 1 split across `WORKERS`, at least 1).
+        JOBS_THREAD_WORKERS (int): Worker threads for blocking I/O offload.
+        JOBS_PROCESS_NICE (int): Niceness added to worker processes so request handling wins the CPU.
+        JOBS_MAX_PENDING (int): Offloaded calls in flight or waiting per pool before callers wait.
+        JOBS_CONCURRENCY (int): Queued jobs run at the same time.
+        JOBS_QUEUE_MAX_SIZE (int): Jobs waiting in the queue before submissions are refused.
+        JOBS_MAX_RETRIES (int): Default retries for a failing job.
+        JOBS_RETRY_BACKOFF (float): Seconds before the first retry, doubled on each retry.
+        JOBS_RESULT_TTL (float): Seconds a finished job's status and result are kept.
+        JOBS_SHUTDOWN_TIMEOUT (float): Seconds shutdown waits for running jobs to drain.
+        MIGRATION_LOCK_TIMEOUT (str): PostgreSQL `lock_timeout` during migrations, e.g. "5s".
+        MIGRATION_STATEMENT_TIMEOUT (str): PostgreSQL `statement_timeout` during migrations.
+        MIGRATION_BACKFILL_BATCH_SIZE (int): Rows per committed batch in migration backfills.
+        MIGRATION_BACKFILL_PAUSE (float): Seconds to pause between backfill batches.
+        BATCH_MAX_REQUESTS (int): Sub-requests accepted in one `/batch` call.
+        BATCH_MAX_CONCURRENCY (int): Sub-requests of one batch dispatched at the same time.
     """
 
     # -------------------------------------------------------------------------
     # 🌐 Application Info
     # -------------------------------------------------------------------------
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
-    APP_NAME: str = os.getenv("APP_NAME", "FastAPI Service")
-    APP_VERSION: str = os.getenv("APP_VERSION", "0.1.0")
-    DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true"
-    PORT: int = int(os.getenv("PORT", "8000"))
-    HOST: str = os.getenv("HOST", "0.0.0.0")
+    ENVIRONMENT: str = "development"
+    APP_NAME: str = "FastAPI Service"
+    APP_VERSION: str = "0.1.0"
+    DEBUG: bool = True
+    PORT: int = 8000
+    HOST: str = "0.0.0.0"
+
+    # -------------------------------------------------------------------------
+    # 🏭 Server / Workers
+    # -------------------------------------------------------------------------
+    WORKERS: int = 0
+    RELOAD: bool = False
+    REUSE_PORT: bool = True
+    BACKLOG: int = 2048
+    KEEP_ALIVE_TIMEOUT: int = 5
+    GRACEFUL_SHUTDOWN_TIMEOUT: int = 30
+    ACCESS_LOG: bool = False
 
     # -------------------------------------------------------------------------
     # 🧱 Database Configuration
     # -------------------------------------------------------------------------
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    DATABASE_URL: str = ""
+    DATABASE_READ_URLS: str = ""
+    DB_REPLICA_STRATEGY: str = "round_robin"
+    DB_REPLICA_MAX_LAG_SECONDS: float = 10.0
+    DB_REPLICA_HEALTH_INTERVAL: float = 15.0
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 2
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_BULK_CHUNK_SIZE: int = 1000
 
     # -------------------------------------------------------------------------
     # 🔐 CORS / Security Settings
     # -------------------------------------------------------------------------
-    ALLOWED_ORIGINS: str = os.getenv("ALLOWED_ORIGINS", "*")
+    ALLOWED_ORIGINS: str = "*"
+
+    # -------------------------------------------------------------------------
+    # 📦 Serialization
+    # -------------------------------------------------------------------------
+    JSON_BACKEND: str = "auto"
+    EXPORT_CHUNK_SIZE: int = 1000
+    EXPORT_BUFFER_BYTES: int = 64 * 1024
+    EXPORT_GZIP_LEVEL: int = 6
+
+    # -------------------------------------------------------------------------
+    # ⚡ Response Cache
+    # -------------------------------------------------------------------------
+    CACHE_BACKEND: str = "memory"
+    CACHE_DEFAULT_TTL: float = 60.0
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_KEY_PREFIX: str = "cache:"
+
+    # -------------------------------------------------------------------------
+    # 📑 Pagination
+    # -------------------------------------------------------------------------
+    CURSOR_SECRET_KEY: str = "change-me"
+    COUNT_STRATEGY: str = "exact"
+    COUNT_ESTIMATE_THRESHOLD: int = 10000
+    COUNT_CACHE_TTL: float = 30.0
+    COUNT_CACHE_MAX_ENTRIES: int = 1024
+
+    # -------------------------------------------------------------------------
+    # 🚦 Rate Limiting
+    # -------------------------------------------------------------------------
+    RATE_LIMIT_ENABLED: bool = False
+    RATE_LIMIT_REQUESTS: int = 100
+    RATE_LIMIT_PERIOD: float = 1.0
+    RATE_LIMIT_ALGORITHM: str = "token_bucket"
+    RATE_LIMIT_KEY: str = "ip"
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_REDIS_URL: str = "redis://localhost:6379/0"
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    RATE_LIMIT_EXEMPT_PATHS: str = (
+        "/metrics,/base_URL/health,/docs,/redoc,/openapi.json"
+    )
+
+    # -------------------------------------------------------------------------
+    # 🛟 Load Shedding
+    # -------------------------------------------------------------------------
+    LOAD_SHED_ENABLED: bool = False
+    LOAD_SHED_ALGORITHM: str = "aimd"
+    LOAD_SHED_INITIAL_LIMIT: int = 100
+    LOAD_SHED_MIN_LIMIT: int = 5
+    LOAD_SHED_MAX_LIMIT: int = 1000
+    LOAD_SHED_LATENCY_TARGET: float = 1.0
+    LOAD_SHED_POOL_WAIT_THRESHOLD: float = 0.1
+    LOAD_SHED_RETRY_AFTER: int = 1
+    LOAD_SHED_ROUTE_CLASSES: str = ""
+    LOAD_SHED_EXEMPT_PATHS: str = "/metrics,/base_URL/health"
+
+    # -------------------------------------------------------------------------
+    # 🩺 Health Checks
+    # -------------------------------------------------------------------------
+    HEALTH_CACHE_TTL: float = 2.0
+    HEALTH_PROBE_TIMEOUT: float = 1.0
+    HEALTH_MAX_POOL_WAIT: float = 0.5
+    HEALTH_MAX_LOOP_LAG: float = 0.5
+
+    # -------------------------------------------------------------------------
+    # 🗜️ Compression
+    # -------------------------------------------------------------------------
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_ENCODINGS: str = "br,zstd,gzip"
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_LEVEL: int = 6
+    COMPRESSION_LEVELS: str = "application/x-ndjson=3,text/csv=3"
+    COMPRESSION_CONTENT_TYPES: str = (
+        "application/json,application/x-ndjson,application/javascript,"
+        "application/xml,image/svg+xml,text/"
+    )
+    COMPRESSION_CACHE_MAX_ENTRIES: int = 1000
+    COMPRESSION_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    COMPRESSION_CACHE_TTL: float = 600.0
+
+    # -------------------------------------------------------------------------
+    # 🔑 Authentication
+    # -------------------------------------------------------------------------
+    JWT_ALGORITHMS: str = "RS256"
+    JWT_SECRET_KEY: str = ""
+    JWT_JWKS_URL: str = ""
+    JWT_JWKS_FILE: str = ""
+    JWT_AUDIENCE: str = ""
+    JWT_ISSUER: str = ""
+    JWT_LEEWAY: int = 0
+    JWT_CACHE_MAX_ENTRIES: int = 10000
+    JWT_CACHE_TTL: float = 300.0
+    JWT_JWKS_REFRESH_INTERVAL: float = 300.0
+
+    # -------------------------------------------------------------------------
+    # ⚙️ Background Jobs
+    # -------------------------------------------------------------------------
+    JOBS_PROCESS_WORKERS: int = 0
+    JOBS_THREAD_WORKERS: int = 4
+    JOBS_PROCESS_NICE: int = 5
+    JOBS_MAX_PENDING: int = 64
+    JOBS_CONCURRENCY: int = 4
+    JOBS_QUEUE_MAX_SIZE: int = 1000
+    JOBS_MAX_RETRIES: int = 3
+    JOBS_RETRY_BACKOFF: float = 1.0
+    JOBS_RESULT_TTL: float = 3600.0
+    JOBS_SHUTDOWN_TIMEOUT: float = 30.0
+
+    # -------------------------------------------------------------------------
+    # 🧬 Migrations
+    # -------------------------------------------------------------------------
+    MIGRATION_LOCK_TIMEOUT: str = "5s"
+    MIGRATION_STATEMENT_TIMEOUT: str = ""
+    MIGRATION_BACKFILL_BATCH_SIZE: int = 5000
+    MIGRATION_BACKFILL_PAUSE: float = 0.05
+
+    # -------------------------------------------------------------------------
+    # 📦 Batch Requests
+    # -------------------------------------------------------------------------
+    BATCH_MAX_REQUESTS: int = 50
+    BATCH_MAX_CONCURRENCY: int = 8
 
     # -------------------------------------------------------------------------
     # 🪵 Logging Configuration
     # -------------------------------------------------------------------------
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    LOGGER_NAME: str = os.getenv("LOGGER_NAME", "fastapi-app")
+    LOG_LEVEL: str = "INFO"
+    LOGGER_NAME: str = "fastapi-app"
+    LOG_FORMAT: str = "json"
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_SAMPLE_RATE: float = 1.0
+    LOG_RATE_LIMIT: float = 10.0
+    LOG_RATE_LIMIT_BURST: int = 20
 
     # -------------------------------------------------------------------------
     # ⚙️ Utility Methods
@@ -59,8 +310,65 @@ class Settings(BaseSettings):
             return ["*"]
         return [o.strip() for o in self.ALLOWED_ORIGINS.split(",") if o.strip()]
 
-    class Config:
-        env_file = ".env"
+    @property
+    def get_rate_limit_exempt_paths(self) -> List[str]:
+        """Return list of path prefixes exempt from the rate limit middleware."""
+        return [p.strip() for p in self.RATE_LIMIT_EXEMPT_PATHS.split(",") if p.strip()]
+
+    @property
+    def get_load_shed_route_classes(self) -> Dict[str, str]:
+        """Return path prefix -> route class (split by comma, then by `=`)."""
+        pairs = [
+            p.split("=", 1) for p in self.LOAD_SHED_ROUTE_CLASSES.split(",") if "=" in p
+        ]
+        return {prefix.strip(): name.strip() for prefix, name in pairs}
+
+    @property
+    def get_load_shed_exempt_paths(self) -> List[str]:
+        """Return list of path prefixes never shed by the load shedding middleware."""
+        return [p.strip() for p in self.LOAD_SHED_EXEMPT_PATHS.split(",") if p.strip()]
+
+    @property
+    def get_compression_encodings(self) -> List[str]:
+        """Return list of response encodings in order of preference."""
+        return [
+            e.strip().lower()
+            for e in self.COMPRESSION_ENCODINGS.split(",")
+            if e.strip()
+        ]
+
+    @property
+    def get_compression_levels(self) -> Dict[str, int]:
+        """Return content type prefix -> compression level (split by comma, then by `=`)."""
+        pairs = [
+            p.split("=", 1) for p in self.COMPRESSION_LEVELS.split(",") if "=" in p
+        ]
+        return {media.strip(): int(level) for media, level in pairs}
+
+    @property
+    def get_compression_content_types(self) -> List[str]:
+        """Return list of compressible content type prefixes."""
+        return [
+            t.strip() for t in self.COMPRESSION_CONTENT_TYPES.split(",") if t.strip()
+        ]
+
+    @property
+    def get_jwt_algorithms(self) -> List[str]:
+        """Return list of accepted JWT signing algorithms (split by comma)."""
+        return [a.strip() for a in self.JWT_ALGORITHMS.split(",") if a.strip()]
+
+    @property
+    def get_database_read_urls(self) -> List[str]:
+        """Return list of read replica URLs (split by comma)."""
+        return [u.strip() for u in self.DATABASE_READ_URLS.split(",") if u.strip()]
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Settings are read from the environment and `.env` once per process."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,188 @@
+import hashlib
+from typing import Dict, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app.config import settings
+from src.core.cache import MemoryBackend
+from src.core.compression import available_encodings, compress, compressor, negotiate
+
+# Statuses whose body must not be re-encoded
+_SKIP_STATUSES = {204, 206, 304}
+
+# Server-sent events must reach the client as they are sent, not sit in a compressor
+_STREAMED_CONTENT_TYPES = ("text/event-stream",)
+
+
+def _weaken(etag: str) -> str:
+    """A compressed body is a different representation, so its ETag can only be weak."""
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary", "")
+    if "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """
+    Content-negotiated response compression: brotli and zstd when installed,
+    gzip always.
+
+    Buffered responses below `min_size` bytes are left alone; streaming
+    responses are compressed chunk by chunk. The level comes from `levels`
+    (longest matching content type prefix) or `level`. Bodies that carry a
+    strong ETag are likely to repeat, so their compressed variants are kept
+    in an LRU keyed by a digest of the body and reused instead of compressed
+    again. Responses that are already encoded, not of a `content_types` type,
+    server-sent events, or marked `Cache-Control: no-transform` pass through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Sequence[str] = ("br", "zstd", "gzip"),
+        min_size: int = 1024,
+        level: int = 6,
+        levels: Optional[Dict[str, int]] = None,
+        content_types: Sequence[str] = ("application/json", "text/"),
+        cache: Optional[MemoryBackend] = None,
+        cache_ttl: float = 600.0,
+    ):
+        self.app = app
+        self.encodings = available_encodings(encodings)
+        self.min_size = min_size
+        self.level = level
+        self.levels = sorted(
+            (levels or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.content_types = tuple(content_types)
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+
+    def _level_for(self, content_type: str) -> int:
+        for prefix, level in self.levels:
+            if content_type.startswith(prefix):
+                return level
+        return self.level
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        content_type = headers.get("content-type", "")
+        return (
+            "content-encoding" not in headers
+            and content_type.startswith(self.content_types)
+            and not content_type.startswith(_STREAMED_CONTENT_TYPES)
+            and "no-transform" not in headers.get("cache-control", "")
+        )
+
+    async def _compress_cached(
+        self, encoding: str, level: int, body: bytes, etag: str
+    ) -> bytes:
+        if self.cache is None or not etag.startswith('"'):
+            return compress(encoding, level, body)
+        # Route-set ETags are only unique per resource, so key on the body itself
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        key = f"{digest}:{encoding}:{level}"
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+        data = compress(encoding, level, body)
+        await self.cache.set(key, data, self.cache_ttl)
+        return data
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        codec = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, codec, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if message["status"] == 304 and "etag" in headers:
+                    # Repeat the validator the compressed 200 would have carried
+                    headers["ETag"] = _weaken(headers["etag"])
+                    _add_vary(headers)
+                if message["status"] in _SKIP_STATUSES or not self._compressible(
+                    headers
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            headers = MutableHeaders(scope=start_message)
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            level = self._level_for(headers.get("content-type", ""))
+
+            if codec is None and not more_body:
+                # Buffered response: compress in one go, or not at all if small
+                _add_vary(headers)
+                if len(body) < self.min_size:
+                    await send(start_message)
+                    await send(message)
+                    return
+                etag = headers.get("etag", "")
+                data = await self._compress_cached(encoding, level, body, etag)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(data))
+                if etag:
+                    headers["ETag"] = _weaken(etag)
+                await send(start_message)
+                await send({"type": "http.response.body", "body": data})
+                return
+
+            if codec is None:
+                # Streaming response: the total size is unknown, compress as it flows
+                codec = compressor(encoding, level)
+                _add_vary(headers)
+                headers["Content-Encoding"] = encoding
+                if "content-length" in headers:
+                    del headers["content-length"]
+                if "etag" in headers:
+                    headers["ETag"] = _weaken(headers["etag"])
+                await send(start_message)
+
+            data = codec.compress(body) if body else b""
+            if not more_body:
+                data += codec.flush()
+            if data or not more_body:
+                await send(
+                    {"type": "http.response.body", "body": data, "more_body": more_body}
+                )
+
+        await self.app(scope, receive, send_compressed)
+
+
+def compression_options() -> Dict[str, object]:
+    """`CompressionMiddleware` keyword arguments from the `COMPRESSION_*` settings."""
+    return {
+        "encodings": settings.get_compression_encodings,
+        "min_size": settings.COMPRESSION_MIN_SIZE,
+        "level": settings.COMPRESSION_LEVEL,
+        "levels": settings.get_compression_levels,
+        "content_types": settings.get_compression_content_types,
+        "cache": MemoryBackend(
+            max_entries=settings.COMPRESSION_CACHE_MAX_ENTRIES,
+            max_bytes=settings.COMPRESSION_CACHE_MAX_BYTES,
+        ),
+        "cache_ttl": settings.COMPRESSION_CACHE_TTL,
+    }
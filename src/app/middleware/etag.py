@@ -0,0 +1,144 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# -----------------------------------------------------------------------------
+# 🏷️ Validator Helpers
+# -----------------------------------------------------------------------------
+def strong_etag(body: bytes) -> str:
+    """Strong ETag from the exact bytes of a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def http_date(value: datetime) -> str:
+    """Format a datetime for `Last-Modified`; naive datetimes are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of `etag` against an `If-None-Match` header, as RFC 9110 requires."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def not_modified_since(
+    if_modified_since: Optional[str], last_modified: datetime
+) -> bool:
+    """Whether `last_modified` is not newer than the `If-Modified-Since` header."""
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP dates have one-second resolution
+    return last_modified.replace(microsecond=0) <= since
+
+
+def is_not_modified(
+    headers: Headers, etag: Optional[str], last_modified: Optional[datetime]
+) -> bool:
+    """Evaluate conditional GET headers; `If-None-Match` takes precedence when present."""
+    if "if-none-match" in headers:
+        return etag is not None and etag_matches(headers["if-none-match"], etag)
+    if last_modified is not None:
+        return not_modified_since(headers.get("if-modified-since"), last_modified)
+    return False
+
+
+# -----------------------------------------------------------------------------
+# 🔁 Middleware
+# -----------------------------------------------------------------------------
+# Headers a 304 must repeat from the 200 it stands in for (RFC 9110 §15.4.5)
+NOT_MODIFIED_HEADERS = (
+    "cache-control",
+    "content-location",
+    "date",
+    "etag",
+    "expires",
+    "vary",
+)
+
+
+class ETagMiddleware:
+    """
+    Adds strong ETags to buffered GET/HEAD responses and answers conditional
+    requests with `304 Not Modified`.
+
+    Routes that already set an `ETag` or `Last-Modified` (e.g. via
+    `ConditionalRequest`) keep theirs. Streaming responses pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if message.get("more_body", False):
+                # Streaming response: forward as-is
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            body = message.get("body", b"")
+            if "etag" not in headers and "content-encoding" not in headers:
+                headers["ETag"] = strong_etag(body)
+
+            last_modified = None
+            if "last-modified" in headers:
+                try:
+                    last_modified = parsedate_to_datetime(headers["last-modified"])
+                except (TypeError, ValueError):
+                    pass
+
+            if is_not_modified(request_headers, headers.get("etag"), last_modified):
+                raw = [
+                    (k, v) for k, v in headers.raw if k.decode() in NOT_MODIFIED_HEADERS
+                ]
+                await send(
+                    {"type": "http.response.start", "status": 304, "headers": raw}
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
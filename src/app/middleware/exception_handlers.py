@@ -1,13 +1,13 @@
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
 
 from src.core.logger import logger
 from src.core.common.exceptions import ApiException
+from src.core.responses import FastJSONResponse
 
 
 async def api_exception_handler(
     request: Request, exp: ApiException | HTTPException | Exception
-) -> JSONResponse:
+) -> FastJSONResponse:
     """
     Handles custom API exceptions and returns a structured JSON response.
 
@@ -16,14 +16,21 @@ async def api_exception_handler(
         exp (ApiException): The raised API exception.
 
     Returns:
-        JSONResponse: A JSON response with error details and appropriate status code.
+        FastJSONResponse: A JSON response with error details and appropriate status code.
     """
-    logger.error(f"{exp.__class__.__name__} at {request.url}: {exp.message}")
-    return JSONResponse(
+    logger.error(
+        "%s at %s: %s",
+        exp.__class__.__name__,
+        request.url,
+        exp.message,
+        extra={"rate_limit_key": exp.__class__.__name__},
+    )
+    return FastJSONResponse(
         status_code=exp.status_code or 500,
         content={
             "error": exp.__class__.__name__,
             "details": exp.message or "Unexpected error occurred.",
             "status_code": exp.status_code or 500,
         },
+        headers=getattr(exp, "headers", None),
     )
@@ -0,0 +1,79 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics import REGISTRY, RequestStats, request_stats
+
+REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ["method", "route"]
+)
+REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "HTTP requests by status code.",
+    ["method", "route", "status"],
+)
+RESPONSE_BYTES = REGISTRY.histogram(
+    "http_response_size_bytes",
+    "HTTP response body size.",
+    ["method", "route"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+REQUEST_DB_SECONDS = REGISTRY.histogram(
+    "http_request_db_seconds",
+    "Time spent in SQL per HTTP request.",
+    ["method", "route"],
+)
+IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.", ["method"]
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class InstrumentationMiddleware:
+    """
+    Pure ASGI middleware recording latency, status codes, response sizes,
+    in-flight requests and SQL time per request.
+
+    Metrics are labelled by route template (e.g. `/items/{item_id}`), taken
+    from the route the router matched, so cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        IN_FLIGHT.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            IN_FLIGHT.dec(method=method)
+            request_stats.reset(token)
+
+            # The router stores the matched route on the shared scope dict.
+            route = scope.get("route")
+            template = getattr(route, "path", UNMATCHED_ROUTE)
+            REQUEST_SECONDS.observe(elapsed, method=method, route=template)
+            REQUESTS.inc(method=method, route=template, status=str(status_code))
+            RESPONSE_BYTES.observe(response_size, method=method, route=template)
+            REQUEST_DB_SECONDS.observe(stats.db_time, method=method, route=template)
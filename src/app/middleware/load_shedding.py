@@ -0,0 +1,98 @@
+import time
+from typing import Dict, Mapping, Optional, Sequence
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app.config import settings
+from src.app.middleware.exception_handlers import api_exception_handler
+from src.core.common.exceptions import ServiceUnavailable
+from src.core.concurrency import AdaptiveLimit, create_limits
+from src.core.db import pool_wait
+
+# Upstream statuses that mean the request itself ran into overload
+_OVERLOAD_STATUSES = {503, 504}
+
+
+class LoadSheddingMiddleware:
+    """
+    Fails fast with 503 when a route class has too many requests in flight.
+
+    Each route class (`route_classes` maps path prefixes to class names;
+    everything else is "default") has an `AdaptiveLimit` that shrinks when
+    latency rises or the DB pool is saturated, i.e. the average checkout wait
+    exceeds `pool_wait_threshold`. Rejected requests get `ServiceUnavailable`
+    through `api_exception_handler` with `Retry-After`, instead of queueing
+    for a connection until they time out. `exempt_paths` (health checks,
+    metrics) are always let through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        route_classes: Optional[Mapping[str, str]] = None,
+        exempt_paths: Sequence[str] = (),
+        limits: Optional[Dict[str, AdaptiveLimit]] = None,
+        pool_wait_threshold: float = 0.1,
+        retry_after: int = 1,
+    ):
+        self.app = app
+        # Longest prefix first, so nested prefixes win
+        self.route_classes = sorted(
+            (route_classes or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.exempt_paths = tuple(exempt_paths)
+        self.limits = limits or create_limits(dict(route_classes or {}))
+        self.pool_wait_threshold = pool_wait_threshold
+        self.retry_after = retry_after
+
+    def _route_class(self, path: str) -> str:
+        for prefix, name in self.route_classes:
+            if path.startswith(prefix):
+                return name
+        return "default"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (
+            self.exempt_paths and scope["path"].startswith(self.exempt_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.limits[self._route_class(scope["path"])]
+        if not limit.try_acquire():
+            exc = ServiceUnavailable(
+                "Server is overloaded, retry later.",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            response = await api_exception_handler(Request(scope), exc)
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            overloaded = (
+                status_code in _OVERLOAD_STATUSES
+                or pool_wait.seconds > self.pool_wait_threshold
+            )
+            limit.release(time.perf_counter() - start, overloaded)
+
+
+def load_shedding_options() -> Dict[str, object]:
+    """`LoadSheddingMiddleware` keyword arguments from the `LOAD_SHED_*` settings."""
+    return {
+        "route_classes": settings.get_load_shed_route_classes,
+        "exempt_paths": settings.get_load_shed_exempt_paths,
+        "pool_wait_threshold": settings.LOAD_SHED_POOL_WAIT_THRESHOLD,
+        "retry_after": settings.LOAD_SHED_RETRY_AFTER,
+    }
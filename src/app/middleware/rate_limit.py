@@ -0,0 +1,54 @@
+from typing import Optional, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app.middleware.exception_handlers import api_exception_handler
+from src.core.common.exceptions import TooManyRequestsApiException
+from src.core.ratelimit import RateLimiter, default_rate_limiter
+
+
+class RateLimitMiddleware:
+    """
+    Applies one `RateLimiter` to every HTTP request before it reaches a route.
+
+    Rejected requests get the standard 429 error body without touching the
+    database; allowed ones carry `RateLimit-*` headers. Paths starting with
+    one of `exempt_paths` (metrics, docs) are not limited.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[RateLimiter] = None,
+        exempt_paths: Sequence[str] = (),
+    ):
+        self.app = app
+        self.limiter = limiter or default_rate_limiter()
+        self.exempt_paths = tuple(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (
+            self.exempt_paths and scope["path"].startswith(self.exempt_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            result = await self.limiter.check(scope)
+        except TooManyRequestsApiException as exc:
+            response = await api_exception_handler(Request(scope), exc)
+            await response(scope, receive, send)
+            return
+
+        if result is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(result.headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
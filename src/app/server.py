@@ -0,0 +1,166 @@
+import importlib.util
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+
+from src.app.config import settings
+from src.core.logger import logger, setup_logging
+
+APP_PATH = "src.main:app"
+
+
+def worker_count() -> int:
+    """Workers from `WORKERS`, or one per CPU when it is 0."""
+    return settings.WORKERS or os.cpu_count() or 1
+
+
+def _server_options() -> Dict[str, Any]:
+    """uvicorn options shared by every serving mode."""
+    return {
+        "host": settings.HOST,
+        "port": settings.PORT,
+        # Fast implementations when installed, pure-Python fallbacks otherwise
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+        "backlog": settings.BACKLOG,
+        "timeout_keep_alive": settings.KEEP_ALIVE_TIMEOUT,
+        "timeout_graceful_shutdown": settings.GRACEFUL_SHUTDOWN_TIMEOUT,
+        "access_log": settings.ACCESS_LOG,
+        "proxy_headers": True,
+        "lifespan": "on",
+        # Leave logging to src.core.logger instead of uvicorn's blocking handlers
+        "log_config": None,
+    }
+
+
+def _bind_reuseport() -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in settings.HOST else socket.AF_INET)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((settings.HOST, settings.PORT))
+    sock.set_inheritable(True)
+    return sock
+
+
+def _reuseport_worker() -> None:
+    """Worker process: own listening socket, kernel balances connections across workers."""
+    sock = _bind_reuseport()
+    server = uvicorn.Server(uvicorn.Config(APP_PATH, **_server_options()))
+    server.run(sockets=[sock])
+
+
+# A worker that dies within this many seconds of starting counts as a crash loop:
+# its restarts back off exponentially, up to `_MAX_RESTART_DELAY` seconds
+_STABLE_UPTIME = 10.0
+_MAX_RESTART_DELAY = 30.0
+
+
+def _restart_delay(crashes: int) -> float:
+    """Seconds to wait before restarting a worker after `crashes` early deaths in a row."""
+    if crashes <= 1:
+        return 0.0
+    return min(0.5 * 2 ** (crashes - 2), _MAX_RESTART_DELAY)
+
+
+def _serve_reuseport(workers: int) -> None:
+    """
+    Supervise `workers` processes that each bind the port with `SO_REUSEPORT`.
+
+    SIGTERM/SIGINT are forwarded to the workers, which stop accepting and drain
+    in-flight requests for up to `GRACEFUL_SHUTDOWN_TIMEOUT` seconds; stragglers
+    are killed afterwards. Workers that die unexpectedly are replaced, with
+    an exponential delay when they keep dying right after starting.
+    """
+    context = multiprocessing.get_context("spawn")
+    processes: List[multiprocessing.Process] = []
+    stopping = False
+
+    def spawn() -> multiprocessing.Process:
+        process = context.Process(target=_reuseport_worker, daemon=False)
+        process.start()
+        return process
+
+    def handle_signal(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    processes = [spawn() for _ in range(workers)]
+    started = [time.monotonic()] * workers
+    crashes = [0] * workers
+    restart_at: List[Optional[float]] = [None] * workers
+    logger.info(
+        "Started %s workers with SO_REUSEPORT on %s:%s",
+        workers,
+        settings.HOST,
+        settings.PORT,
+    )
+
+    while not stopping:
+        for index, process in enumerate(processes):
+            # Workers also get a terminal's SIGINT directly: never replace them on shutdown
+            if stopping:
+                break
+            now = time.monotonic()
+            if restart_at[index] is None:
+                if process.is_alive():
+                    continue
+                crashes[index] = (
+                    crashes[index] + 1 if now - started[index] < _STABLE_UPTIME else 0
+                )
+                delay = _restart_delay(crashes[index])
+                logger.warning(
+                    "Worker %s exited with code %s, restarting in %.1fs",
+                    process.pid,
+                    process.exitcode,
+                    delay,
+                )
+                restart_at[index] = now + delay
+            if now >= restart_at[index]:
+                restart_at[index] = None
+                processes[index], started[index] = spawn(), time.monotonic()
+        time.sleep(0.5)
+
+    logger.info("Draining %s workers", workers)
+    for process in processes:
+        if process.is_alive():
+            os.kill(process.pid, signal.SIGTERM)
+    deadline = time.monotonic() + settings.GRACEFUL_SHUTDOWN_TIMEOUT + 5
+    for process in processes:
+        process.join(max(deadline - time.monotonic(), 0))
+        if process.is_alive():
+            process.kill()
+
+
+def run() -> None:
+    """
+    Production entry point.
+
+    - `RELOAD=True`: single auto-reloading process for local development.
+    - One worker: serve in this process.
+    - Several workers: `SO_REUSEPORT` processes where the platform supports it,
+      otherwise uvicorn's multiprocess supervisor on a shared socket.
+    """
+    setup_logging()
+    if settings.RELOAD:
+        uvicorn.run(APP_PATH, reload=True, **_server_options())
+        return
+
+    workers = worker_count()
+    if workers == 1:
+        uvicorn.run(APP_PATH, **_server_options())
+    elif settings.REUSE_PORT and hasattr(socket, "SO_REUSEPORT"):
+        _serve_reuseport(workers)
+    else:
+        uvicorn.run(APP_PATH, workers=workers, **_server_options())
+
+
+if __name__ == "__main__":
+    run()
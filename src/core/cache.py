@@ -0,0 +1,427 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from fastapi import Request
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.responses import Response
+
+from src.app.config import settings
+from src.core.logger import logger
+from src.core.responses import dumps
+from src.models.base import BaseModel
+
+
+# -----------------------------------------------------------------------------
+# 🗄️ Backends
+# -----------------------------------------------------------------------------
+class CacheBackend:
+    """Interface of a cache backend storing bytes under string keys, grouped by tags."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(
+        self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()
+    ) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    def invalidate_tags_soon(self, tags: Iterable[str]) -> None:
+        """Invalidate from synchronous code (e.g. ORM events) without blocking."""
+        task = asyncio.get_running_loop().create_task(self.invalidate_tags(list(tags)))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+_background_tasks: Set[asyncio.Task] = set()
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process LRU cache with per-entry TTL.
+
+    Bounded both by entry count and by the total size of stored values; the
+    least recently used entries are evicted first once either bound is hit.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes, Tuple[str, ...]]]" = (
+            OrderedDict()
+        )
+        self._tags: Dict[str, Set[str]] = {}
+
+    def _remove(self, key: str) -> None:
+        _, value, tags = self._entries.pop(key)
+        self.size -= len(value)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(
+        self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()
+    ) -> None:
+        if len(value) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        tags = tuple(tags)
+        self._entries[key] = (time.monotonic() + ttl, value, tags)
+        self.size += len(value)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    async def delete(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        self.invalidate_tags_soon(tags)
+
+    def invalidate_tags_soon(self, tags: Iterable[str]) -> None:
+        # Nothing to await in-process, so invalidate right away.
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+        self.size = 0
+
+
+class RedisBackend(CacheBackend):
+    """
+    Shared cache backend for any Redis-compatible async client.
+
+    Only `get`, `delete`, `smembers` and a transactional `pipeline()` of
+    `set(ex=)`, `sadd` and `expire(nx=, gt=)` are used, so a local fake
+    implementing those can stand in for Redis (7+) in development.
+
+    Tags are stored as sets of keys next to the cached values. A tag set's
+    TTL is only ever extended, so it outlives every key it lists.
+    """
+
+    def __init__(self, client: Any = None, url: str = "", prefix: str = "cache:"):
+        if client is None:
+            import redis.asyncio as redis  # optional dependency
+
+            client = redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+
+    async def set(
+        self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()
+    ) -> None:
+        seconds = max(int(ttl), 1)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(self.prefix + key, value, ex=seconds)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, self.prefix + key)
+                # NX gives a new set its first TTL; GT never shortens an existing one
+                pipe.expire(tag_key, seconds, nx=True)
+                pipe.expire(tag_key, seconds, gt=True)
+            await pipe.execute()
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            keys = await self.client.smembers(self._tag_key(tag))
+            await self.client.delete(self._tag_key(tag), *keys)
+
+
+def create_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "redis":
+        return RedisBackend(
+            url=settings.CACHE_REDIS_URL, prefix=settings.CACHE_KEY_PREFIX
+        )
+    return MemoryBackend(
+        max_entries=settings.CACHE_MAX_ENTRIES, max_bytes=settings.CACHE_MAX_BYTES
+    )
+
+
+# -----------------------------------------------------------------------------
+# ⚡ Response Cache
+# -----------------------------------------------------------------------------
+def model_tag(model: Any) -> str:
+    """Tag for a model class or table name; writes to the table invalidate it."""
+    return getattr(model, "__tablename__", model)
+
+
+class ResponseCache:
+    """
+    Response cache with request coalescing and tag-based invalidation.
+
+    Concurrent misses on the same key share a single computation
+    ("single-flight"), so a burst of identical requests hits the DB once.
+    Errors are shared too, but if the computing request is cancelled one of
+    the waiting requests computes the value itself.
+    """
+
+    def __init__(self, backend: CacheBackend, default_ttl: float):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def key_for(request: Request, vary: Sequence[str] = ()) -> str:
+        """Build a key from the method, path, sorted query params and `vary` headers."""
+        parts = [
+            request.method,
+            request.url.path,
+            sorted(request.query_params.multi_items()),
+            [request.headers.get(name, "") for name in vary],
+        ]
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+    async def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[bytes]],
+        ttl: Optional[float] = None,
+        tags: Iterable[Any] = (),
+    ) -> Tuple[bytes, bool]:
+        """
+        Return the cached value for `key`, computing and storing it on a miss.
+
+        Returns:
+            Tuple[bytes, bool]: The value and whether it came from the cache.
+        """
+        value = await self.backend.get(key)
+        if value is not None:
+            return value, True
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight), True
+            except asyncio.CancelledError:
+                # Only the leader was cancelled (e.g. its client went away): take over.
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            return await self.get_or_set(key, compute, ttl, tags)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+            await self.backend.set(
+                key, value, ttl or self.default_ttl, [model_tag(t) for t in tags]
+            )
+        except Exception as exp:
+            future.set_exception(exp)
+            # Mark retrieved so an exception nobody waited for is not logged.
+            future.exception()
+            raise
+        except BaseException:
+            # Cancellation is the leader's own; waiting followers recompute instead.
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[key]
+        future.set_result(value)
+        return value, False
+
+    async def invalidate(self, *tags: Any) -> None:
+        await self.backend.invalidate_tags([model_tag(t) for t in tags])
+
+    def cached(
+        self,
+        ttl: Optional[float] = None,
+        tags: Iterable[Any] = (),
+        vary: Sequence[str] = (),
+        response_model: Any = None,
+    ) -> Callable:
+        """
+        Cache the JSON body of a GET route.
+
+        The endpoint's return value is JSON-encoded once on a miss and stored as
+        bytes; hits return the stored bytes without calling the endpoint. The
+        route's own `response_model` never sees the value, so it is validated
+        and serialized here with `response_model` instead. Place it below the
+        router decorator:
+
+            @router.get("/items", response_model=List[ItemOut])
+            @cache.cached(ttl=30, tags=[Item], response_model=List[ItemOut])
+            async def list_items(...): ...
+
+        Args:
+            ttl (float): Seconds to keep the response; defaults to `CACHE_DEFAULT_TTL`.
+            tags (Iterable): Models or table names whose writes invalidate the entry.
+            vary (Sequence[str]): Request headers that are part of the key.
+            response_model: Schema filtering the return value; defaults to the
+                endpoint's return annotation. Without one the value is encoded as
+                is, and returning ORM objects raises `TypeError`.
+        """
+        tags = tuple(tags)
+
+        def decorator(endpoint: Callable) -> Callable:
+            signature = inspect.signature(endpoint)
+            model = response_model
+            if model is None and signature.return_annotation is not signature.empty:
+                model = signature.return_annotation
+            if inspect.isclass(model) and issubclass(model, Response):
+                model = None
+            adapter = TypeAdapter(model) if model is not None else None
+            request_param = next(
+                (
+                    p.name
+                    for p in signature.parameters.values()
+                    if p.annotation is Request
+                ),
+                None,
+            )
+            if request_param is None:
+                request_param = "_cache_request"
+                signature = signature.replace(
+                    parameters=[
+                        *signature.parameters.values(),
+                        inspect.Parameter(
+                            request_param,
+                            inspect.Parameter.KEYWORD_ONLY,
+                            annotation=Request,
+                        ),
+                    ]
+                )
+
+            @functools.wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                request: Request = kwargs[request_param]
+                if request_param == "_cache_request":
+                    kwargs.pop(request_param)
+                if request.method not in ("GET", "HEAD"):
+                    return await endpoint(*args, **kwargs)
+
+                async def compute() -> bytes:
+                    result = await endpoint(*args, **kwargs)
+                    if adapter is not None:
+                        value = adapter.validate_python(result, from_attributes=True)
+                        return adapter.dump_json(value)
+                    if _contains_orm_objects(result):
+                        raise TypeError(
+                            f"{endpoint.__name__} returns ORM objects; "
+                            "pass cached(response_model=...) to filter them"
+                        )
+                    return dumps(result)
+
+                body, hit = await self.get_or_set(
+                    self.key_for(request, vary), compute, ttl, tags
+                )
+                return Response(
+                    content=body,
+                    media_type="application/json",
+                    headers={"X-Cache": "HIT" if hit else "MISS"},
+                )
+
+            wrapper.__signature__ = signature
+            return wrapper
+
+        return decorator
+
+
+def _contains_orm_objects(result: Any) -> bool:
+    if isinstance(result, (list, tuple)):
+        return any(isinstance(item, BaseModel) for item in result)
+    return isinstance(result, BaseModel)
+
+
+cache = ResponseCache(create_backend(), default_ttl=settings.CACHE_DEFAULT_TTL)
+
+
+# Dependency for FastAPI
+def get_cache() -> ResponseCache:
+    return cache
+
+
+# -----------------------------------------------------------------------------
+# 🧹 Invalidation on Model Writes
+# -----------------------------------------------------------------------------
+_PENDING_TAGS = "cache_pending_tags"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tags(session, flush_context):
+    tags = session.info.setdefault(_PENDING_TAGS, set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, BaseModel):
+            tags.add(model_tag(instance))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_tags(orm_execute_state):
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            orm_execute_state.session.info.setdefault(_PENDING_TAGS, set()).add(
+                table.name
+            )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tags(session):
+    tags = session.info.pop(_PENDING_TAGS, None)
+    if tags:
+        try:
+            cache.backend.invalidate_tags_soon(tags)
+        except RuntimeError:
+            logger.warning(
+                "No running event loop, cache tags not invalidated: %s", tags
+            )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_tags(session):
+    session.info.pop(_PENDING_TAGS, None)
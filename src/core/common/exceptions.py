@@ -1,9 +1,18 @@
+from typing import Dict, Optional
+
+
 class ApiException(Exception):
     """API Exception"""
 
-    def __init__(self, message: str, status_code: int = 500):
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 500,
+        headers: Optional[Dict[str, str]] = None,
+    ):
         self.status_code = status_code
         self.message = message
+        self.headers = headers
         super().__init__(message)
 
 
@@ -27,8 +36,8 @@ class UnauthorizedApiException(ApiException):
      response.
     """
 
-    def __init__(self, message: str):
-        super().__init__(message, status_code=401)
+    def __init__(self, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message, status_code=401, headers=headers)
 
 
 class UnauthorizedServiceAccountException(UnauthorizedApiException):
@@ -55,8 +64,8 @@ class ForbiddenApiException(ApiException):
 class ExpiredTokenException(ApiException):
     """Raise expired token condition. E.g. OAuth Token"""
 
-    def __init__(self, message: str):
-        super().__init__(message, status_code=403)
+    def __init__(self, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message, status_code=403, headers=headers)
 
 
 class PasswordPolicyException(ForbiddenApiException):
@@ -110,8 +119,17 @@ class ConflictApiException(ApiException):
 class TooManyRequestsApiException(ApiException):
     """The user has sent too many requests in a given amount of time ("rate limiting")."""
 
+    def __init__(self, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message, status_code=429, headers=headers)
+
+
+class FailedDependencyApiException(ApiException):
+    """The request could not be performed because a request it depends on failed, e.g. an earlier
+    sub-request of a batch.
+    """
+
     def __init__(self, message: str):
-        super().__init__(message, status_code=429)
+        super().__init__(message, status_code=424)
 
 
 class InternalErrorApiException(ApiException):
@@ -150,8 +168,8 @@ class ServiceUnavailable(ApiException):
     not be cached.
     """
 
-    def __init__(self, message: str):
-        super().__init__(message, status_code=503)
+    def __init__(self, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message, status_code=503, headers=headers)
 
 
 ERROR_CODE_TO_EXCEPTION = {
@@ -161,6 +179,7 @@ ERROR_CODE_TO_EXCEPTION = {
     404: NotFoundApiException,
     405: MethodNotAllowedApiException,
     409: ConflictApiException,
+    424: FailedDependencyApiException,
     429: TooManyRequestsApiException,
     500: InternalErrorApiException,
     501: NotImplementedApiException,
@@ -0,0 +1,103 @@
+import importlib.util
+import zlib
+from typing import Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+# -----------------------------------------------------------------------------
+# 🗜️ Codecs
+# -----------------------------------------------------------------------------
+def _gzip(level: int) -> Compressor:
+    return zlib.compressobj(min(max(level, 1), 9), wbits=31)
+
+
+class _Brotli:
+    def __init__(self, level: int):
+        import brotli  # optional dependency
+
+        self._compressor = brotli.Compressor(quality=min(max(level, 0), 11))
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _zstd(level: int) -> Compressor:
+    import zstandard  # optional dependency
+
+    return zstandard.ZstdCompressor(level=min(max(level, 1), 22)).compressobj()
+
+
+# Content-Encoding -> (factory taking a level, module that must be installed)
+_CODECS: Dict[str, Tuple[Callable[[int], Compressor], Optional[str]]] = {
+    "br": (_Brotli, "brotli"),
+    "zstd": (_zstd, "zstandard"),
+    "gzip": (_gzip, None),
+}
+
+
+def available_encodings(preferred: Sequence[str]) -> List[str]:
+    """The encodings of `preferred` that this process can produce, in the same order."""
+    return [
+        name
+        for name in preferred
+        if name in _CODECS
+        and (_CODECS[name][1] is None or importlib.util.find_spec(_CODECS[name][1]))
+    ]
+
+
+def compressor(encoding: str, level: int) -> Compressor:
+    factory: Callable[[int], Compressor] = _CODECS[encoding][0]
+    return factory(level)
+
+
+def compress(encoding: str, level: int, data: bytes) -> bytes:
+    codec = compressor(encoding, level)
+    return codec.compress(data) + codec.flush()
+
+
+# -----------------------------------------------------------------------------
+# 🤝 Negotiation
+# -----------------------------------------------------------------------------
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    weights = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+    return weights
+
+
+def negotiate(accept_encoding: str, supported: Sequence[str]) -> Optional[str]:
+    """
+    Pick the encoding for a request's `Accept-Encoding`.
+
+    The client's q-values decide; ties go to the server's order in `supported`.
+    `*` covers encodings not listed explicitly and `q=0` rules one out.
+    """
+    if not accept_encoding:
+        return None
+    weights = _parse_accept_encoding(accept_encoding)
+    default = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for name in supported:
+        weight = weights.get(name, default)
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
@@ -0,0 +1,126 @@
+import math
+from typing import Dict
+
+from src.app.config import settings
+from src.core.metrics import REGISTRY
+
+CONCURRENCY_LIMIT = REGISTRY.gauge(
+    "load_shed_concurrency_limit",
+    "Current adaptive concurrency limit.",
+    ["route_class"],
+)
+IN_FLIGHT = REGISTRY.gauge(
+    "load_shed_in_flight", "Requests holding a concurrency slot.", ["route_class"]
+)
+SHED = REGISTRY.counter(
+    "load_shed_rejections_total", "Requests rejected by load shedding.", ["route_class"]
+)
+
+AIMD = "aimd"
+GRADIENT = "gradient"
+
+
+class AdaptiveLimit:
+    """
+    Concurrency limit for one route class that adapts to observed latency.
+
+    Callers `try_acquire()` a slot before handling a request and `release()`
+    it with the request's latency and whether it saw overload (e.g. a slow
+    pool checkout). The limit is kept between `min_limit` and `max_limit`:
+
+    - "aimd": additive increase by one while at least half the slots are in
+      use and requests are healthy; multiplicative decrease by `backoff` when
+      latency exceeds `latency_target` or overload is reported.
+    - "gradient": the limit follows the ratio of the long-term to the recent
+      latency, so it shrinks as soon as latency rises above its baseline,
+      plus `sqrt(limit)` headroom to probe for more capacity. Overload is
+      handled as in AIMD.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        algorithm: str = AIMD,
+        latency_target: float = 0.5,
+        backoff: float = 0.9,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+    ):
+        if algorithm not in (AIMD, GRADIENT):
+            raise ValueError(f"Unknown concurrency limit algorithm: {algorithm}")
+        self.name = name
+        self.algorithm = algorithm
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.limit = float(initial)
+        self.in_flight = 0
+        # Latency averages for the gradient algorithm
+        self._long_latency = 0.0
+        self._short_latency = 0.0
+        CONCURRENCY_LIMIT.set(initial, route_class=name)
+
+    def try_acquire(self) -> bool:
+        if self.in_flight >= int(self.limit):
+            SHED.inc(route_class=self.name)
+            return False
+        self.in_flight += 1
+        IN_FLIGHT.set(self.in_flight, route_class=self.name)
+        return True
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        utilized = self.in_flight * 2 >= self.limit
+        self.in_flight -= 1
+        IN_FLIGHT.set(self.in_flight, route_class=self.name)
+
+        if overloaded:
+            limit = self.limit * self.backoff
+        elif self.algorithm == AIMD:
+            limit = self._aimd(latency, utilized)
+        else:
+            limit = self._gradient(latency)
+        self.limit = min(max(limit, self.min_limit), self.max_limit)
+        CONCURRENCY_LIMIT.set(int(self.limit), route_class=self.name)
+
+    def _aimd(self, latency: float, utilized: bool) -> float:
+        if latency > self.latency_target:
+            return self.limit * self.backoff
+        # Only grow when the current limit is actually being used
+        return self.limit + 1 if utilized else self.limit
+
+    def _gradient(self, latency: float) -> float:
+        if not self._long_latency:
+            self._long_latency = self._short_latency = latency
+            return self.limit
+        self._short_latency += (latency - self._short_latency) * self.smoothing
+        self._long_latency += (latency - self._long_latency) * self.smoothing / 10
+        gradient = max(
+            0.5,
+            min(
+                1.0,
+                self.tolerance * self._long_latency / max(self._short_latency, 1e-6),
+            ),
+        )
+        target = self.limit * gradient + math.sqrt(self.limit)
+        return self.limit * (1 - self.smoothing) + target * self.smoothing
+
+
+def create_limits(route_classes: Dict[str, str]) -> Dict[str, AdaptiveLimit]:
+    """One `AdaptiveLimit` per route class (plus "default"), from the `LOAD_SHED_*` settings."""
+    return {
+        name: AdaptiveLimit(
+            name,
+            initial=settings.LOAD_SHED_INITIAL_LIMIT,
+            min_limit=settings.LOAD_SHED_MIN_LIMIT,
+            max_limit=settings.LOAD_SHED_MAX_LIMIT,
+            algorithm=settings.LOAD_SHED_ALGORITHM,
+            latency_target=settings.LOAD_SHED_LATENCY_TARGET,
+        )
+        for name in {"default", *route_classes.values()}
+    }
@@ -1,19 +1,429 @@
-from typing import Any, AsyncGenerator
+import asyncio
+import itertools
+import time
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import Select, event, make_url, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from src.app.config import settings
+from src.core.logger import logger
+from src.core.metrics import REGISTRY, request_stats
+
+# All engines created by this module, by pool name
+engines: Dict[str, AsyncEngine] = {}
+
+# -----------------------------------------------------------------------------
+# 📊 Pool Metrics
+# -----------------------------------------------------------------------------
+POOL_CHECKOUT_SECONDS = REGISTRY.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool.",
+    ["pool"],
+    buckets=(
+        0.001,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+    ),
+)
+POOL_CHECKOUTS = REGISTRY.counter(
+    "db_pool_checkouts_total", "Connections checked out of the pool.", ["pool"]
+)
+POOL_TIMEOUTS = REGISTRY.counter(
+    "db_pool_timeouts_total", "Checkouts that gave up after DB_POOL_TIMEOUT.", ["pool"]
+)
+POOL_CONNECTS = REGISTRY.counter(
+    "db_pool_connections_created_total", "New DBAPI connections opened.", ["pool"]
+)
+POOL_INVALIDATIONS = REGISTRY.counter(
+    "db_pool_invalidations_total",
+    "Connections invalidated (e.g. failed pre-ping).",
+    ["pool"],
+)
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "db_query_duration_seconds", "Time spent executing SQL statements.", ["pool"]
+)
+POOL_CHECKED_OUT = REGISTRY.gauge(
+    "db_pool_checked_out", "Connections currently checked out.", ["pool"]
+)
+POOL_IDLE = REGISTRY.gauge("db_pool_idle", "Connections idle in the pool.", ["pool"])
+POOL_OVERFLOW = REGISTRY.gauge(
+    "db_pool_overflow", "Connections open beyond DB_POOL_SIZE.", ["pool"]
+)
+
+
+class PoolWaitTracker:
+    """
+    Recent pool checkout wait, as a saturation signal for load shedding.
+
+    An exponentially weighted average of checkout waits that also decays
+    towards zero (halving every `half_life` seconds) while nothing is checked
+    out, so an idle pool reads as unsaturated.
+    """
+
+    def __init__(self, alpha: float = 0.2, half_life: float = 5.0):
+        self.alpha = alpha
+        self.half_life = half_life
+        self._average = 0.0
+        self._updated = time.monotonic()
+
+    def _decayed(self, now: float) -> float:
+        return self._average * 0.5 ** ((now - self._updated) / self.half_life)
+
+    def observe(self, seconds: float) -> None:
+        now = time.monotonic()
+        self._average = self._decayed(now) * (1 - self.alpha) + seconds * self.alpha
+        self._updated = now
+
+    @property
+    def seconds(self) -> float:
+        return self._decayed(time.monotonic())
+
+
+# Checkout waits across all pools
+pool_wait = PoolWaitTracker()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        name = getattr(self, "logging_name", None) or "primary"
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_TIMEOUTS.inc(pool=name)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            POOL_CHECKOUT_SECONDS.observe(elapsed, pool=name)
+            pool_wait.observe(elapsed)
+
+
+def _engine_options(url: str, name: str) -> Dict[str, Any]:
+    """Build `create_async_engine` keyword arguments from `Settings`."""
+    options: Dict[str, Any] = {
+        "echo": settings.DEBUG and settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    db_url = make_url(url)
+    # SQLite drivers use single-connection pools that take no sizing options.
+    if db_url.get_backend_name() != "sqlite":
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_logging_name=name,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    if db_url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+        }
+    return options
+
+
+def _instrument_engine(target: AsyncEngine, name: str) -> None:
+    """Count pool events for `target` under the `pool` label `name`."""
+    sync_engine = target.sync_engine
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        POOL_CHECKOUTS.inc(pool=name)
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        POOL_CONNECTS.inc(pool=name)
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        POOL_INVALIDATIONS.inc(pool=name)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_start
+        DB_QUERY_SECONDS.observe(elapsed, pool=name)
+        stats = request_stats.get()
+        if stats is not None:
+            stats.db_time += elapsed
+            stats.db_queries += 1
+
+
+def create_engine(url: str, name: str) -> AsyncEngine:
+    """Create an async engine configured and instrumented from `Settings`."""
+    new_engine = create_async_engine(url, **_engine_options(url, name))
+    _instrument_engine(new_engine, name)
+    engines[name] = new_engine
+    return new_engine
+
+
+async def warm_up_engines() -> None:
+    """
+    Open connections up front so the first requests don't pay for connecting.
+
+    Fills each pool with up to `DB_POOL_WARMUP` connections (capped at
+    `DB_POOL_SIZE`). Failures are logged, not raised, so the app still starts
+    and readiness checks can report the database as down.
+    """
+
+    async def ping(target: AsyncEngine) -> None:
+        async with target.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    get_engine()
+    get_replicas()
+    for name, target in list(engines.items()):
+        size = min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE)
+        if not isinstance(target.sync_engine.pool, QueuePool):
+            size = 1
+        results = await asyncio.gather(
+            *(ping(target) for _ in range(max(size, 1))), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            logger.warning("Could not warm up %s pool: %s", name, errors[0])
+
+
+async def dispose_engines() -> None:
+    """Close every pooled connection, e.g. on shutdown."""
+    await asyncio.gather(*(target.dispose() for target in engines.values()))
+
+
+def pool_status() -> Dict[str, Dict[str, int]]:
+    """Snapshot of every engine's pool: size, checked out, idle and overflow."""
+    status = {}
+    for name, each in engines.items():
+        pool = each.sync_engine.pool
+        if isinstance(pool, QueuePool):
+            status[name] = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            }
+    return status
+
+
+def _collect_pool_gauges() -> None:
+    for name, stats in pool_status().items():
+        POOL_CHECKED_OUT.set(stats["checked_out"], pool=name)
+        POOL_IDLE.set(stats["idle"], pool=name)
+        POOL_OVERFLOW.set(stats["overflow"], pool=name)
+
+
+REGISTRY.add_collector(_collect_pool_gauges)
+
+
+# Async engine for PostgreSQL, created on first use
+@lru_cache
+def get_engine() -> AsyncEngine:
+    return create_engine(settings.DATABASE_URL, "primary")
+
+
+# -----------------------------------------------------------------------------
+# 📚 Read Replicas
+# -----------------------------------------------------------------------------
+# Seconds the replica has been replaying behind the primary; 0 when fully caught up.
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class ReplicaSet:
+    """
+    Read replica engines with round-robin or least-connections selection.
+
+    A background health check ejects replicas that are unreachable or lag more
+    than `DB_REPLICA_MAX_LAG_SECONDS` behind the primary, and restores them once
+    they catch up. With no healthy replica, reads fall back to the primary.
+    """
+
+    def __init__(self, replicas: List[AsyncEngine], strategy: str = "round_robin"):
+        self.replicas = replicas
+        self.strategy = strategy
+        self.healthy = list(replicas)
+        self._counter = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    def choose(self) -> Optional[AsyncEngine]:
+        healthy = self.healthy
+        if not healthy:
+            return None
+        if self.strategy == "least_connections":
+            return min(
+                healthy, key=lambda e: getattr(e.sync_engine.pool, "checkedout", int)()
+            )
+        return healthy[next(self._counter) % len(healthy)]
+
+    async def _replica_lag(self, replica: AsyncEngine) -> float:
+        async with replica.connect() as conn:
+            if replica.dialect.name != "postgresql":
+                await conn.execute(text("SELECT 1"))
+                return 0.0
+            return float((await conn.execute(REPLICA_LAG_SQL)).scalar_one())
+
+    async def check_health(self) -> None:
+        """Probe every replica once and rebuild the healthy list."""
+        healthy = []
+        for replica in self.replicas:
+            name = replica.sync_engine.pool.logging_name or str(replica.url)
+            try:
+                lag = await asyncio.wait_for(
+                    self._replica_lag(replica),
+                    timeout=settings.DB_REPLICA_HEALTH_INTERVAL,
+                )
+            except Exception as exp:
+                logger.warning("Replica %s failed its health check: %s", name, exp)
+                continue
+            if lag > settings.DB_REPLICA_MAX_LAG_SECONDS:
+                logger.warning(
+                    "Replica %s is %.1fs behind the primary, ejecting it", name, lag
+                )
+                continue
+            healthy.append(replica)
+        self.healthy = healthy
+
+    async def _run_health_checks(self) -> None:
+        while True:
+            await self.check_health()
+            await asyncio.sleep(settings.DB_REPLICA_HEALTH_INTERVAL)
+
+    def start(self) -> None:
+        if self.replicas and self._task is None:
+            self._task = asyncio.create_task(self._run_health_checks())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+@lru_cache
+def get_replicas() -> ReplicaSet:
+    return ReplicaSet(
+        [
+            create_engine(url, f"replica-{index}")
+            for index, url in enumerate(settings.get_database_read_urls)
+        ],
+        strategy=settings.DB_REPLICA_STRATEGY,
+    )
+
+
+# Session.info key marking that the current transaction must stay on the primary
+USE_PRIMARY = "use_primary"
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to a read replica and everything else to
+    the primary.
+
+    Once a transaction flushes or executes a write, every later statement in it
+    stays on the primary so it reads its own writes. Call `use_primary(session)`
+    to pin a transaction to the primary up front.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if (
+            self.info.get(USE_PRIMARY)
+            or self._flushing
+            or not isinstance(clause, Select)
+            or clause._for_update_arg is not None
+        ):
+            if clause is not None and not isinstance(clause, Select):
+                self.info[USE_PRIMARY] = True
+            return get_engine().sync_engine
+        replica = get_replicas().choose()
+        return (replica or get_engine()).sync_engine
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_after_flush(session, flush_context):
+    session.info[USE_PRIMARY] = True
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _unpin_after_transaction(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(USE_PRIMARY, None)
+
+
+def use_primary(session: AsyncSession) -> AsyncSession:
+    """Keep the rest of the session's current transaction on the primary."""
+    session.info[USE_PRIMARY] = True
+    return session
 
-# Async engine for PostgreSQL
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
 
 # Session factory
-async_session = async_sessionmaker(bind=engine, expire_on_commit=False)
+@lru_cache
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=get_engine(), expire_on_commit=False)
+
+
+# Session factory routing reads to replicas
+@lru_cache
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=get_engine(), sync_session_class=RoutingSession, expire_on_commit=False
+    )
+
+
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "replicas": get_replicas,
+    "async_session": get_session_factory,
+    "read_session": get_read_session_factory,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Keep `engine`, `replicas`, `async_session` and `read_session` importable,
+    but only build them when first accessed (PEP 562)."""
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Base class for all models
 Base = declarative_base()
 
+
 # Dependency for FastAPI
 async def get_db() -> AsyncGenerator[AsyncSession, Any]:
-    async with async_session() as session:
-        yield session
\ No newline at end of file
+    async with get_session_factory()() as session:
+        yield session
+
+
+# Dependency for read-mostly endpoints; writes still go to the primary
+async def get_read_db() -> AsyncGenerator[AsyncSession, Any]:
+    async with get_read_session_factory()() as session:
+        yield session
@@ -0,0 +1,274 @@
+import asyncio
+import copy
+import hashlib
+import json
+import time
+import urllib.request
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import ExpiredSignatureError, JWTError, jwt
+
+from src.app.config import settings
+from src.core.common.exceptions import (
+    ExpiredTokenException,
+    ForbiddenApiException,
+    UnauthorizedApiException,
+)
+from src.core.logger import logger
+
+Claims = Dict[str, Any]
+Key = Union[str, Dict[str, Any]]
+
+_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+
+# -----------------------------------------------------------------------------
+# 🗝️ Signing Keys
+# -----------------------------------------------------------------------------
+class KeyStore:
+    """
+    Verification keys from a JWKS URL, a local JWKS / PEM file, or a shared
+    secret, cached in memory.
+
+    Keys are loaded on first use. With a URL or a file, `start()` refreshes
+    them every `refresh_interval` seconds in the background (a rotated file
+    is picked up without a restart); a token signed with an
+    unknown `kid` (key rotation) also triggers a refresh, at most once per
+    `min_refresh_interval` seconds. A failed refresh keeps the previous keys.
+    """
+
+    def __init__(
+        self,
+        url: str = "",
+        path: str = "",
+        secret: str = "",
+        refresh_interval: float = 300.0,
+        min_refresh_interval: float = 30.0,
+    ):
+        self.url = url
+        self.path = path
+        self.secret = secret
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.keys: Dict[Optional[str], Key] = {}
+        self._loaded_at = float("-inf")
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _parse(raw: str) -> Dict[Optional[str], Key]:
+        """JWKS JSON -> keys by `kid`; a PEM key is stored under `None`."""
+        if raw.lstrip().startswith("{"):
+            document = json.loads(raw)
+            jwks = document.get("keys", [document])
+            return {jwk.get("kid"): jwk for jwk in jwks}
+        return {None: raw}
+
+    def _read(self) -> str:
+        if self.url:
+            with urllib.request.urlopen(self.url, timeout=10) as response:
+                return response.read().decode()
+        return Path(self.path).read_text()
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            if time.monotonic() - self._loaded_at < self.min_refresh_interval:
+                return
+            try:
+                # Blocking I/O (file or HTTP) stays off the event loop
+                keys = self._parse(await asyncio.to_thread(self._read))
+            except Exception as exp:
+                logger.warning("Could not load JWT signing keys: %s", exp)
+                return
+            finally:
+                self._loaded_at = time.monotonic()
+            self.keys = keys
+
+    async def get(self, kid: Optional[str]) -> Optional[Key]:
+        if self.secret:
+            return self.secret
+        if kid not in self.keys:
+            await self.refresh()
+        if kid in self.keys:
+            return self.keys[kid]
+        # A single key without `kid` (e.g. a PEM file) verifies every token
+        return next(iter(self.keys.values())) if len(self.keys) == 1 else None
+
+    async def _run_refresh(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    def start(self) -> None:
+        if (self.url or self.path) and not self.secret and self._task is None:
+            self._task = asyncio.create_task(self._run_refresh())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# -----------------------------------------------------------------------------
+# 🗃️ Verified Token Cache
+# -----------------------------------------------------------------------------
+class TokenCache:
+    """
+    LRU of decoded claims keyed by the SHA-256 of the token.
+
+    An entry lives at most `ttl` seconds and never past the token's `exp`,
+    so a cached token can never outlive its validity. Claims are copied in and
+    out, so a request mutating its claims cannot leak into later requests.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Claims]]" = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Claims]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, claims = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(claims)
+
+    def set(self, token: str, claims: Claims) -> None:
+        expires_at = time.time() + self.ttl
+        if isinstance(claims.get("exp"), (int, float)):
+            expires_at = min(expires_at, claims["exp"])
+        key = self._key(token)
+        self._entries[key] = (expires_at, copy.deepcopy(claims))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+key_store = KeyStore(
+    url=settings.JWT_JWKS_URL,
+    path=settings.JWT_JWKS_FILE,
+    secret=settings.JWT_SECRET_KEY,
+    refresh_interval=settings.JWT_JWKS_REFRESH_INTERVAL,
+)
+token_cache = TokenCache(
+    max_entries=settings.JWT_CACHE_MAX_ENTRIES, ttl=settings.JWT_CACHE_TTL
+)
+
+
+# -----------------------------------------------------------------------------
+# 🔐 Verification
+# -----------------------------------------------------------------------------
+async def verify_token(
+    token: str, keys: KeyStore = key_store, cache: TokenCache = token_cache
+) -> Claims:
+    """
+    Verify a JWT and return its claims, from `cache` when it was verified before.
+
+    Raises:
+        ExpiredTokenException: If the token has expired.
+        UnauthorizedApiException: If the token is malformed, signed with an
+            unknown key, or fails signature / audience / issuer checks.
+    """
+    claims = cache.get(token)
+    if claims is not None:
+        return claims
+
+    try:
+        header = jwt.get_unverified_header(token)
+    except JWTError:
+        raise UnauthorizedApiException("Malformed bearer token.", headers=_CHALLENGE)
+    key = await keys.get(header.get("kid"))
+    if key is None:
+        raise UnauthorizedApiException(
+            "Token signed with an unknown key.", headers=_CHALLENGE
+        )
+
+    try:
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=settings.get_jwt_algorithms,
+            audience=settings.JWT_AUDIENCE or None,
+            issuer=settings.JWT_ISSUER or None,
+            options={
+                "verify_aud": bool(settings.JWT_AUDIENCE),
+                "leeway": settings.JWT_LEEWAY,
+            },
+        )
+    except ExpiredSignatureError:
+        raise ExpiredTokenException("Token has expired.", headers=_CHALLENGE)
+    except JWTError as exp:
+        raise UnauthorizedApiException(
+            f"Invalid bearer token: {exp}", headers=_CHALLENGE
+        )
+
+    cache.set(token, claims)
+    return claims
+
+
+class BearerAuth:
+    """
+    Dependency that authenticates `Authorization: Bearer <JWT>` and returns
+    the token's claims.
+
+    Verified tokens are cached (see `TokenCache`), so repeat requests with the
+    same token skip signature verification. Pass `scopes` to also require
+    them in the token's `scope` (space separated) or `scp` claim.
+
+        @router.get("/me")
+        async def me(claims: dict = Depends(BearerAuth())):
+            return {"sub": claims["sub"]}
+
+    Raises:
+        UnauthorizedApiException: Missing or invalid token.
+        ExpiredTokenException: Expired token.
+        ForbiddenApiException: Valid token without the required scopes.
+    """
+
+    def __init__(self, scopes: Iterable[str] = ()):
+        self.scopes = set(scopes)
+
+    @staticmethod
+    def _granted(claims: Claims) -> set:
+        granted = claims.get("scope") or claims.get("scp") or []
+        return set(granted.split() if isinstance(granted, str) else granted)
+
+    async def __call__(
+        self,
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(
+            HTTPBearer(auto_error=False)
+        ),
+    ) -> Claims:
+        if credentials is None or credentials.scheme.lower() != "bearer":
+            raise UnauthorizedApiException("Missing bearer token.", headers=_CHALLENGE)
+        claims = await verify_token(credentials.credentials)
+        missing = self.scopes - self._granted(claims)
+        if missing:
+            raise ForbiddenApiException(
+                f"Missing scopes: {', '.join(sorted(missing))}."
+            )
+        return claims
+
+
+# Claims of the authenticated caller, for routes that need no particular scope
+get_current_claims = BearerAuth()
@@ -0,0 +1,71 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response, status
+
+from src.app.middleware.etag import NOT_MODIFIED_HEADERS, http_date, is_not_modified
+
+
+def weak_etag(*parts: Any) -> str:
+    """Weak ETag from cheap version markers, e.g. a row count and max `updated_at`."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def rows_etag(rows: Iterable[Any]) -> str:
+    """Weak ETag over the `(id, updated_at)` pairs of `TimestampModel` rows."""
+    return weak_etag(*((row.id, row.updated_at) for row in rows))
+
+
+def latest_update(rows: Iterable[Any]) -> Optional[datetime]:
+    """Most recent `updated_at` of `TimestampModel` rows, for `Last-Modified`."""
+    return max(
+        (row.updated_at for row in rows if row.updated_at is not None), default=None
+    )
+
+
+class ConditionalRequest:
+    """
+    Conditional GET support for routes.
+
+    Lets a route compare validators before building its response, so a
+    matching `If-None-Match` / `If-Modified-Since` skips serialization
+    altogether:
+
+        @router.get("/items")
+        async def list_items(conditional: ConditionalRequest = Depends(), ...):
+            rows = ...
+            not_modified = conditional.evaluate(rows_etag(rows), latest_update(rows))
+            if not_modified:
+                return not_modified
+            return rows
+
+    The validators are also set on the regular response.
+    """
+
+    def __init__(self, request: Request, response: Response):
+        self.request = request
+        self.response = response
+
+    def evaluate(
+        self, etag: Optional[str] = None, last_modified: Optional[datetime] = None
+    ) -> Optional[Response]:
+        """
+        Return a `304 Not Modified` response if the client's copy is current,
+        otherwise record the validators on the outgoing response and return None.
+        """
+        if etag is not None:
+            self.response.headers["ETag"] = etag
+        if last_modified is not None:
+            self.response.headers["Last-Modified"] = http_date(last_modified)
+
+        if self.request.method not in ("GET", "HEAD"):
+            return None
+        if not is_not_modified(self.request.headers, etag, last_modified):
+            return None
+
+        headers = {
+            k: v for k, v in self.response.headers.items() if k in NOT_MODIFIED_HEADERS
+        }
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
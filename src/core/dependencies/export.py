@@ -0,0 +1,15 @@
+from fastapi import Query, Request
+
+from src.core.export import ExportFormat
+
+
+class ExportParams:
+    def __init__(
+        self,
+        request: Request,
+        format: ExportFormat = Query(
+            ExportFormat.NDJSON, description="Export file format"
+        ),
+    ):
+        self.format = format
+        self.accept_encoding = request.headers.get("accept-encoding", "")
@@ -1,4 +1,20 @@
+import base64
+import hashlib
+import hmac
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
 from fastapi import Query
+from sqlalchemy import Select, tuple_
+
+from src.app.config import settings
+from src.core.common.exceptions import BadRequestApiException
+from src.models.schemas.common.response import CursorPaginatedResponse
+
+T = TypeVar("T")
 
 
 class PaginationParams:
@@ -9,3 +25,160 @@ class PaginationParams:
     ):
         self.limit = limit
         self.offset = offset
+
+
+class CursorPaginationParams:
+    """
+    Keyset pagination parameters.
+
+    Unlike `PaginationParams`, the position in the result set is carried by an
+    opaque, signed cursor instead of an offset, so every page costs the same
+    index range scan regardless of how deep the client has paged.
+    """
+
+    def __init__(
+        self,
+        limit: int = Query(10, ge=1, le=100, description="Number of items per page"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor returned as `next_cursor` by the previous page",
+        ),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+        self.after: Optional[Tuple[Any, ...]] = (
+            decode_cursor(cursor) if cursor else None
+        )
+
+
+# -----------------------------------------------------------------------------
+# 🔐 Cursor Encoding
+# -----------------------------------------------------------------------------
+_SIGNATURE_SIZE = 16
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    key = settings.CURSOR_SECRET_KEY.encode()
+    return hmac.new(key, payload, hashlib.sha256).digest()[:_SIGNATURE_SIZE]
+
+
+def _dump_value(value: Any) -> List[Any]:
+    """Tag a key value with its type so it round-trips through JSON unchanged."""
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, UUID):
+        return ["u", str(value)]
+    if isinstance(value, Decimal):
+        return ["n", str(value)]
+    return ["v", value]
+
+
+def _load_value(tagged: List[Any]) -> Any:
+    tag, value = tagged
+    if tag == "dt":
+        return datetime.fromisoformat(value)
+    if tag == "d":
+        return date.fromisoformat(value)
+    if tag == "u":
+        return UUID(value)
+    if tag == "n":
+        return Decimal(value)
+    if tag == "v":
+        return value
+    raise ValueError(f"Unknown cursor value tag: {tag}")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the key values of the last row of a page into a signed cursor."""
+    payload = json.dumps(
+        [_dump_value(v) for v in values], separators=(",", ":")
+    ).encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, ...]:
+    """
+    Decode and verify a cursor produced by `encode_cursor`.
+
+    Raises:
+        BadRequestApiException: If the cursor is malformed or has been tampered with.
+    """
+    try:
+        encoded_payload, encoded_signature = cursor.split(".", 1)
+        payload = _b64decode(encoded_payload)
+        if not hmac.compare_digest(_sign(payload), _b64decode(encoded_signature)):
+            raise ValueError("Cursor signature mismatch")
+        return tuple(_load_value(v) for v in json.loads(payload))
+    except (ValueError, TypeError):
+        raise BadRequestApiException("Invalid pagination cursor.")
+
+
+# -----------------------------------------------------------------------------
+# 🔑 Keyset Helpers
+# -----------------------------------------------------------------------------
+def apply_keyset(
+    stmt: Select,
+    key_columns: Sequence[Any],
+    params: CursorPaginationParams,
+    descending: bool = True,
+) -> Select:
+    """
+    Apply keyset ordering, the "after cursor" predicate and the page limit to `stmt`.
+
+    The key columns must be unique together, e.g. `(Model.created_at, Model.id)`,
+    and should be covered by a composite index in the same order. One extra row
+    is fetched so `build_cursor_page` can tell whether another page exists.
+
+    Args:
+        stmt (Select): The base query, with any filters already applied.
+        key_columns (Sequence): Columns forming the stable sort key.
+        params (CursorPaginationParams): The resolved pagination dependency.
+        descending (bool): Newest first when True (the default).
+
+    Returns:
+        Select: The paginated query.
+    """
+    if params.after is not None:
+        if len(params.after) != len(key_columns):
+            raise BadRequestApiException("Invalid pagination cursor.")
+        row_key = tuple_(*key_columns)
+        after = tuple_(*params.after)
+        stmt = stmt.where(row_key < after if descending else row_key > after)
+
+    order_by = [c.desc() if descending else c.asc() for c in key_columns]
+    return stmt.order_by(*order_by).limit(params.limit + 1)
+
+
+def build_cursor_page(
+    rows: Sequence[T],
+    params: CursorPaginationParams,
+    key: Callable[[T], Sequence[Any]],
+) -> CursorPaginatedResponse[T]:
+    """
+    Build a `CursorPaginatedResponse` from rows fetched with `apply_keyset`.
+
+    Args:
+        rows (Sequence): Result rows, at most `params.limit + 1` of them.
+        params (CursorPaginationParams): The resolved pagination dependency.
+        key (Callable): Returns the key values of a row, in `key_columns` order,
+            e.g. `lambda row: (row.created_at, row.id)`.
+    """
+    has_more = len(rows) > params.limit
+    page = list(rows[: params.limit])
+    next_cursor = encode_cursor(key(page[-1])) if has_more and page else None
+    return CursorPaginatedResponse(
+        limit=params.limit,
+        next_cursor=next_cursor,
+        has_more=has_more,
+        data=page,
+    )
@@ -0,0 +1,155 @@
+import csv
+import io
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Type, Union
+
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.responses import StreamingResponse
+
+from src.app.config import settings
+from src.core.compression import negotiate
+from src.core.db import get_read_session_factory
+from src.core.responses import dumps
+from src.models.base import BaseModel
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _columns(model: Type[BaseModel]) -> List[str]:
+    return [attr.key for attr in inspect(model).column_attrs]
+
+
+def _row_to_dict(row: Any) -> Dict[str, Any]:
+    """Turn a result row (columns or a single ORM entity) into a plain dict."""
+    if len(row) == 1 and isinstance(row[0], BaseModel):
+        entity = row[0]
+        return {key: getattr(entity, key) for key in _columns(type(entity))}
+    return dict(row._mapping)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class _CSVEncoder:
+    """Encodes dict rows to CSV, writing the header before the first row."""
+
+    def __init__(self):
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+        self.fields: Optional[List[str]] = None
+
+    def __call__(self, record: Dict[str, Any]) -> bytes:
+        if self.fields is None:
+            self.fields = list(record)
+            self.writer.writerow(self.fields)
+        self.writer.writerow([_csv_value(record[f]) for f in self.fields])
+        data = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return data.encode("utf-8")
+
+
+async def stream_rows(
+    stmt: Select,
+    fmt: ExportFormat,
+    session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Stream the rows of `stmt` as encoded (and optionally gzipped) chunks.
+
+    Rows are fetched `EXPORT_CHUNK_SIZE` at a time through a server-side cursor
+    and written into buffers of about `EXPORT_BUFFER_BYTES`, so memory stays
+    flat no matter how many rows are exported. The generator only advances as
+    the client reads, which gives natural backpressure.
+
+    The session is opened here rather than taken from `get_db`, because
+    dependencies are closed before a streaming body is sent.
+    """
+    encode = _CSVEncoder() if fmt is ExportFormat.CSV else (lambda r: dumps(r) + b"\n")
+    compressor = (
+        zlib.compressobj(settings.EXPORT_GZIP_LEVEL, wbits=31) if compress else None
+    )
+    buffer = bytearray()
+
+    def drain() -> bytes:
+        data = bytes(buffer)
+        buffer.clear()
+        return compressor.compress(data) if compressor else data
+
+    session_factory = session_factory or get_read_session_factory()
+    async with session_factory() as session:
+        result = await session.stream(
+            stmt.execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+        )
+        async for partition in result.partitions():
+            for row in partition:
+                buffer += encode(_row_to_dict(row))
+            if len(buffer) >= settings.EXPORT_BUFFER_BYTES:
+                chunk = drain()
+                if chunk:
+                    yield chunk
+
+    tail = drain()
+    if compressor:
+        tail += compressor.flush()
+    if tail:
+        yield tail
+
+
+def export_response(
+    source: Union[Type[BaseModel], Select],
+    fmt: ExportFormat = ExportFormat.NDJSON,
+    filename: Optional[str] = None,
+    accept_encoding: str = "",
+    session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+) -> StreamingResponse:
+    """
+    Build a `StreamingResponse` exporting a whole `BaseModel` table or a `select()`.
+
+    Args:
+        source: A `BaseModel` subclass (all of its columns are exported) or a
+            `select()` of columns or of a single entity.
+        fmt (ExportFormat): NDJSON or CSV.
+        filename (str): Download name; defaults to the table name.
+        accept_encoding (str): The request's `Accept-Encoding`; gzip is applied
+            when it allows it, honoring q-values (`gzip;q=0` turns it off).
+        session_factory: Sessions to read with; replicas by default.
+    """
+    if isinstance(source, Select):
+        stmt = source
+        filename = filename or "export"
+    else:
+        stmt = select(*(getattr(source, key) for key in _columns(source)))
+        filename = filename or source.__tablename__
+
+    compress = negotiate(accept_encoding, ["gzip"]) == "gzip"
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{fmt.value}"',
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        stream_rows(stmt, fmt, session_factory, compress),
+        media_type=MEDIA_TYPES[fmt],
+        headers=headers,
+    )
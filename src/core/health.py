@@ -0,0 +1,205 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import text
+
+from src.app.config import settings
+from src.core.db import get_engine, get_replicas, pool_status, pool_wait
+from src.core.logger import logger
+
+
+class ProbeResult(BaseModel):
+    healthy: bool
+    latency_ms: float
+    critical: bool = True
+    detail: Dict[str, Any] = {}
+    error: Optional[str] = None
+
+
+class HealthReport(BaseModel):
+    status: str
+    checked_at: float
+    probes: Dict[str, ProbeResult]
+
+    @property
+    def healthy(self) -> bool:
+        return self.status == "ok"
+
+
+# A probe returns details for the report and raises when the dependency is unhealthy
+ProbeFn = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class ProbeFailed(Exception):
+    """Raised by a probe whose dependency responds, but is not fit to serve."""
+
+    def __init__(self, message: str, detail: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.detail = detail or {}
+
+
+# -----------------------------------------------------------------------------
+# ⏱️ Event Loop Lag
+# -----------------------------------------------------------------------------
+class LoopLagMonitor:
+    """
+    Background task measuring how late the event loop wakes up a sleeper.
+
+    A busy or blocked loop delays every request; the readiness probe reads
+    the worst lag seen in the last few ticks.
+    """
+
+    def __init__(self, interval: float = 0.1, window: int = 10):
+        self.interval = interval
+        self.window = window
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def lag(self) -> float:
+        return max(self.samples, default=0.0)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(loop.time() - expected, 0.0))
+            del self.samples[: -self.window]
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+loop_lag = LoopLagMonitor()
+
+
+# -----------------------------------------------------------------------------
+# 🩺 Probes
+# -----------------------------------------------------------------------------
+async def probe_database() -> Dict[str, Any]:
+    """`SELECT 1` on the primary, through the pool."""
+    async with get_engine().connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return {}
+
+
+async def probe_pool() -> Dict[str, Any]:
+    """Fails when connections have recently been waited for too long."""
+    detail = {
+        "pools": pool_status(),
+        "avg_checkout_wait_ms": round(pool_wait.seconds * 1000, 2),
+    }
+    if pool_wait.seconds > settings.HEALTH_MAX_POOL_WAIT:
+        raise ProbeFailed("Connection pool saturated", detail)
+    return detail
+
+
+async def probe_event_loop() -> Dict[str, Any]:
+    detail = {"lag_ms": round(loop_lag.lag * 1000, 2)}
+    if loop_lag.lag > settings.HEALTH_MAX_LOOP_LAG:
+        raise ProbeFailed("Event loop lagging", detail)
+    return detail
+
+
+async def probe_replicas() -> Dict[str, Any]:
+    """Replica health as last seen by the replica health check; no extra queries."""
+    replicas = get_replicas()
+    detail = {"healthy": len(replicas.healthy), "total": len(replicas.replicas)}
+    if replicas.replicas and not replicas.healthy:
+        raise ProbeFailed("No healthy read replica, reads use the primary", detail)
+    return detail
+
+
+# -----------------------------------------------------------------------------
+# ✅ Health Checker
+# -----------------------------------------------------------------------------
+class HealthChecker:
+    """
+    Runs all probes concurrently, each under `timeout` seconds, and caches the
+    report for `ttl` seconds.
+
+    Concurrent callers during a check share it, so however often the
+    orchestrator polls, the dependencies see at most one round per `ttl`.
+    Failing non-critical probes are reported but keep the status "ok".
+    """
+
+    def __init__(self, ttl: float, timeout: float):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.probes: Dict[str, Tuple[ProbeFn, bool]] = {}
+        self._report: Optional[HealthReport] = None
+        self._expires_at = 0.0
+        self._inflight: Optional[asyncio.Future] = None
+
+    def register(self, name: str, probe: ProbeFn, critical: bool = True) -> None:
+        self.probes[name] = (probe, critical)
+
+    async def _run(self, probe: ProbeFn, critical: bool) -> ProbeResult:
+        start = time.perf_counter()
+        detail: Dict[str, Any] = {}
+        error = None
+        try:
+            detail = await asyncio.wait_for(probe(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            error = f"Timed out after {self.timeout}s"
+        except ProbeFailed as exp:
+            error, detail = str(exp), exp.detail
+        except Exception as exp:
+            error = f"{exp.__class__.__name__}: {exp}"
+        return ProbeResult(
+            healthy=error is None,
+            latency_ms=round((time.perf_counter() - start) * 1000, 2),
+            critical=critical,
+            detail=detail,
+            error=error,
+        )
+
+    async def _check(self) -> HealthReport:
+        names = list(self.probes)
+        results = await asyncio.gather(
+            *(self._run(*self.probes[name]) for name in names)
+        )
+        probes = dict(zip(names, results))
+        failed = [name for name, r in probes.items() if not r.healthy and r.critical]
+        if failed:
+            logger.warning("Readiness check failed: %s", ", ".join(failed))
+        return HealthReport(
+            status="unavailable" if failed else "ok",
+            checked_at=time.time(),
+            probes=probes,
+        )
+
+    async def check(self) -> HealthReport:
+        if self._report is not None and time.monotonic() < self._expires_at:
+            return self._report
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._check())
+            try:
+                self._report = await asyncio.shield(self._inflight)
+                self._expires_at = time.monotonic() + self.ttl
+            finally:
+                self._inflight = None
+            return self._report
+        return await asyncio.shield(self._inflight)
+
+
+health_checker = HealthChecker(
+    ttl=settings.HEALTH_CACHE_TTL, timeout=settings.HEALTH_PROBE_TIMEOUT
+)
+health_checker.register("database", probe_database)
+health_checker.register("pool", probe_pool)
+health_checker.register("event_loop", probe_event_loop)
+health_checker.register("replicas", probe_replicas, critical=False)
@@ -0,0 +1,242 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from fastapi import Depends, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, RelationshipProperty
+
+from src.app.config import settings
+from src.core.db import get_db
+from src.models.base import BaseModel
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Scope key under which a parent request (e.g. `/batch`) hands its `Loaders`
+# to in-process sub-requests, so their loads share batches and cache. The
+# shared `Loaders` reads through the parent's own session, not the sub-request's
+# `get_db` session: rows it returns are not in that session's identity map
+SHARED_LOADERS = "shared_loaders"
+
+BatchFn = Callable[[List[K]], Awaitable[Mapping[K, V]]]
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Coalesces `load(key)` calls made in the same event-loop tick into one
+    `batch_fn(keys)` call, and memoizes each key's result.
+
+    `batch_fn` receives unique keys and returns a mapping; keys it leaves out
+    resolve to `default`. Results are cached for the loader's lifetime, which
+    for `Loaders` is one request.
+
+    Example:
+        users = DataLoader(fetch_users_by_id)
+        a, b = await asyncio.gather(users.load(1), users.load(2))  # one query
+    """
+
+    def __init__(self, batch_fn: BatchFn, default: Any = None, max_batch_size: int = 0):
+        self.batch_fn = batch_fn
+        self.default = default
+        self.max_batch_size = max_batch_size
+        self._cache: Dict[K, "asyncio.Future[V]"] = {}
+        self._queue: List[Tuple[K, "asyncio.Future[V]"]] = []
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def load(self, key: K) -> "asyncio.Future[V]":
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        self._queue.append((key, future))
+        if len(self._queue) == 1:
+            # Runs after every task already scheduled for this tick has queued its keys
+            loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> List[V]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Cache a value obtained elsewhere, unless the key is already loaded."""
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: Optional[K] = None) -> None:
+        """Forget one key, or everything, e.g. after a write."""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        size = self.max_batch_size or len(queue)
+        for start in range(0, len(queue), size):
+            # Referenced until done, so a running batch cannot be garbage-collected
+            task = asyncio.ensure_future(self._resolve(queue[start : start + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: List[Tuple[K, "asyncio.Future[V]"]]) -> None:
+        results: Optional[Mapping[K, V]] = None
+        error: Optional[Exception] = None
+        try:
+            results = await self.batch_fn([key for key, _ in batch])
+        except Exception as exc:
+            error = exc
+        finally:
+            # Also on cancellation: no future may stay pending, or its key would hang
+            for key, future in batch:
+                if future.done():
+                    continue
+                if results is not None:
+                    future.set_result(results.get(key, self.default))
+                    continue
+                # Failed keys are retried on the next load instead of caching the error
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.cancel()
+
+
+class Loaders:
+    """
+    Request-scoped registry of `DataLoader`s backed by one `AsyncSession`.
+
+    Loaders are created on first use and keyed by model and column, so all
+    resolvers of a request share batches and cache. Batched queries take a
+    lock, since an `AsyncSession` cannot run two statements at once.
+    Soft-deleted rows are never returned.
+
+    Example:
+        @router.get("/orders")
+        async def list_orders(loaders: Loaders = Depends(get_loaders)):
+            orders = ...
+            customers = await loaders.by_id(Customer).load_many(o.customer_id for o in orders)
+            lines = await loaders.by_column(OrderLine, "order_id").load_many(o.id for o in orders)
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._lock = asyncio.Lock()
+        self._loaders: Dict[Tuple[Any, ...], DataLoader] = {}
+
+    def _loader(
+        self, key: Tuple[Any, ...], batch_fn: BatchFn, default: Any
+    ) -> DataLoader:
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = DataLoader(batch_fn, default, settings.DB_BULK_CHUNK_SIZE)
+            self._loaders[key] = loader
+        return loader
+
+    async def _fetch(
+        self, model: Type[ModelT], column: Any, keys: List[Any]
+    ) -> List[ModelT]:
+        stmt = select(model).where(column.in_(keys))
+        async with self._lock:
+            return list((await self.session.scalars(stmt)).all())
+
+    def by_id(self, model: Type[ModelT]) -> DataLoader[Any, Optional[ModelT]]:
+        """Loads single rows by primary key; unknown keys resolve to None."""
+
+        async def batch(keys: List[Any]) -> Dict[Any, ModelT]:
+            return {row.id: row for row in await self._fetch(model, model.id, keys)}
+
+        return self._loader((model, "id"), batch, None)
+
+    def by_column(
+        self, model: Type[ModelT], column: str
+    ) -> DataLoader[Any, List[ModelT]]:
+        """
+        Loads all rows whose `column` equals the key, e.g. the children of a
+        one-to-many relationship by foreign key; keys without rows resolve to [].
+        """
+        attribute = getattr(model, column)
+
+        async def batch(keys: List[Any]) -> Dict[Any, List[ModelT]]:
+            grouped: Dict[Any, List[ModelT]] = {key: [] for key in keys}
+            for row in await self._fetch(model, attribute, keys):
+                grouped[getattr(row, column)].append(row)
+            return grouped
+
+        return self._loader((model, column), batch, None)
+
+    def related(
+        self, relationship: InstrumentedAttribute
+    ) -> Callable[[BaseModel], Awaitable[Any]]:
+        """
+        Batched replacement for lazy loading a simple (single-column foreign
+        key) relationship, e.g. `loaders.related(Order.lines)(order)`.
+
+        Returns:
+            Callable: Takes a parent row and resolves to the related row
+            (many-to-one) or list of rows (one-to-many).
+        """
+        prop = relationship.property
+        if (
+            not isinstance(prop, RelationshipProperty)
+            or len(prop.local_remote_pairs) != 1
+        ):
+            raise ValueError(f"{relationship} is not a single-column relationship")
+        local, remote = prop.local_remote_pairs[0]
+        target = prop.mapper.class_
+        local_key = prop.parent.get_property_by_column(local).key
+        remote_key = prop.mapper.get_property_by_column(remote).key
+
+        if not prop.uselist and remote_key == "id":
+            by_id = self.by_id(target)
+
+            async def load_one(parent: BaseModel) -> Any:
+                return await by_id.load(getattr(parent, local_key))
+
+            return load_one
+
+        by_column = self.by_column(target, remote_key)
+
+        async def load_many(parent: BaseModel) -> Any:
+            rows = await by_column.load(getattr(parent, local_key))
+            if prop.uselist:
+                return rows
+            return rows[0] if rows else None
+
+        return load_many
+
+
+def get_loaders(request: Request, session: AsyncSession = Depends(get_db)) -> Loaders:
+    """
+    FastAPI dependency: `Loaders` sharing the request's `get_db` session, or
+    the parent request's `Loaders` when one is set under `SHARED_LOADERS`.
+
+    A shared `Loaders` uses a separate session, so a handler that also depends
+    on `get_db` must not mix the two: objects loaded here cannot be modified,
+    flushed or related to its own objects through its session, and they do not
+    see its uncommitted changes. Only safe (read-only) sub-requests share one.
+    """
+    shared = request.scope.get(SHARED_LOADERS)
+    return shared if shared is not None else Loaders(session)
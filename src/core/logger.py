@@ -1,18 +1,195 @@
+import atexit
+import json
 import logging
+import queue
+import random
 import sys
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Tuple
+
 from src.app.config import settings
 
-LOG_LEVEL = settings.LOG_LEVEL.upper()
-log_level = getattr(logging, LOG_LEVEL, logging.INFO)
+# Correlation ID of the request being handled, set by `RequestIdMiddleware`
+request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {
+    "message",
+    "asctime",
+    "request_id",
+}
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp records with the current request ID, before they are queued."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id.get()
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Sampling and per-message rate limiting for WARNING and above.
+
+    Records are keyed by logger name, message template and the class of the
+    logged exception, so one noisy call site cannot drown out others. A call
+    site logging several kinds of error with one template sets its own key
+    with `extra={"rate_limit_key": ...}`.
+
+    Each key has a token bucket refilled at `rate` records per second up to
+    `burst`; the number of records dropped is reported on the next one that
+    gets through.
+    """
+
+    def __init__(
+        self, sample_rate: float, rate: float, burst: int, max_keys: int = 1024
+    ):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        # key -> (tokens, last refill, suppressed count)
+        self._buckets: "OrderedDict[Tuple[str, str, str], Tuple[float, float, int]]" = (
+            OrderedDict()
+        )
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING:
+            return True
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False
+        if self.rate <= 0:
+            return True
+
+        kind = getattr(record, "rate_limit_key", None)
+        if kind is None and record.exc_info and record.exc_info[0] is not None:
+            kind = record.exc_info[0].__name__
+        key = (record.name, str(record.msg), str(kind or ""))
+        now = time.monotonic()
+        tokens, last, suppressed = self._buckets.pop(key, (float(self.burst), now, 0))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+            if suppressed:
+                record.suppressed = suppressed
+            suppressed = 0
+        else:
+            suppressed += 1
+
+        self._buckets[key] = (tokens, now, suppressed)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return allowed
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including `extra=` fields and the request ID."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            payload["request_id"] = record.request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The stock `QueueHandler.prepare` formats the message in the caller; here
+    the record is enqueued as-is, so `%`-style arguments are only rendered in
+    the background. When the queue is full the record is dropped instead of
+    blocking the event loop.
+    """
+
+    dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LazyQueueHandler.dropped += 1
+
+
+def _build_formatter() -> logging.Formatter:
+    if settings.LOG_FORMAT == "json":
+        return JsonFormatter()
+    return logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+    )
+
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging() -> None:
+    """
+    Route all logging through a bounded queue drained by a background thread,
+    which owns the only blocking handler (stdout).
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_build_formatter())
+
+    queue_handler = LazyQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(
+        RateLimitFilter(
+            sample_rate=settings.LOG_SAMPLE_RATE,
+            rate=settings.LOG_RATE_LIMIT,
+            burst=settings.LOG_RATE_LIMIT_BURST,
+        )
+    )
+
+    # Clear existing handlers (important for reload mode)
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(log_level)
+
+    _listener = QueueListener(
+        queue_handler.queue, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+
 
-# Clear existing handlers (important for reload mode)
-for handler in logging.root.handlers[:]:
-    logging.root.removeHandler(handler)
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
-logging.basicConfig(
-    level=log_level,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],  # ✅ Force log to terminal
-)
 
+# Handlers are installed by `setup_logging()` at startup (lifespan / launcher),
+# not on import, so importing the app stays cheap.
 logger = logging.getLogger(settings.LOGGER_NAME)
@@ -0,0 +1,365 @@
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union
+
+from fastapi import Request, Response
+from starlette.datastructures import Headers
+from starlette.types import Scope
+
+from src.app.config import settings
+from src.core.common.exceptions import TooManyRequestsApiException
+from src.core.logger import logger
+from src.core.metrics import REGISTRY
+
+RATE_LIMITED = REGISTRY.counter(
+    "rate_limit_rejections_total", "Requests rejected by a rate limiter.", ["limiter"]
+)
+RATE_LIMIT_ERRORS = REGISTRY.counter(
+    "rate_limit_backend_errors_total",
+    "Rate limit checks that failed open.",
+    ["limiter"],
+)
+
+TOKEN_BUCKET = "token_bucket"
+SLIDING_WINDOW = "sliding_window"
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    # Seconds until the limit is fully replenished / the window resets
+    reset: float
+    # Seconds the client should wait before retrying; 0 when allowed
+    retry_after: float
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """`RateLimit-*` headers (IETF draft), plus `Retry-After` when rejected."""
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(math.ceil(self.reset)),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(math.ceil(self.retry_after), 1))
+        return headers
+
+
+# -----------------------------------------------------------------------------
+# 🧮 Algorithms
+# -----------------------------------------------------------------------------
+# Both keep a fixed-size tuple per key, so memory is O(1) per client.
+State = Tuple[float, float, float]
+
+
+def token_bucket(
+    state: Optional[State], now: float, limit: int, period: float, cost: int = 1
+) -> Tuple[State, RateLimitResult]:
+    """
+    Bucket of `limit` tokens refilled continuously at `limit / period` per
+    second; bursts of up to `limit` requests are allowed.
+
+    State: (tokens, last refill time, unused).
+    """
+    tokens, last, _ = state or (float(limit), now, 0.0)
+    tokens = min(float(limit), tokens + (now - last) * limit / period)
+    allowed = tokens >= cost
+    if allowed:
+        tokens -= cost
+    return (tokens, now, 0.0), _bucket_result(allowed, tokens, limit, period, cost)
+
+
+def _bucket_result(
+    allowed: bool, tokens: float, limit: int, period: float, cost: int
+) -> RateLimitResult:
+    rate = limit / period
+    return RateLimitResult(
+        allowed=allowed,
+        limit=limit,
+        remaining=int(tokens),
+        reset=(limit - tokens) / rate,
+        retry_after=0.0 if allowed else (cost - tokens) / rate,
+    )
+
+
+def sliding_window(
+    state: Optional[State], now: float, limit: int, period: float, cost: int = 1
+) -> Tuple[State, RateLimitResult]:
+    """
+    Sliding window counter: the count of the current fixed window plus the
+    previous window's count weighted by how much of it still overlaps the
+    sliding window. Smooths the burst at fixed window boundaries.
+
+    State: (current window start, current count, previous count).
+    """
+    window = math.floor(now / period) * period
+    start, current, previous = state or (window, 0.0, 0.0)
+    if window != start:
+        previous = current if window - start == period else 0.0
+        current = 0.0
+        start = window
+
+    estimated = previous * (1 - (now - start) / period) + current
+    allowed = estimated + cost <= limit
+    if allowed:
+        current += cost
+        estimated += cost
+        retry_after = 0.0
+    elif previous and limit - current - cost >= 0:
+        # Wait until enough of the previous window has slid out
+        retry_after = start + period * (1 - (limit - current - cost) / previous) - now
+    else:
+        retry_after = start + period - now
+    result = RateLimitResult(
+        allowed=allowed,
+        limit=limit,
+        remaining=max(int(limit - estimated), 0),
+        reset=start + period - now,
+        retry_after=max(retry_after, 0.0),
+    )
+    return (start, current, previous), result
+
+
+ALGORITHMS = {TOKEN_BUCKET: token_bucket, SLIDING_WINDOW: sliding_window}
+
+
+# -----------------------------------------------------------------------------
+# 🗄️ Backends
+# -----------------------------------------------------------------------------
+class RateLimitBackend:
+    """Interface of a rate limit state store."""
+
+    async def hit(
+        self, key: str, algorithm: str, limit: int, period: float, cost: int = 1
+    ) -> RateLimitResult:
+        raise NotImplementedError
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    Per-process state in an LRU of at most `max_keys` clients.
+
+    Evicting a client forgets its usage, which only ever errs on the side of
+    allowing requests. With several workers each enforces its own limit.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._states: "OrderedDict[str, State]" = OrderedDict()
+
+    async def hit(
+        self, key: str, algorithm: str, limit: int, period: float, cost: int = 1
+    ) -> RateLimitResult:
+        state, result = ALGORITHMS[algorithm](
+            self._states.pop(key, None), time.monotonic(), limit, period, cost
+        )
+        self._states[key] = state
+        if len(self._states) > self.max_keys:
+            self._states.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        self._states.clear()
+
+
+_TOKEN_BUCKET_SCRIPT = """
+local limit, period = tonumber(ARGV[1]), tonumber(ARGV[2])
+local cost, now = tonumber(ARGV[3]), tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens, last = tonumber(state[1]) or limit, tonumber(state[2]) or now
+tokens = math.min(limit, tokens + math.max(now - last, 0) * limit / period)
+local allowed = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(period * 1000))
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    State shared by all workers in any Redis-compatible async client.
+
+    The sliding window only uses `incrby`, `decrby`, `expire` and `get`, so
+    a local fake implementing those can stand in for Redis in development.
+    The token bucket runs as one Lua script (`eval`) to stay atomic.
+    """
+
+    def __init__(self, client: Any = None, url: str = "", prefix: str = "ratelimit:"):
+        if client is None:
+            import redis.asyncio as redis  # optional dependency
+
+            client = redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    async def hit(
+        self, key: str, algorithm: str, limit: int, period: float, cost: int = 1
+    ) -> RateLimitResult:
+        now = time.time()
+        if algorithm == TOKEN_BUCKET:
+            allowed, tokens = await self.client.eval(
+                _TOKEN_BUCKET_SCRIPT, 1, self.prefix + key, limit, period, cost, now
+            )
+            return _bucket_result(
+                bool(int(allowed)), float(tokens), limit, period, cost
+            )
+
+        window = math.floor(now / period)
+        current_key = f"{self.prefix}{key}:{window}"
+        ttl = max(int(math.ceil(period * 2)), 1)
+        current = await self.client.incrby(current_key, cost)
+        if current == cost:
+            await self.client.expire(current_key, ttl)
+        previous = float(await self.client.get(f"{self.prefix}{key}:{window - 1}") or 0)
+
+        # Evaluate as if this hit had not been counted yet
+        state = (window * period, float(current - cost), previous)
+        _, result = sliding_window(state, now, limit, period, cost)
+        if not result.allowed:
+            await self.client.decrby(current_key, cost)
+        return result
+
+
+@lru_cache
+def get_rate_limit_backend() -> RateLimitBackend:
+    """The backend configured by `RATE_LIMIT_BACKEND`, created on first use."""
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend(url=settings.RATE_LIMIT_REDIS_URL)
+    return MemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+
+# -----------------------------------------------------------------------------
+# 🔑 Client Keys
+# -----------------------------------------------------------------------------
+def client_ip(scope: Scope) -> str:
+    """The peer address; uvicorn's `proxy_headers` resolves it behind a proxy."""
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def api_key(scope: Scope) -> str:
+    """A digest of `X-API-Key` (or the bearer token), else the client IP."""
+    headers = Headers(scope=scope)
+    credential = headers.get("x-api-key")
+    if not credential:
+        authorization = headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            credential = authorization[7:]
+    if not credential:
+        return f"ip:{client_ip(scope)}"
+    return "key:" + hashlib.sha256(credential.encode()).hexdigest()[:32]
+
+
+def route(scope: Scope) -> str:
+    """The method and matched route template (the raw path before routing)."""
+    matched = scope.get("route")
+    return (
+        f"{scope.get('method', '')} {getattr(matched, 'path', scope.get('path', ''))}"
+    )
+
+
+KEY_FUNCTIONS: Dict[str, Callable[[Scope], str]] = {
+    "ip": client_ip,
+    "api_key": api_key,
+    "route": route,
+}
+
+
+# -----------------------------------------------------------------------------
+# 🚦 Rate Limiter
+# -----------------------------------------------------------------------------
+class RateLimiter:
+    """
+    A limit of `limit` requests per `period` seconds for each client.
+
+    Use it as a route dependency, where it limits that route on its own:
+
+        @router.post("/login", dependencies=[Depends(RateLimiter(5, 60, key="ip"))])
+
+    or through `RateLimitMiddleware` for a global limit. Rejections raise
+    `TooManyRequestsApiException` carrying `Retry-After` and `RateLimit-*`
+    headers. If the backend fails, the request is allowed and the error logged.
+
+    Args:
+        limit (int): Requests allowed per period; also the burst size.
+        period (float): Period in seconds.
+        algorithm (str): "token_bucket" or "sliding_window".
+        key (str | Callable): "ip", "api_key", "route" or a function of the scope.
+        name (str): Namespace for the counters; defaults to the matched route.
+        backend (RateLimitBackend): Defaults to the configured backend.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        period: float,
+        algorithm: str = TOKEN_BUCKET,
+        key: Union[str, Callable[[Scope], str]] = "ip",
+        name: Optional[str] = None,
+        backend: Optional[RateLimitBackend] = None,
+    ):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+        self.limit = limit
+        self.period = period
+        self.algorithm = algorithm
+        self.key = KEY_FUNCTIONS[key] if isinstance(key, str) else key
+        self.name = name
+        self._backend = backend
+
+    @property
+    def backend(self) -> RateLimitBackend:
+        return self._backend or get_rate_limit_backend()
+
+    async def hit(self, scope: Scope, cost: int = 1) -> Optional[RateLimitResult]:
+        """Count a request; None when the backend is unavailable (fail open)."""
+        name = self.name or route(scope)
+        try:
+            return await self.backend.hit(
+                f"{name}:{self.key(scope)}",
+                self.algorithm,
+                self.limit,
+                self.period,
+                cost,
+            )
+        except Exception:
+            RATE_LIMIT_ERRORS.inc(limiter=name)
+            logger.warning("Rate limit backend failed, allowing request", exc_info=True)
+            return None
+
+    async def check(self, scope: Scope) -> Optional[RateLimitResult]:
+        """
+        Raises:
+            TooManyRequestsApiException: If the client is over the limit.
+        """
+        result = await self.hit(scope)
+        if result is not None and not result.allowed:
+            RATE_LIMITED.inc(limiter=self.name or route(scope))
+            raise TooManyRequestsApiException(
+                "Rate limit exceeded, retry later.", headers=result.headers
+            )
+        return result
+
+    async def __call__(self, request: Request, response: Response) -> None:
+        result = await self.check(request.scope)
+        if result is not None:
+            response.headers.update(result.headers)
+
+
+def default_rate_limiter() -> RateLimiter:
+    """The global limiter described by the `RATE_LIMIT_*` settings."""
+    return RateLimiter(
+        settings.RATE_LIMIT_REQUESTS,
+        settings.RATE_LIMIT_PERIOD,
+        algorithm=settings.RATE_LIMIT_ALGORITHM,
+        key=settings.RATE_LIMIT_KEY,
+        name="global",
+    )
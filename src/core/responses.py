@@ -0,0 +1,159 @@
+import functools
+import inspect
+import json
+from typing import Any, Callable, Dict
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from starlette.responses import Response
+
+from src.app.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for values the encoder does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    return jsonable_encoder(obj)
+
+
+def _orjson_encoder() -> Callable[[Any], bytes]:
+    return lambda content: orjson.dumps(
+        content, default=_default, option=orjson.OPT_NON_STR_KEYS
+    )
+
+
+def _msgspec_encoder() -> Callable[[Any], bytes]:
+    return msgspec.json.Encoder(enc_hook=_default).encode
+
+
+def _stdlib_encoder() -> Callable[[Any], bytes]:
+    def encode(content: Any) -> bytes:
+        return json.dumps(
+            content,
+            default=_default,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    return encode
+
+
+def _select_encoder(backend: str) -> Callable[[Any], bytes]:
+    """Pick the JSON encoder for `JSON_BACKEND`; "auto" prefers orjson, then msgspec."""
+    if backend in ("auto", "orjson") and orjson is not None:
+        return _orjson_encoder()
+    if backend in ("auto", "msgspec") and msgspec is not None:
+        return _msgspec_encoder()
+    return _stdlib_encoder()
+
+
+_encode = _select_encoder(settings.JSON_BACKEND)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize `content` to JSON bytes.
+
+    Pydantic models are serialized by pydantic-core straight to bytes, skipping
+    the `model_dump` → `jsonable_encoder` → `json.dumps` round trip.
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    return _encode(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Default response class of the app, backed by the fastest available encoder.
+
+    On routes of a `FastJSONRoute` router return values are encoded straight
+    to bytes; elsewhere FastAPI first validates them against `response_model`
+    and dumps them to Python objects, and only the final encoding is faster.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class FastJSONRoute(APIRoute):
+    """
+    Route class that turns endpoint return values into JSON bytes in one step.
+
+    With a `response_model` the value is validated and dumped by the model's
+    `TypeAdapter` (honoring the `response_model_*` options), instead of
+    FastAPI's validate → dump to Python → encode; without one it goes to
+    `FastJSONResponse` as is, never through `jsonable_encoder`. Endpoints
+    returning a `Response`, and routes with a non-JSON `response_class`, are
+    left alone.
+
+    The result is returned as a ready `Response`, so headers set on an injected
+    `Response` parameter are not applied; such routes should return the
+    response themselves.
+
+        router = APIRouter(route_class=FastJSONRoute)
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, endpoint, **kwargs)
+        response_class = self.response_class
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        if not issubclass(response_class, JSONResponse):
+            return
+
+        call = self.dependant.call
+        status_code = self.status_code or 200
+        adapter = TypeAdapter(self.response_model) if self.response_field else None
+        options: Dict[str, Any] = {
+            "include": self.response_model_include,
+            "exclude": self.response_model_exclude,
+            "by_alias": self.response_model_by_alias,
+            "exclude_unset": self.response_model_exclude_unset,
+            "exclude_defaults": self.response_model_exclude_defaults,
+            "exclude_none": self.response_model_exclude_none,
+        }
+
+        def render(content: Any) -> Response:
+            if isinstance(content, Response):
+                return content
+            if adapter is None:
+                return FastJSONResponse(content, status_code=status_code)
+            try:
+                value = adapter.validate_python(content, from_attributes=True)
+            except ValidationError as exp:
+                raise ResponseValidationError(errors=exp.errors(), body=content)
+            return Response(
+                adapter.dump_json(value, **options),
+                status_code=status_code,
+                media_type="application/json",
+            )
+
+        if inspect.iscoroutinefunction(call):
+
+            @functools.wraps(call)
+            async def endpoint_to_bytes(*args: Any, **kwargs: Any) -> Response:
+                return render(await call(*args, **kwargs))
+
+        else:
+
+            @functools.wraps(call)
+            def endpoint_to_bytes(*args: Any, **kwargs: Any) -> Response:
+                return render(call(*args, **kwargs))
+
+        self.dependant.call = endpoint_to_bytes
@@ -1,15 +1,65 @@
 from contextlib import asynccontextmanager
 
-import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import RedirectResponse
 
-from src.core.logger import logger
-from src.app.config import settings
+from src.core.logger import logger, setup_logging
+from src.app.config import Settings, settings
+from src.app.middleware.compression import CompressionMiddleware, compression_options
+from src.app.middleware.etag import ETagMiddleware
 from src.app.middleware.exception_handlers import api_exception_handler
+from src.app.middleware.instrumentation import InstrumentationMiddleware
+from src.app.middleware.load_shedding import (
+    LoadSheddingMiddleware,
+    load_shedding_options,
+)
+from src.app.middleware.rate_limit import RateLimitMiddleware
+from src.app.middleware.request_id import RequestIdMiddleware
 from src.core.common.exceptions import ApiException
 from src.api.v1 import v1_router
+from src.api.routers.metrics import router as metrics_router
+from src.core.db import dispose_engines, get_replicas, warm_up_engines
+from src.core.dependencies.auth import key_store
+from src.core.health import loop_lag
+from src.core.responses import FastJSONResponse
+from src.services.jobs import job_queue
+
+
+# -----------------------------------------------------------------------------
+# 🔄 Lifespan: warm up on startup, drain on shutdown
+# -----------------------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()
+    # Anyone could forge pagination cursors signed with the published default
+    if (
+        settings.ENVIRONMENT != "development"
+        and settings.CURSOR_SECRET_KEY
+        == Settings.model_fields["CURSOR_SECRET_KEY"].default
+    ):
+        raise RuntimeError(
+            f"Set CURSOR_SECRET_KEY to a secret value in {settings.ENVIRONMENT}."
+        )
+    await warm_up_engines()
+    get_replicas().start()
+    loop_lag.start()
+    key_store.start()
+    job_queue.start()
+    logger.info(
+        "✅ %s (v%s) is running successfully in %s mode on %s:%s",
+        settings.APP_NAME,
+        settings.APP_VERSION,
+        settings.ENVIRONMENT,
+        settings.HOST,
+        settings.PORT,
+    )
+    yield
+    await job_queue.stop(settings.JOBS_SHUTDOWN_TIMEOUT)
+    await key_store.stop()
+    await loop_lag.stop()
+    await get_replicas().stop()
+    await dispose_engines()
 
 
 # -----------------------------------------------------------------------------
@@ -21,6 +71,8 @@ app = FastAPI(
     description=f"{settings.APP_NAME} API — running in {settings.ENVIRONMENT} mode.",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
 )
 
 # -----------------------------------------------------------------------------
@@ -33,6 +85,17 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ETagMiddleware)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, **compression_options())
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware, exempt_paths=settings.get_rate_limit_exempt_paths
+    )
+if settings.LOAD_SHED_ENABLED:
+    app.add_middleware(LoadSheddingMiddleware, **load_shedding_options())
+app.add_middleware(InstrumentationMiddleware)
+app.add_middleware(RequestIdMiddleware)
 
 # -----------------------------------------------------------------------------
 # ⚙️ Exception Handlers
@@ -43,16 +106,8 @@ app.add_exception_handler(ApiException, api_exception_handler)
 # 🔌 Register Routers
 # -----------------------------------------------------------------------------
 app.include_router(v1_router)
+app.include_router(metrics_router)
 
-# -----------------------------------------------------------------------------
-# 🏁 Startup Event
-# -----------------------------------------------------------------------------
-@app.on_event("startup")
-async def startup_event():
-    logger.info(
-        f"✅ {settings.APP_NAME} (v{settings.APP_VERSION}) is running successfully "
-        f"in {settings.ENVIRONMENT} mode on {settings.HOST}:{settings.PORT}"
-    )
 
 # -----------------------------------------------------------------------------
 # 🔁 Root Redirect
@@ -67,11 +122,8 @@ if __name__ == "__main__":
     """
     Supports both local (CLI) and Docker runs.
     - CLI: You can still run `uvicorn src.main:app --reload`
-    - Docker: It will auto-pick HOST/PORT from .env via settings
+    - Docker: It will auto-pick HOST/PORT/WORKERS from .env via settings
     """
-    uvicorn.run(
-        "src.main:app",
-        host=settings.HOST,
-        port=settings.PORT,
-        reload=settings.DEBUG,
-    )
\ No newline at end of file
+    from src.app.server import run
+
+    run()
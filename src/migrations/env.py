@@ -1,9 +1,11 @@
+import asyncio
 import os
 import sys
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config, make_url
+from sqlalchemy import Connection, engine_from_config, make_url
 from sqlalchemy import pool
+from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
@@ -12,30 +14,28 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".
 
 # Import your app's DB and models
 from src.core.db import Base
-from src.models import *
+from src.models import load_models
 from src.app.config import settings
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
-# Build both async and sync URLs
-async_url = make_url(settings.DATABASE_URL)
+# Migrations run through the app's own driver (e.g. asyncpg), no sync driver needed
+url = make_url(settings.DATABASE_URL)
 
-# Convert asyncpg → psycopg2 for Alembic
-if async_url.drivername.startswith("postgresql+asyncpg"):
-    sync_url = async_url.set(drivername="postgresql+psycopg2")
-else:
-    sync_url = async_url
-
-# Override alembic.ini URL
-config.set_main_option("sqlalchemy.url", sync_url.render_as_string(hide_password=False))
+# Override alembic.ini URL ("%" escaped for configparser interpolation)
+config.set_main_option(
+    "sqlalchemy.url", url.render_as_string(hide_password=False).replace("%", "%%")
+)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+load_models()
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # from myapp import mymodel
@@ -72,6 +72,48 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _set_timeouts(connection: Connection) -> None:
+    """Session-wide PostgreSQL timeouts, so DDL stuck behind a lock fails fast."""
+    if connection.dialect.name != "postgresql":
+        return
+    for name, value in (
+        ("lock_timeout", settings.MIGRATION_LOCK_TIMEOUT),
+        ("statement_timeout", settings.MIGRATION_STATEMENT_TIMEOUT),
+    ):
+        if value:
+            connection.exec_driver_sql(f"SET {name} = '{value}'")
+    # Leave no transaction open, or Alembic would treat it as the caller's
+    connection.commit()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    _set_timeouts(connection)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # Each revision commits on its own, so long data migrations and
+        # `src.migrations.toolkit` helpers never hold one huge transaction
+        transaction_per_migration=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """Run online migrations over an async engine (e.g. asyncpg)."""
+    connectable = async_engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
@@ -79,6 +121,10 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    if url.get_dialect().is_async:
+        asyncio.run(run_async_migrations())
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -86,10 +132,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-
-        with context.begin_transaction():
-            context.run_migrations()
+        do_run_migrations(connection)
 
 
 if context.is_offline_mode():
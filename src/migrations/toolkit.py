@@ -0,0 +1,299 @@
+"""
+Helpers for revision scripts that change large, busy tables without
+blocking writes.
+
+    from src.migrations.toolkit import backfill, create_index_concurrently, timeouts
+
+    def upgrade() -> None:
+        op.add_column("orders", sa.Column("total_cents", sa.BigInteger(), nullable=True))
+        backfill("orders", "total_cents = total * 100", where="total_cents IS NULL")
+        create_index_concurrently("ix_orders_total_cents", "orders", ["total_cents"])
+
+`env.py` runs each revision in its own transaction, so a revision using these
+helpers commits the work of the revisions before it. Keep such revisions
+small and idempotent: every helper here can be re-run after a failure.
+"""
+
+import logging
+import re
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+from src.app.config import settings
+
+# Under "alembic" so progress shows with the logging config of alembic.ini
+logger = logging.getLogger("alembic.toolkit")
+
+# PostgreSQL duration literal, e.g. "0", "500ms", "5s", "2min"
+_DURATION = re.compile(r"^\d+\s*(us|ms|s|min|h|d)?$")
+
+
+def is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _is_offline() -> bool:
+    return op.get_context().as_sql
+
+
+def _quote(name: str) -> str:
+    """Quote an identifier, each part of a schema-qualified `schema.table` on its own."""
+    preparer = op.get_bind().dialect.identifier_preparer
+    return ".".join(preparer.quote(part) for part in name.split("."))
+
+
+# -----------------------------------------------------------------------------
+# ⏳ Lock and Statement Timeouts
+# -----------------------------------------------------------------------------
+def set_timeouts(
+    lock_timeout: Optional[str] = None, statement_timeout: Optional[str] = None
+) -> None:
+    """
+    `SET lock_timeout` / `statement_timeout` for the rest of the session
+    (PostgreSQL only; ignored elsewhere). `None` leaves a setting alone.
+
+    A DDL statement waiting for a lock queues every query behind it, so a
+    short `lock_timeout` makes a blocked migration fail fast instead of
+    stalling the table; retry it when traffic is lower.
+    """
+    if not is_postgresql():
+        return
+    for name, value in (
+        ("lock_timeout", lock_timeout),
+        ("statement_timeout", statement_timeout),
+    ):
+        if value is None:
+            continue
+        if not _DURATION.match(value):
+            raise ValueError(f"Invalid {name}: {value!r}")
+        op.execute(f"SET {name} = '{value}'")
+
+
+@contextmanager
+def timeouts(
+    lock_timeout: Optional[str] = None, statement_timeout: Optional[str] = None
+) -> Iterator[None]:
+    """`set_timeouts` for the duration of the block, then restore the previous values."""
+    if not is_postgresql():
+        yield
+        return
+    if _is_offline():
+        # No session to ask in `--sql` mode: restore the configured defaults
+        previous = {
+            "lock_timeout": settings.MIGRATION_LOCK_TIMEOUT or "0",
+            "statement_timeout": settings.MIGRATION_STATEMENT_TIMEOUT or "0",
+        }
+    else:
+        bind = op.get_bind()
+        previous = {
+            "lock_timeout": bind.execute(text("SHOW lock_timeout")).scalar(),
+            "statement_timeout": bind.execute(text("SHOW statement_timeout")).scalar(),
+        }
+    set_timeouts(lock_timeout, statement_timeout)
+    try:
+        yield
+    finally:
+        set_timeouts(
+            lock_timeout and previous["lock_timeout"].replace(" ", ""),
+            statement_timeout and previous["statement_timeout"].replace(" ", ""),
+        )
+
+
+# -----------------------------------------------------------------------------
+# 🗂️ Concurrent Indexes
+# -----------------------------------------------------------------------------
+def _drop_invalid_index(name: str) -> None:
+    """A failed `CREATE INDEX CONCURRENTLY` leaves an INVALID index behind; drop it."""
+    invalid = (
+        op.get_bind()
+        .execute(
+            text(
+                "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND NOT i.indisvalid"
+            ),
+            {"name": name},
+        )
+        .first()
+    )
+    if invalid:
+        logger.warning("Dropping invalid index %s left by an earlier build", name)
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {_quote(name)}")
+
+
+def create_index_concurrently(
+    name: str,
+    table: str,
+    columns: Sequence[str],
+    unique: bool = False,
+    where: Optional[str] = None,
+    **kwargs: Any,
+) -> None:
+    """
+    Build an index without blocking writes: `CREATE INDEX CONCURRENTLY` on
+    PostgreSQL, run outside the migration transaction as it requires.
+
+    Re-running after a failed build drops the INVALID leftover and builds
+    again; an existing valid index is kept. Other databases get a plain
+    `CREATE INDEX`.
+
+    Args:
+        where (str): SQL predicate for a partial index.
+        **kwargs: Passed on to `op.create_index`.
+    """
+    if not is_postgresql():
+        op.create_index(
+            name, table, list(columns), unique=unique, if_not_exists=True, **kwargs
+        )
+        return
+    if where is not None:
+        kwargs["postgresql_where"] = text(where)
+    with op.get_context().autocommit_block():
+        if not _is_offline():
+            _drop_invalid_index(name)
+        # lock_timeout would abort the build midway and leave an invalid index
+        with timeouts(lock_timeout="0"):
+            op.create_index(
+                name,
+                table,
+                list(columns),
+                unique=unique,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                **kwargs,
+            )
+
+
+def drop_index_concurrently(name: str, table: Optional[str] = None) -> None:
+    """`DROP INDEX CONCURRENTLY IF EXISTS` on PostgreSQL, a plain drop elsewhere."""
+    if not is_postgresql():
+        op.drop_index(name, table_name=table, if_exists=True)
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            name, table_name=table, postgresql_concurrently=True, if_exists=True
+        )
+
+
+# -----------------------------------------------------------------------------
+# 🔁 Batched Backfills
+# -----------------------------------------------------------------------------
+def _estimate_rows(table: str, where: str) -> Optional[int]:
+    """Rows to backfill, for progress; `None` when only a full scan could tell."""
+    bind = op.get_bind()
+    if not is_postgresql():
+        return bind.execute(
+            text(f"SELECT count(*) FROM {_quote(table)} WHERE {where}")
+        ).scalar()
+    if where != "TRUE":
+        return None
+    # Planner estimate: on a big table a count(*) would cost as much as a batch run
+    estimate = bind.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table},
+    ).scalar()
+    return estimate if estimate and estimate > 0 else None
+
+
+def backfill(
+    table: str,
+    assignments: str,
+    where: str = "TRUE",
+    key: str = "id",
+    batch_size: Optional[int] = None,
+    pause: Optional[float] = None,
+    start_after: Any = None,
+    statement_timeout: Optional[str] = "60s",
+) -> int:
+    """
+    `UPDATE table SET assignments WHERE where`, one key range at a time, each
+    batch committed on its own.
+
+    Short transactions hold row locks only briefly, keep autovacuum and
+    replicas current, and leave what is done committed if the migration
+    fails. Make `where` exclude rows already backfilled (e.g.
+    `new_col IS NULL`) and a re-run resumes where the last one stopped;
+    `start_after` skips keys up to a value from the progress log instead.
+    `pause` seconds between batches leave room for regular traffic.
+
+    Offline (`--sql`) mode emits one plain `UPDATE`.
+
+    Args:
+        table (str): Table name.
+        assignments (str): SQL `SET` clause, e.g. "total_cents = total * 100".
+        where (str): SQL predicate of the rows to update.
+        key (str): Unique, indexed, sortable column to walk, usually the primary key.
+        batch_size (int): Rows per batch, default `MIGRATION_BACKFILL_BATCH_SIZE`.
+        pause (float): Seconds between batches, default `MIGRATION_BACKFILL_PAUSE`.
+        statement_timeout (str): Cap per batch statement (PostgreSQL).
+
+    Returns:
+        int: Rows updated.
+    """
+    batch_size = batch_size or settings.MIGRATION_BACKFILL_BATCH_SIZE
+    pause = settings.MIGRATION_BACKFILL_PAUSE if pause is None else pause
+    quoted_table, quoted_key = _quote(table), _quote(key)
+
+    if _is_offline():
+        op.execute(f"UPDATE {quoted_table} SET {assignments} WHERE {where}")
+        return 0
+
+    select_first = f"SELECT {quoted_key} FROM {quoted_table} WHERE ({where})"
+    select_next = f"{select_first} AND {quoted_key} > :last"
+    order = f" ORDER BY {quoted_key} LIMIT :batch_size"
+    update_batch = text(
+        f"UPDATE {quoted_table} SET {assignments} "
+        f"WHERE {quoted_key} >= :first AND {quoted_key} <= :upper AND ({where})"
+    )
+
+    bind = op.get_bind()
+    with op.get_context().autocommit_block(), timeouts(
+        statement_timeout=statement_timeout
+    ):
+        total = _estimate_rows(table, where)
+        done, last, started = 0, start_after, time.monotonic()
+        while True:
+            params: Dict[str, Any] = {"batch_size": batch_size}
+            if last is None:
+                select_batch = text(select_first + order)
+            else:
+                select_batch = text(select_next + order)
+                params["last"] = last
+            keys: List[Any] = list(bind.execute(select_batch, params).scalars())
+            if not keys:
+                break
+            done += bind.execute(
+                update_batch, {"first": keys[0], "upper": keys[-1]}
+            ).rowcount
+            last = keys[-1]
+            _report(table, done, total, last, started)
+            if len(keys) < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+    logger.info("Backfill of %s finished: %s rows", table, done)
+    return done
+
+
+def _report(
+    table: str, done: int, total: Optional[int], last: Any, started: float
+) -> None:
+    elapsed = time.monotonic() - started
+    rate = done / elapsed if elapsed else 0.0
+    progress: Dict[str, Any] = {
+        "rows": done,
+        "rows_per_second": round(rate),
+        "last_key": last,
+    }
+    if total:
+        progress["percent"] = round(min(done / total, 1.0) * 100, 1)
+        if rate:
+            progress["eta_seconds"] = round(max(total - done, 0) / rate)
+    logger.info(
+        "Backfill %s: %s",
+        table,
+        ", ".join(f"{name}={value}" for name, value in progress.items()),
+    )
@@ -0,0 +1,14 @@
+import importlib
+import pkgutil
+
+
+def load_models() -> None:
+    """
+    Import every model module so its tables are registered on `Base.metadata`.
+
+    Called by Alembic instead of `from src.models import *`; the application
+    imports only the models its routers use.
+    """
+    for module in pkgutil.walk_packages(__path__, f"{__name__}."):
+        if ".schemas" not in module.name:
+            importlib.import_module(module.name)
@@ -1,10 +1,14 @@
-from sqlalchemy.orm import declared_attr
-from sqlalchemy import DateTime, Column
+from sqlalchemy.orm import Mapper, Session, declared_attr, with_loader_criteria
+from sqlalchemy import DateTime, Column, Index, event
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 from src.core.db import Base as DeclarativeBase
 
+# Execution option that lets a SELECT see soft-deleted rows, e.g.
+# `select(Item).execution_options(include_deleted=True)`
+INCLUDE_DELETED = "include_deleted"
+
 
 class Base(DeclarativeBase):
     __abstract__ = True
@@ -35,8 +39,21 @@ class TimestampModel(CoreModel):
 
 
 class SoftDeleteModel(CoreModel):
+    """
+    Rows are deleted by setting `deleted_at` and are hidden from ORM SELECTs
+    unless `INCLUDE_DELETED` is set on the statement or execution.
+
+    Each table gets partial indexes `WHERE deleted_at IS NULL`, so live-row
+    queries never scan tombstones: one on the default list order (`created_at`,
+    `id`, or just the primary key), plus one per column tuple listed in
+    `__live_indexes__`.
+    """
+
     __abstract__ = True
 
+    # Extra column tuples to index over live rows, e.g. [("owner_id", "created_at")]
+    __live_indexes__: Sequence[Tuple[str, ...]] = ()
+
     deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     @property
@@ -46,3 +63,60 @@ class SoftDeleteModel(CoreModel):
 
 class BaseModel(TimestampModel, SoftDeleteModel):
     __abstract__ = True
+
+
+# -----------------------------------------------------------------------------
+# 🪦 Soft Delete Filtering
+# -----------------------------------------------------------------------------
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(orm_execute_state):
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        # Relationship and column loads inherit the criteria from the parent query
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteModel,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True,
+            )
+        )
+
+
+# -----------------------------------------------------------------------------
+# 📇 Partial Indexes on Live Rows
+# -----------------------------------------------------------------------------
+def _live_indexes(mapper: Mapper) -> Dict[str, Tuple[str, ...]]:
+    """Index name -> columns for every partial index `mapper`'s table should have."""
+    table = mapper.local_table
+    if "created_at" in table.c and "id" in table.c:
+        default = ("created_at", "id")
+    else:
+        default = tuple(column.name for column in table.primary_key)
+    indexes = {f"ix_{table.name}_live": default}
+    for columns in mapper.class_.__live_indexes__:
+        indexes[f"ix_{table.name}_{'_'.join(columns)}_live"] = tuple(columns)
+    return indexes
+
+
+@event.listens_for(SoftDeleteModel, "after_mapper_constructed", propagate=True)
+def _add_live_indexes(mapper: Mapper, cls: type) -> None:
+    table = mapper.local_table
+    # Single-table inheritance subclasses share their parent's table and indexes
+    if mapper.inherits is not None and mapper.inherits.local_table is table:
+        return
+
+    live = table.c.deleted_at.is_(None)
+    existing = {index.name for index in table.indexes}
+    for name, columns in _live_indexes(mapper).items():
+        if not columns or name in existing:
+            continue
+        Index(
+            name,
+            *(table.c[column] for column in columns),
+            postgresql_where=live,
+            sqlite_where=live,
+        )
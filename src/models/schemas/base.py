@@ -1,11 +1,30 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from functools import cache
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Any, Iterable, List, Optional, TypeVar
 from datetime import datetime
 
+SchemaT = TypeVar("SchemaT", bound="CoreSchema")
+
+
+@cache
+def _list_adapter(schema: type) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
 
 class CoreSchema(BaseModel):
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def validate_many(cls: type[SchemaT], rows: Iterable[Any]) -> List[SchemaT]:
+        """
+        Validate a list of ORM rows in one call.
+
+        Uses a `TypeAdapter(List[cls])` built once per schema, so the whole list
+        is validated by pydantic-core without a Python-level loop.
+        """
+        return _list_adapter(cls).validate_python(
+            rows if isinstance(rows, list) else list(rows), from_attributes=True
+        )
 
 
 class TimestampSchema(CoreSchema):
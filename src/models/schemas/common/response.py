@@ -1,4 +1,4 @@
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -6,6 +6,14 @@ T = TypeVar("T")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     total: int
+    total_strategy: str = "exact"
     limit: int
     offset: int
     data: List[T]
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool
+    data: List[T]
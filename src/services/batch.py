@@ -0,0 +1,264 @@
+import asyncio
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+from fastapi import Request
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Message, Scope
+
+from src.app.middleware.exception_handlers import api_exception_handler
+from src.core.common.exceptions import (
+    ApiException,
+    BadRequestApiException,
+    FailedDependencyApiException,
+    InternalErrorApiException,
+)
+from src.core.db import get_session_factory
+from src.core.loaders import SHARED_LOADERS, Loaders
+from src.core.logger import logger
+from src.core.responses import dumps
+
+# Request headers not passed on to sub-requests: they describe the batch body
+# or would make sub-responses compressed / conditional
+_DROPPED_HEADERS = {
+    b"content-length",
+    b"content-type",
+    b"transfer-encoding",
+    b"accept-encoding",
+    b"if-none-match",
+    b"if-modified-since",
+}
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class BatchItem(BaseModel):
+    id: str
+    method: str = "GET"
+    path: str = Field(
+        description="Path with query string, e.g. /base_URL/jobs?job_status=queued"
+    )
+    headers: Dict[str, str] = {}
+    body: Any = None
+    depends_on: List[str] = Field(
+        default=[], description="Ids of items that must succeed before this one runs"
+    )
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem]
+
+
+class BatchItemResult(BaseModel):
+    id: str
+    status: int
+    headers: Dict[str, str]
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchItemResult]
+
+
+class _Result:
+    """A sub-response, with its body kept as the raw JSON bytes to embed."""
+
+    __slots__ = ("id", "status", "headers", "body")
+
+    def __init__(self, id: str, status: int, headers: Dict[str, str], body: bytes):
+        self.id = id
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def render(self) -> bytes:
+        head = dumps({"id": self.id, "status": self.status, "headers": self.headers})
+        return head[:-1] + b',"body":' + self.body + b"}"
+
+
+def _validate(items: List[BatchItem], max_requests: int, batch_path: str) -> None:
+    if len(items) > max_requests:
+        raise BadRequestApiException(f"At most {max_requests} requests per batch.")
+    ids = [item.id for item in items]
+    if len(set(ids)) != len(ids):
+        raise BadRequestApiException("Batch request ids must be unique.")
+    by_id = {item.id: item for item in items}
+    for item in items:
+        if not item.path.startswith("/") or urlsplit(item.path).path == batch_path:
+            raise BadRequestApiException(f"Invalid path for request {item.id!r}.")
+        try:
+            # ASGI header names and values are latin-1 bytes
+            for name, value in item.headers.items():
+                name.encode("latin-1")
+                value.encode("latin-1")
+        except UnicodeEncodeError:
+            raise BadRequestApiException(f"Invalid header in request {item.id!r}.")
+        unknown = [dep for dep in item.depends_on if dep not in by_id]
+        if unknown:
+            raise BadRequestApiException(
+                f"Request {item.id!r} depends on unknown {unknown}."
+            )
+
+    # Depth-first search for cycles: 1 = on the current path, 2 = done
+    state: Dict[str, int] = {}
+
+    def visit(item_id: str) -> None:
+        state[item_id] = 1
+        for dep in by_id[item_id].depends_on:
+            if state.get(dep) == 1:
+                raise BadRequestApiException(f"Circular dependency through {dep!r}.")
+            if dep not in state:
+                visit(dep)
+        state[item_id] = 2
+
+    for item_id in ids:
+        if item_id not in state:
+            visit(item_id)
+
+
+class BatchDispatcher:
+    """
+    Runs the sub-requests of one `/batch` call through the ASGI app in-process.
+
+    Each sub-request passes the full middleware stack and routing, as if sent
+    on its own, with the batch's headers (e.g. `Authorization`) plus its own.
+    At most `concurrency` run at once; an item starts only after all of its
+    `depends_on` items succeeded, and gets a 424 if one failed.
+
+    Reads share one `Loaders` (see `get_loaders`), so loads of the same rows by
+    different sub-requests become one query. After a write sub-request the
+    shared `Loaders` is replaced, so later reads never see cached rows from
+    before the write.
+    """
+
+    def __init__(self, request: Request, concurrency: int):
+        self.request = request
+        self.app: ASGIApp = request.scope["app"]
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.sessions: List[AsyncSession] = []
+        self.loaders = self._new_loaders()
+
+    def _new_loaders(self) -> Loaders:
+        session = get_session_factory()()
+        self.sessions.append(session)
+        return Loaders(session)
+
+    def _scope(self, item: BatchItem, body: bytes) -> Scope:
+        parent = self.request.scope
+        url = urlsplit(item.path)
+        headers = [(k, v) for k, v in parent["headers"] if k not in _DROPPED_HEADERS]
+        extra = {
+            k.lower().encode("latin-1"): v.encode("latin-1")
+            for k, v in item.headers.items()
+        }
+        headers = [(k, v) for k, v in headers if k not in extra] + list(extra.items())
+        if body:
+            headers.append((b"content-type", b"application/json"))
+            headers.append((b"content-length", str(len(body)).encode()))
+        scope = {
+            "type": "http",
+            "asgi": parent.get("asgi", {"version": "3.0"}),
+            "http_version": parent.get("http_version", "1.1"),
+            "method": item.method.upper(),
+            "scheme": parent.get("scheme", "http"),
+            "server": parent.get("server"),
+            "client": parent.get("client"),
+            "root_path": parent.get("root_path", ""),
+            "path": url.path,
+            "raw_path": url.path.encode(),
+            "query_string": url.query.encode(),
+            "headers": headers,
+            "state": dict(parent.get("state", {})),
+        }
+        if scope["method"] in _SAFE_METHODS:
+            scope[SHARED_LOADERS] = self.loaders
+        return scope
+
+    async def _error(self, item: BatchItem, exp: ApiException) -> _Result:
+        response = await api_exception_handler(self.request, exp)
+        return _Result(item.id, response.status_code, {}, response.body)
+
+    async def _call(self, item: BatchItem) -> _Result:
+        body = b"" if item.body is None else dumps(item.body)
+        scope = self._scope(item, body)
+        status = 500
+        headers: Dict[str, str] = {}
+        chunks: List[bytes] = []
+        finished = asyncio.Event()
+        sent_body = False
+
+        async def receive() -> Message:
+            nonlocal sent_body
+            if not sent_body:
+                sent_body = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = {
+                    k.decode("latin-1"): v.decode("latin-1")
+                    for k, v in message.get("headers", [])
+                    if k != b"content-length"
+                }
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            # Re-raised by the app after its plain-text 500; answer in the API error format
+            logger.exception("Batch sub-request %s %s failed", item.method, item.path)
+            return await self._error(
+                item, InternalErrorApiException("Internal server error.")
+            )
+        finally:
+            finished.set()
+
+        raw = b"".join(chunks)
+        if not raw:
+            payload = b"null"
+        elif headers.get("content-type", "").startswith("application/json"):
+            payload = raw
+        else:
+            payload = dumps(raw.decode("utf-8", "replace"))
+        return _Result(item.id, status, headers, payload)
+
+    async def run(self, items: List[BatchItem]) -> bytes:
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_item(item: BatchItem) -> _Result:
+            if item.depends_on:
+                deps = await asyncio.gather(*(tasks[dep] for dep in item.depends_on))
+                failed = [dep.id for dep in deps if dep.status >= 400]
+                if failed:
+                    return await self._error(
+                        item,
+                        FailedDependencyApiException(f"Dependency {failed} failed."),
+                    )
+            async with self.semaphore:
+                result = await self._call(item)
+            if item.method.upper() not in _SAFE_METHODS:
+                self.loaders = self._new_loaders()
+            return result
+
+        for item in items:
+            tasks[item.id] = asyncio.ensure_future(run_item(item))
+        try:
+            results = await asyncio.gather(*tasks.values())
+        finally:
+            for session in self.sessions:
+                await session.close()
+        return b'{"responses":[' + b",".join(r.render() for r in results) + b"]}"
+
+
+async def dispatch_batch(
+    request: Request, batch: BatchRequest, max_requests: int, concurrency: int
+) -> bytes:
+    """Validate `batch` and run it; the JSON body of a `BatchResponse`."""
+    _validate(batch.requests, max_requests, request.url.path)
+    return await BatchDispatcher(request, concurrency).run(batch.requests)
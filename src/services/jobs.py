@@ -0,0 +1,477 @@
+import asyncio
+import contextlib
+import functools
+import itertools
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from src.app.config import settings
+from src.core.common.exceptions import (
+    BadRequestApiException,
+    ConflictApiException,
+    NotFoundApiException,
+    ServiceUnavailable,
+)
+from src.core.logger import logger
+from src.core.metrics import REGISTRY
+
+JOBS_FINISHED = REGISTRY.counter(
+    "jobs_finished_total", "Jobs that reached a final status.", ["task", "status"]
+)
+JOBS_QUEUED = REGISTRY.gauge("jobs_queued", "Jobs waiting for a queue worker.")
+OFFLOAD_PENDING = REGISTRY.gauge(
+    "offload_pending", "Offloaded calls running or waiting for a worker.", ["pool"]
+)
+
+PROCESS = "process"
+THREAD = "thread"
+ASYNC = "async"
+
+
+# -----------------------------------------------------------------------------
+# 🏭 Executor Offload
+# -----------------------------------------------------------------------------
+def default_process_workers() -> int:
+    """
+    Process workers per server process: the cores left after one for the event
+    loop, shared by all `WORKERS` server processes (at least one each).
+    """
+    cpus = os.cpu_count() or 2
+    servers = settings.WORKERS or cpus
+    return max((cpus - 1) // servers, 1)
+
+
+def _init_worker(nice: int) -> None:
+    """Runs in each worker process: yield the CPU to the process serving requests."""
+    if nice and hasattr(os, "nice"):
+        os.nice(nice)
+
+
+class Offloader:
+    """
+    Runs blocking calls outside the event loop: CPU-bound work in a process
+    pool, blocking I/O in a thread pool.
+
+    Each pool admits at most `max_pending` calls (running or queued in the
+    executor); further callers wait for a slot instead of piling work up, so
+    a burst of heavy requests cannot grow the backlog, or memory, without
+    bound. Worker processes are started with "spawn", which never copies the
+    server's event loop, connections or threads, and run `nice`d so request
+    handling keeps priority on a busy host. A process pool broken by a dying
+    worker is replaced; only the calls in flight on it fail.
+
+        digest = await offloader.run_in_process(hash_file, path)
+    """
+
+    def __init__(
+        self,
+        process_workers: int = 0,
+        thread_workers: int = 4,
+        max_pending: int = 64,
+        nice: int = 5,
+    ):
+        self.process_workers = process_workers or default_process_workers()
+        self.thread_workers = thread_workers
+        self.max_pending = max_pending
+        self.nice = nice
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+
+    def _new_process_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.process_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.nice,),
+        )
+
+    def start(self) -> None:
+        if self._process_pool is None:
+            self._process_pool = self._new_process_pool()
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers, thread_name_prefix="offload"
+            )
+
+    async def shutdown(self) -> None:
+        """Wait for offloaded calls to finish, then stop the pools."""
+        pools = [p for p in (self._process_pool, self._thread_pool) if p is not None]
+        self._process_pool = self._thread_pool = None
+        for pool in pools:
+            await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+    async def _run(
+        self, kind: str, pool: Optional[Executor], fn: Callable, args, kwargs
+    ) -> Any:
+        if pool is None:
+            raise ServiceUnavailable("Offload pools are not running.")
+        slots = self._slots.get(kind)
+        if slots is None:
+            slots = self._slots[kind] = asyncio.Semaphore(self.max_pending)
+        OFFLOAD_PENDING.inc(pool=kind)
+        try:
+            async with slots:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    pool, functools.partial(fn, *args, **kwargs)
+                )
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed): the calls it took down fail, later ones
+            # get a fresh pool
+            if pool is self._process_pool:
+                logger.error("Offload process pool is broken, starting a new one")
+                self._process_pool = self._new_process_pool()
+                pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            OFFLOAD_PENDING.dec(pool=kind)
+
+    async def run_in_process(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run `fn` in a worker process. `fn`, its arguments and result must be picklable."""
+        return await self._run(PROCESS, self._process_pool, fn, args, kwargs)
+
+    async def run_in_thread(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run `fn` in a worker thread, for blocking I/O that releases the GIL."""
+        return await self._run(THREAD, self._thread_pool, fn, args, kwargs)
+
+
+offloader = Offloader(
+    process_workers=settings.JOBS_PROCESS_WORKERS,
+    thread_workers=settings.JOBS_THREAD_WORKERS,
+    max_pending=settings.JOBS_MAX_PENDING,
+    nice=settings.JOBS_PROCESS_NICE,
+)
+
+
+# -----------------------------------------------------------------------------
+# 📋 Jobs
+# -----------------------------------------------------------------------------
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+_FINAL = {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+class JobInfo(BaseModel):
+    id: str
+    task: str
+    status: JobStatus = JobStatus.QUEUED
+    priority: int = 0
+    attempts: int = 0
+    max_retries: int = 0
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+
+@dataclass
+class Task:
+    name: str
+    fn: Callable[..., Any]
+    executor: str
+    max_retries: int
+    limit: Optional[asyncio.Semaphore] = None
+
+
+# -----------------------------------------------------------------------------
+# 🚦 Job Queue
+# -----------------------------------------------------------------------------
+class JobQueue:
+    """
+    In-process priority queue of registered tasks, run by `concurrency`
+    workers.
+
+    Lower `priority` runs first; equal priorities run in submission order.
+    Coroutine functions run on the event loop, plain functions in the
+    offloader's process pool (or thread pool with `executor="thread"`). A
+    failing job is retried up to `max_retries` times with exponential backoff.
+    A task registered with `concurrency` never runs more than that many jobs
+    at once, whatever the number of workers.
+
+    Job state lives in this process and is lost on restart; finished jobs are
+    kept for `result_ttl` seconds.
+
+        @job_queue.task(max_retries=1)
+        def build_report(account_id: int) -> dict: ...
+
+        job = await job_queue.submit("build_report", args=[42], priority=-1)
+    """
+
+    def __init__(
+        self,
+        offloader: Offloader,
+        concurrency: int = 4,
+        max_size: int = 1000,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        result_ttl: float = 3600.0,
+    ):
+        self.offloader = offloader
+        self.concurrency = concurrency
+        self.max_size = max_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.result_ttl = result_ttl
+        self.tasks: Dict[str, Task] = {}
+        self.jobs: Dict[str, JobInfo] = {}
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._seq = itertools.count()
+        self._workers: List[asyncio.Task] = []
+        self._running: Dict[str, asyncio.Future] = {}
+        self._retry_timers: Dict[str, asyncio.TimerHandle] = {}
+
+    def task(
+        self,
+        name: Optional[str] = None,
+        executor: Optional[str] = None,
+        max_retries: Optional[int] = None,
+        concurrency: int = 0,
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Register a function as a task under `name` (default: its `__name__`)."""
+
+        def register(fn: Callable[..., Any]) -> Callable[..., Any]:
+            kind = executor or (ASYNC if asyncio.iscoroutinefunction(fn) else PROCESS)
+            if kind not in (ASYNC, PROCESS, THREAD):
+                raise ValueError(f"Unknown executor {kind!r}")
+            task_name = name or fn.__name__
+            self.tasks[task_name] = Task(
+                name=task_name,
+                fn=fn,
+                executor=kind,
+                max_retries=self.max_retries if max_retries is None else max_retries,
+                limit=asyncio.Semaphore(concurrency) if concurrency else None,
+            )
+            return fn
+
+        return register
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    # -------------------------------------------------------------------------
+    # Submission and status
+    # -------------------------------------------------------------------------
+    async def submit(
+        self,
+        task: str,
+        args: Sequence[Any] = (),
+        kwargs: Optional[Mapping[str, Any]] = None,
+        priority: int = 0,
+        max_retries: Optional[int] = None,
+    ) -> JobInfo:
+        """Queue `task(*args, **kwargs)`; the call's arguments never clash with these options."""
+        if task not in self.tasks:
+            raise BadRequestApiException(f"Unknown task {task!r}.")
+        if self._queue is None:
+            raise ServiceUnavailable("Job queue is not running.")
+        if self._queue.qsize() >= self.max_size:
+            raise ServiceUnavailable("Job queue is full.", headers={"Retry-After": "1"})
+        self._prune()
+        job = JobInfo(
+            id=uuid.uuid4().hex,
+            task=task,
+            priority=priority,
+            max_retries=(
+                self.tasks[task].max_retries if max_retries is None else max_retries
+            ),
+            created_at=time.time(),
+        )
+        self.jobs[job.id] = job
+        self._enqueue(job, tuple(args), dict(kwargs or {}))
+        return job
+
+    def get(self, job_id: str) -> JobInfo:
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise NotFoundApiException(f"Job {job_id} not found.")
+        return job
+
+    def list(self, status: Optional[JobStatus] = None) -> List[JobInfo]:
+        jobs = self.jobs.values()
+        return [job for job in jobs if status is None or job.status == status]
+
+    def cancel(self, job_id: str) -> JobInfo:
+        """
+        Cancel a queued or running job. A call already handed to a worker
+        process runs to completion, but its result is discarded.
+        """
+        job = self.get(job_id)
+        if job.status in _FINAL:
+            raise ConflictApiException(f"Job {job_id} already {job.status.value}.")
+        timer = self._retry_timers.pop(job_id, None)
+        if timer is not None:
+            timer.cancel()
+        running = self._running.get(job_id)
+        if running is not None:
+            running.cancel()
+        else:
+            # Queued entries are skipped when a worker picks them up
+            self._finish(job, JobStatus.CANCELLED)
+        return job
+
+    def _enqueue(self, job: JobInfo, args: Tuple, kwargs: Dict[str, Any]) -> None:
+        self._retry_timers.pop(job.id, None)
+        if self._queue is None:
+            self._finish(job, JobStatus.CANCELLED, "Job queue stopped.")
+            return
+        self._queue.put_nowait((job.priority, next(self._seq), job.id, args, kwargs))
+        JOBS_QUEUED.set(self._queue.qsize())
+
+    def _finish(
+        self, job: JobInfo, status: JobStatus, error: Optional[str] = None
+    ) -> None:
+        job.status = status
+        job.error = error
+        job.finished_at = time.time()
+        JOBS_FINISHED.inc(task=job.task, status=status.value)
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.result_ttl
+        expired = [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job.status in _FINAL and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+    # -------------------------------------------------------------------------
+    # Execution
+    # -------------------------------------------------------------------------
+    async def _call(self, task: Task, args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        if task.executor == ASYNC:
+            return await task.fn(*args, **kwargs)
+        if task.executor == THREAD:
+            return await self.offloader.run_in_thread(task.fn, *args, **kwargs)
+        return await self.offloader.run_in_process(task.fn, *args, **kwargs)
+
+    async def _run(self, job: JobInfo, args: Tuple, kwargs: Dict[str, Any]) -> None:
+        task = self.tasks[job.task]
+
+        async def call() -> Any:
+            # A job waiting for its task's concurrency slot is still queued
+            async with task.limit or contextlib.nullcontext():
+                job.status = JobStatus.RUNNING
+                job.started_at = time.time()
+                job.attempts += 1
+                return await self._call(task, args, kwargs)
+
+        future = asyncio.ensure_future(call())
+        self._running[job.id] = future
+        try:
+            # `wait` lets the job's own cancellation through without raising here
+            await asyncio.wait({future})
+        except asyncio.CancelledError:
+            future.cancel()
+            self._finish(job, JobStatus.CANCELLED, "Job queue stopped.")
+            raise
+        finally:
+            self._running.pop(job.id, None)
+
+        if future.cancelled():
+            self._finish(job, JobStatus.CANCELLED)
+        elif future.exception() is not None:
+            exp = future.exception()
+            error = f"{exp.__class__.__name__}: {exp}"
+            if job.attempts <= job.max_retries:
+                delay = self.retry_backoff * 2 ** (job.attempts - 1)
+                logger.warning(
+                    "Job %s (%s) failed, retrying in %ss: %s",
+                    job.id,
+                    job.task,
+                    delay,
+                    error,
+                )
+                job.status = JobStatus.QUEUED
+                job.error = error
+                loop = asyncio.get_running_loop()
+                self._retry_timers[job.id] = loop.call_later(
+                    delay, self._enqueue, job, args, kwargs
+                )
+            else:
+                logger.error("Job %s (%s) failed: %s", job.id, job.task, error)
+                self._finish(job, JobStatus.FAILED, error)
+        else:
+            job.result = future.result()
+            self._finish(job, JobStatus.SUCCEEDED)
+
+    async def _work(self, queue: asyncio.PriorityQueue) -> None:
+        # `queue` rather than `self._queue`, which `stop()` clears while workers drain
+        while True:
+            _, _, job_id, args, kwargs = await queue.get()
+            JOBS_QUEUED.set(queue.qsize())
+            try:
+                job = self.jobs.get(job_id)
+                if job is not None and job.status == JobStatus.QUEUED:
+                    await self._run(job, args, kwargs)
+            finally:
+                queue.task_done()
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+    def start(self) -> None:
+        if self._queue is not None:
+            return
+        self.offloader.start()
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [
+            asyncio.create_task(self._work(self._queue))
+            for _ in range(self.concurrency)
+        ]
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """
+        Stop taking jobs, give queued and running ones `timeout` seconds to
+        finish, cancel the rest, then drain the offload pools.
+        """
+        if self._queue is None:
+            return
+        queue, self._queue = self._queue, None
+        for timer in self._retry_timers.values():
+            timer.cancel()
+        for job_id in list(self._retry_timers):
+            self._finish(self.jobs[job_id], JobStatus.CANCELLED, "Job queue stopped.")
+        self._retry_timers.clear()
+        try:
+            await asyncio.wait_for(queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Job queue did not drain in %ss, cancelling remaining jobs", timeout
+            )
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for job in self.jobs.values():
+            if job.status == JobStatus.QUEUED:
+                self._finish(job, JobStatus.CANCELLED, "Job queue stopped.")
+        await self.offloader.shutdown()
+
+
+job_queue = JobQueue(
+    offloader,
+    concurrency=settings.JOBS_CONCURRENCY,
+    max_size=settings.JOBS_QUEUE_MAX_SIZE,
+    max_retries=settings.JOBS_MAX_RETRIES,
+    retry_backoff=settings.JOBS_RETRY_BACKOFF,
+    result_ttl=settings.JOBS_RESULT_TTL,
+)
@@ -0,0 +1,307 @@
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from sqlalchemy import ColumnElement, Insert, Select, insert, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.config import settings
+from src.core.common.exceptions import (
+    BadRequestApiException,
+    NotFoundApiException,
+    NotImplementedApiException,
+)
+from src.core.count import CountStrategy, count_rows
+from src.core.dependencies.pagination import PaginationParams
+from src.models.base import BaseModel, SoftDeleteModel
+from src.models.schemas.base import CoreSchema
+from src.models.schemas.common.response import PaginatedResponse
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+SchemaT = TypeVar("SchemaT", bound=CoreSchema)
+
+Values = Union[CoreSchema, Mapping[str, Any]]
+
+# PostgreSQL accepts at most 32767 bind parameters per statement
+_MAX_BIND_PARAMS = 32767
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class Repository(Generic[ModelT, SchemaT]):
+    """
+    Generic data access for a `BaseModel` and its response schema.
+
+    Reads skip soft-deleted rows (see `SoftDeleteModel`). Bulk writes are
+    issued as a few large statements instead of one per row: multi-row
+    `INSERT` (optionally `ON CONFLICT`) in chunks of `DB_BULK_CHUNK_SIZE`, and
+    a single `UPDATE` for bulk updates and soft deletes. Nothing is committed
+    here; the caller owns the transaction.
+
+    Example:
+        class ItemRepository(Repository[Item, ItemSchema]):
+            model = Item
+            schema = ItemSchema
+
+        items = ItemRepository(session)
+        page = await items.list(pagination, Item.owner_id == user_id)
+    """
+
+    model: Type[ModelT]
+    schema: Type[SchemaT]
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        model: Optional[Type[ModelT]] = None,
+        schema: Optional[Type[SchemaT]] = None,
+    ):
+        self.session = session
+        if model is not None:
+            self.model = model
+        if schema is not None:
+            self.schema = schema
+
+    # -------------------------------------------------------------------------
+    # 🔎 Reads
+    # -------------------------------------------------------------------------
+    def query(self, *criteria: ColumnElement[bool], **filters: Any) -> Select:
+        """
+        `SELECT` of live rows matching `criteria` and `filters`.
+
+        Keyword filters compare a column with a value; list, tuple and set
+        values become `IN`.
+        """
+        stmt = select(self.model).where(*criteria)
+        if issubclass(self.model, SoftDeleteModel):
+            # Also applied by the session hook, but spelled out so that code
+            # inspecting the statement itself (e.g. estimated counts) sees it
+            stmt = stmt.where(self.model.deleted_at.is_(None))
+        for name, value in filters.items():
+            column = getattr(self.model, name, None)
+            if column is None:
+                raise BadRequestApiException(f"Unknown filter: {name}")
+            if isinstance(value, (list, tuple, set, frozenset)):
+                stmt = stmt.where(column.in_(value))
+            else:
+                stmt = stmt.where(column == value)
+        return stmt
+
+    async def get(self, id: Any) -> Optional[ModelT]:
+        """The live row with primary key `id`, or None."""
+        entity = await self.session.get(self.model, id)
+        if entity is None or entity.is_deleted:
+            return None
+        return entity
+
+    async def get_or_404(self, id: Any) -> ModelT:
+        """
+        Raises:
+            NotFoundApiException: If no live row has primary key `id`.
+        """
+        entity = await self.get(id)
+        if entity is None:
+            raise NotFoundApiException(f"{self.model.__name__} {id} not found.")
+        return entity
+
+    async def get_many(self, ids: Iterable[Any]) -> List[ModelT]:
+        """
+        Live rows for `ids`, fetched with one `IN` query per chunk, in the order
+        of `ids`. Missing and duplicate IDs are skipped.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        found: Dict[Any, ModelT] = {}
+        for chunk in _chunks(unique_ids, settings.DB_BULK_CHUNK_SIZE):
+            result = await self.session.scalars(self.query(self.model.id.in_(chunk)))
+            found.update((entity.id, entity) for entity in result)
+        return [found[id] for id in unique_ids if id in found]
+
+    async def list(
+        self,
+        params: PaginationParams,
+        *criteria: ColumnElement[bool],
+        order_by: Optional[Sequence[Any]] = None,
+        count_strategy: Optional[CountStrategy] = None,
+        **filters: Any,
+    ) -> PaginatedResponse[SchemaT]:
+        """
+        One page of live rows as `schema` objects, with the total count.
+
+        Args:
+            params (PaginationParams): The resolved pagination dependency.
+            *criteria: Extra `WHERE` clauses.
+            order_by (Sequence): Defaults to newest first, by `created_at` and `id`.
+            count_strategy (CountStrategy): See `src.core.count.count_rows`.
+            **filters: Column equality / `IN` filters, see `query`.
+        """
+        stmt = self.query(*criteria, **filters)
+        count = await count_rows(self.session, stmt, count_strategy)
+        if order_by is None:
+            order_by = (self.model.created_at.desc(), self.model.id.desc())
+        rows = await self.session.scalars(
+            stmt.order_by(*order_by).limit(params.limit).offset(params.offset)
+        )
+        return PaginatedResponse[self.schema](
+            total=count.total,
+            total_strategy=count.strategy.value,
+            limit=params.limit,
+            offset=params.offset,
+            data=self.schema.validate_many(rows.all()),
+        )
+
+    # -------------------------------------------------------------------------
+    # ✏️ Writes
+    # -------------------------------------------------------------------------
+    def _values(self, data: Values) -> Dict[str, Any]:
+        if isinstance(data, CoreSchema):
+            return data.model_dump(exclude_unset=True)
+        return dict(data)
+
+    def _chunk_size(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Rows per statement, kept under the bind parameter limit."""
+        width = max((len(row) for row in rows), default=1) + 2  # + timestamp defaults
+        return max(1, min(settings.DB_BULK_CHUNK_SIZE, _MAX_BIND_PARAMS // width))
+
+    async def create(self, data: Values) -> ModelT:
+        """Add one row and flush it, so database defaults (e.g. `id`) are loaded."""
+        entity = self.model(**self._values(data))
+        self.session.add(entity)
+        await self.session.flush()
+        return entity
+
+    def _insert(self, upsert: bool) -> Insert:
+        """`INSERT` for the session's dialect; `ON CONFLICT` needs PostgreSQL or SQLite."""
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(self.model)
+        if dialect == "sqlite":
+            return sqlite.insert(self.model)
+        if upsert:
+            raise NotImplementedApiException(
+                f"Bulk upsert is not supported on {dialect}."
+            )
+        return insert(self.model)
+
+    async def bulk_create(self, rows: Iterable[Values]) -> int:
+        """
+        Insert `rows` with one multi-row `INSERT` per chunk.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        return await self.bulk_upsert(rows, conflict_columns=None)
+
+    async def bulk_upsert(
+        self,
+        rows: Iterable[Values],
+        conflict_columns: Optional[Sequence[str]] = ("id",),
+        update_columns: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Insert `rows`, updating existing ones, with one multi-row
+        `INSERT ... ON CONFLICT` per chunk.
+
+        All rows should carry the same keys. ORM objects already loaded in the
+        session are not refreshed.
+
+        Args:
+            rows: Schemas or mappings of column values.
+            conflict_columns (Sequence[str]): Unique columns identifying an
+                existing row; None inserts without a conflict clause.
+            update_columns (Sequence[str]): Columns overwritten on conflict;
+                defaults to every supplied column except `conflict_columns`.
+                An empty list skips conflicting rows (`DO NOTHING`).
+
+        Returns:
+            int: Number of rows inserted or updated.
+        """
+        values = [self._values(row) for row in rows]
+        if not values:
+            return 0
+
+        conflict_columns = list(conflict_columns or [])
+        if update_columns is None:
+            update_columns = [key for key in values[0] if key not in conflict_columns]
+
+        total = 0
+        for chunk in _chunks(values, self._chunk_size(values)):
+            stmt = self._insert(bool(conflict_columns)).values(list(chunk))
+            if conflict_columns:
+                stmt = self._on_conflict(stmt, conflict_columns, update_columns)
+            result = await self.session.execute(stmt)
+            total += max(result.rowcount, 0)
+        return total
+
+    def _on_conflict(
+        self,
+        stmt: Insert,
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str],
+    ) -> Insert:
+        if not update_columns:
+            return stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+
+        # `set_` bypasses Python-side `onupdate`, so stamp updated_at explicitly
+        changes = {column: stmt.excluded[column] for column in update_columns}
+        if "updated_at" in inspect(self.model).columns and "updated_at" not in changes:
+            changes["updated_at"] = _utcnow()
+        return stmt.on_conflict_do_update(index_elements=conflict_columns, set_=changes)
+
+    async def bulk_update(
+        self, values: Values, *criteria: ColumnElement[bool], **filters: Any
+    ) -> int:
+        """
+        Set `values` on every live row matching `criteria` and `filters`, as a
+        single `UPDATE`.
+
+        Returns:
+            int: Number of rows updated.
+        """
+        changes = self._values(values)
+        if not changes:
+            return 0
+        # The soft-delete criteria only covers SELECTs, so filter live rows here
+        where = self.query(
+            self.model.deleted_at.is_(None), *criteria, **filters
+        ).whereclause
+        result = await self.session.execute(
+            update(self.model).where(where).values(**changes),
+            execution_options={"synchronize_session": "fetch"},
+        )
+        return result.rowcount
+
+    async def soft_delete(self, ids: Iterable[Any]) -> int:
+        """
+        Mark the rows with `ids` as deleted by setting `deleted_at`, as a single
+        `UPDATE`. Rows that are already deleted keep their original timestamp.
+
+        Returns:
+            int: Number of rows deleted.
+        """
+        deleted_at = _utcnow()
+        total = 0
+        for chunk in _chunks(list(dict.fromkeys(ids)), settings.DB_BULK_CHUNK_SIZE):
+            total += await self.bulk_update(
+                {"deleted_at": deleted_at}, self.model.id.in_(chunk)
+            )
+        return total
@@ -0,0 +1,118 @@
+"""
+Insert throughput: row-by-row ORM inserts versus `Repository` bulk operations.
+
+Creates a throwaway table, then inserts `--rows` rows once per approach on
+the configured `DATABASE_URL` (in-memory SQLite by default; point it at a
+PostgreSQL database for representative numbers):
+
+- `row_by_row`: one `session.add()` + `flush()` per row, as import jobs did.
+- `bulk_create`: `Repository.bulk_create`, one multi-row `INSERT` per chunk.
+- `bulk_upsert`: `Repository.bulk_upsert` over the same keys, `ON CONFLICT DO UPDATE`.
+
+    python -m src.tests.benchmarks.bulk_insert --rows 20000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+
+from sqlalchemy import Column, Integer, String
+
+from src.core.db import get_engine, get_session_factory
+from src.models.base import BaseModel
+from src.services.repository import Repository
+from src.tests.benchmarks.common import compare_to_baseline, print_table, save_results
+
+
+class BenchmarkRow(BaseModel):
+    __tablename__ = f"benchmark_rows_{uuid.uuid4().hex[:8]}"
+
+    id = Column(Integer, primary_key=True)
+    sku = Column(String(64), unique=True, nullable=False)
+    quantity = Column(Integer, nullable=False)
+
+
+def _rows(count: int, quantity: int) -> list:
+    return [{"sku": f"sku-{i}", "quantity": quantity} for i in range(count)]
+
+
+async def _timed(case) -> float:
+    async with get_session_factory()() as session:
+        start = time.perf_counter()
+        await case(session)
+        await session.commit()
+        return time.perf_counter() - start
+
+
+async def _reset() -> None:
+    async with get_engine().begin() as connection:
+        await connection.run_sync(BenchmarkRow.__table__.drop, checkfirst=True)
+        await connection.run_sync(BenchmarkRow.__table__.create)
+
+
+async def run(rows: int) -> dict:
+    async def row_by_row(session):
+        for values in _rows(rows, 1):
+            session.add(BenchmarkRow(**values))
+            await session.flush()
+
+    async def bulk_create(session):
+        await Repository(session, BenchmarkRow).bulk_create(_rows(rows, 1))
+
+    async def bulk_upsert(session):
+        await Repository(session, BenchmarkRow).bulk_upsert(
+            _rows(rows, 2), conflict_columns=["sku"]
+        )
+
+    results = {}
+    for name, case in [("row_by_row", row_by_row), ("bulk_create", bulk_create)]:
+        await _reset()
+        seconds = await _timed(case)
+        results[name] = {"seconds": seconds, "rows_per_second": rows / seconds}
+
+    # Upsert over the rows left by bulk_create, so every row hits the conflict path
+    seconds = await _timed(bulk_upsert)
+    results["bulk_upsert"] = {"seconds": seconds, "rows_per_second": rows / seconds}
+
+    async with get_engine().begin() as connection:
+        await connection.run_sync(BenchmarkRow.__table__.drop, checkfirst=True)
+    await get_engine().dispose()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument(
+        "--baseline", help="Fail if worse than this earlier JSON result"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.rows))
+
+    print_table(
+        [
+            [name, f"{r['seconds'] * 1000:.1f}", f"{r['rows_per_second']:.0f}"]
+            for name, r in results.items()
+        ],
+        ["case", "ms", "rows/s"],
+    )
+    save_results(results, args.output)
+
+    regressions = compare_to_baseline(
+        results, args.baseline, "rows_per_second", args.tolerance, higher_is_better=True
+    )
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+def measure(
+    fn: Callable[[], Any], repeat: int = 5, warmup: int = 1
+) -> Dict[str, float]:
+    """Run `fn` `warmup + repeat` times and return best/median wall time in seconds."""
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {"best": min(timings), "median": statistics.median(timings)}
+
+
+def save_results(results: Dict[str, Any], path: Optional[str]) -> None:
+    if path:
+        Path(path).write_text(json.dumps(results, indent=2, sort_keys=True))
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, float]],
+    baseline_path: Optional[str],
+    metric: str,
+    tolerance: float,
+    higher_is_better: bool = False,
+) -> List[str]:
+    """
+    Compare `results[name][metric]` with a baseline JSON file from an earlier run.
+
+    Returns:
+        List[str]: One message per benchmark that regressed by more than
+        `tolerance` (a fraction, e.g. 0.2 for 20%).
+    """
+    if not baseline_path:
+        return []
+    baseline = json.loads(Path(baseline_path).read_text())
+    regressions = []
+    for name, values in results.items():
+        before = baseline.get(name, {}).get(metric)
+        after = values.get(metric)
+        if not before or after is None:
+            continue
+        change = (
+            (before - after) / before if higher_is_better else (after - before) / before
+        )
+        if change > tolerance:
+            regressions.append(
+                f"{name}: {metric} {before:.6g} -> {after:.6g} ({change:+.0%} worse)"
+            )
+    return regressions
+
+
+def print_table(rows: List[List[Any]], headers: List[str]) -> None:
+    table = [headers] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+    for index, row in enumerate(table):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+        if index == 0:
+            print("  ".join("-" * width for width in widths))
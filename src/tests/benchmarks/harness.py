@@ -0,0 +1,353 @@
+"""
+Load test: throughput and latency percentiles of `src.main:app` per endpoint.
+
+Seeds `--rows` rows into a `benchmark_items` table on the configured
+`DATABASE_URL` (a SQLite file in the temp directory by default, so a uvicorn
+worker sees the same data; point it at PostgreSQL for representative
+numbers), mounts a few benchmark routes on the app and drives each endpoint
+with `--concurrency` clients for `--requests` requests:
+
+- `health`: `GET /base_URL/health/live`, the cheapest full middleware pass.
+- `ready`: `GET /base_URL/health/ready`, cached readiness probes.
+- `list`: `GET /bench/items`, a `Repository.list` page (count + page query).
+- `error`: `GET /bench/missing`, a 404 through `api_exception_handler`.
+- `large_json`: `GET /bench/large`, `--payload-rows` objects (~1 MB by default).
+
+`--mode inprocess` calls the app over ASGI (httpx `ASGITransport`, lifespan
+included); `--mode uvicorn` starts a real uvicorn worker on a free port and
+goes over HTTP. Results are keyed `<mode>:<endpoint>`, and `--baseline` fails
+the run when p99 latency rises or throughput drops by more than `--tolerance`.
+
+    python -m src.tests.benchmarks.harness --mode both --rows 10000 --output bench.json
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite+aiosqlite:///{os.path.join(tempfile.gettempdir(), 'api_benchmark.db')}",
+)
+
+import httpx
+from fastapi import APIRouter, Depends
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.common.exceptions import NotFoundApiException
+from src.core.db import get_db, get_engine, get_session_factory
+from src.core.dependencies.pagination import PaginationParams
+from src.core.responses import FastJSONResponse
+from src.main import app
+from src.models.base import BaseModel
+from src.models.schemas.base import TimestampSchema
+from src.models.schemas.common.response import PaginatedResponse
+from src.services.repository import Repository
+from src.tests.benchmarks.common import compare_to_baseline, print_table, save_results
+
+# Set by `--payload-rows`; an environment variable so the uvicorn worker sees it too
+PAYLOAD_ROWS_ENV = "BENCHMARK_PAYLOAD_ROWS"
+
+
+class BenchmarkItem(BaseModel):
+    __tablename__ = "benchmark_items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(64), nullable=False)
+    quantity = Column(Integer, nullable=False)
+
+
+class BenchmarkItemSchema(TimestampSchema):
+    id: int
+    name: str
+    quantity: int
+
+
+# -----------------------------------------------------------------------------
+# 🧪 Benchmark Routes
+# -----------------------------------------------------------------------------
+router = APIRouter(prefix="/bench", tags=["benchmark"], include_in_schema=False)
+
+
+def _build_payload(rows: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "name": f"item-{i}",
+            "quantity": i % 97,
+            "tags": ["a", "b"],
+            "price": i * 0.25,
+        }
+        for i in range(rows)
+    ]
+
+
+_payload = _build_payload(int(os.environ.get(PAYLOAD_ROWS_ENV, "5000")))
+
+
+@router.get("/items", response_model=PaginatedResponse[BenchmarkItemSchema])
+async def list_items(
+    pagination: PaginationParams = Depends(), session: AsyncSession = Depends(get_db)
+):
+    return await Repository(session, BenchmarkItem, BenchmarkItemSchema).list(
+        pagination
+    )
+
+
+@router.get("/missing")
+async def missing_item():
+    raise NotFoundApiException("Benchmark item not found.")
+
+
+@router.get("/large")
+async def large_json():
+    return FastJSONResponse(_payload)
+
+
+app.include_router(router)
+
+# name -> (path, expected status)
+ENDPOINTS: Dict[str, Tuple[str, int]] = {
+    "health": ("/base_URL/health/live", 200),
+    "ready": ("/base_URL/health/ready", 200),
+    "list": ("/bench/items?limit=50&offset=100", 200),
+    "error": ("/bench/missing", 404),
+    "large_json": ("/bench/large", 200),
+}
+
+
+# -----------------------------------------------------------------------------
+# 🌱 Seeding
+# -----------------------------------------------------------------------------
+async def seed(rows: int) -> None:
+    async with get_engine().begin() as connection:
+        await connection.run_sync(BenchmarkItem.__table__.drop, checkfirst=True)
+        await connection.run_sync(BenchmarkItem.__table__.create)
+    async with get_session_factory()() as session:
+        await Repository(session, BenchmarkItem).bulk_create(
+            [{"name": f"item-{i}", "quantity": i % 97} for i in range(rows)]
+        )
+        await session.commit()
+    await get_engine().dispose()
+
+
+async def drop() -> None:
+    async with get_engine().begin() as connection:
+        await connection.run_sync(BenchmarkItem.__table__.drop, checkfirst=True)
+    await get_engine().dispose()
+
+
+# -----------------------------------------------------------------------------
+# 🚀 Load Generation
+# -----------------------------------------------------------------------------
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def load(
+    client: httpx.AsyncClient, path: str, expected: int, requests: int, concurrency: int
+) -> Dict[str, float]:
+    """Send `requests` GETs to `path` from `concurrency` clients; latency stats in ms."""
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != expected:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": len(ordered) / elapsed,
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": _percentile(ordered, 0.50) * 1000,
+        "p95_ms": _percentile(ordered, 0.95) * 1000,
+        "p99_ms": _percentile(ordered, 0.99) * 1000,
+    }
+
+
+async def run_endpoints(
+    client: httpx.AsyncClient, mode: str, requests: int, concurrency: int, warmup: int
+) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, (path, expected) in ENDPOINTS.items():
+        if warmup:
+            await load(client, path, expected, warmup, concurrency)
+        results[f"{mode}:{name}"] = await load(
+            client, path, expected, requests, concurrency
+        )
+    return results
+
+
+async def run_inprocess(
+    requests: int, concurrency: int, warmup: int
+) -> Dict[str, Dict]:
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            return await run_endpoints(
+                client, "inprocess", requests, concurrency, warmup
+            )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_until_up(client: httpx.AsyncClient, server: subprocess.Popen) -> None:
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+        try:
+            await client.get(ENDPOINTS["health"][0])
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError("uvicorn did not start within 30s")
+
+
+async def run_uvicorn(requests: int, concurrency: int, warmup: int) -> Dict[str, Dict]:
+    port = _free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.tests.benchmarks.harness:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        env=dict(os.environ, PYTHONPATH=os.getcwd()),
+    )
+    try:
+        limits = httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        )
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30
+        ) as client:
+            await _wait_until_up(client, server)
+            return await run_endpoints(client, "uvicorn", requests, concurrency, warmup)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+async def run(
+    mode: str, rows: int, requests: int, concurrency: int, warmup: int, keep: bool
+) -> Dict[str, Dict[str, float]]:
+    await seed(rows)
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        if mode in ("inprocess", "both"):
+            results.update(await run_inprocess(requests, concurrency, warmup))
+        if mode in ("uvicorn", "both"):
+            results.update(await run_uvicorn(requests, concurrency, warmup))
+    finally:
+        if not keep:
+            await drop()
+    from src.core.logger import shutdown_logging
+
+    shutdown_logging()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--mode", choices=["inprocess", "uvicorn", "both"], default="inprocess"
+    )
+    parser.add_argument(
+        "--rows", type=int, default=10000, help="Rows seeded for the list endpoint"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="Requests per endpoint"
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument(
+        "--payload-rows", type=int, default=5000, help="Objects in large_json"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the seeded table afterwards"
+    )
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument(
+        "--baseline", help="Fail if worse than this earlier JSON result"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    args = parser.parse_args()
+
+    os.environ[PAYLOAD_ROWS_ENV] = str(args.payload_rows)
+    _payload[:] = _build_payload(args.payload_rows)
+
+    results = asyncio.run(
+        run(
+            args.mode,
+            args.rows,
+            args.requests,
+            args.concurrency,
+            args.warmup,
+            args.keep,
+        )
+    )
+
+    print_table(
+        [
+            [
+                name,
+                f"{r['rps']:.0f}",
+                f"{r['p50_ms']:.2f}",
+                f"{r['p95_ms']:.2f}",
+                f"{r['p99_ms']:.2f}",
+                r["errors"],
+            ]
+            for name, r in results.items()
+        ],
+        ["endpoint", "req/s", "p50 ms", "p95 ms", "p99 ms", "errors"],
+    )
+    save_results(results, args.output)
+
+    regressions = compare_to_baseline(results, args.baseline, "p99_ms", args.tolerance)
+    regressions += compare_to_baseline(
+        results, args.baseline, "rps", args.tolerance, higher_is_better=True
+    )
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    errors = [name for name, r in results.items() if r["errors"]]
+    for name in errors:
+        print(f"ERRORS {name}: {results[name]['errors']} unexpected status codes")
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+Event-loop stall caused by logging during an error storm.
+
+Logs a burst of ERROR records from a coroutine while a ticker task measures
+how late the loop wakes it up, once with a synchronous `StreamHandler` (the
+previous setup) and once with the queue-based logging of `src.core.logger`.
+The sink simulates a slow stdout (e.g. a blocked pipe) by sleeping per write.
+
+    python -m src.tests.benchmarks.logging_stall --records 2000 --write-latency-ms 0.2
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import queue
+import statistics
+import sys
+import time
+from logging.handlers import QueueListener
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+
+from src.core.logger import (
+    JsonFormatter,
+    LazyQueueHandler,
+    RateLimitFilter,
+    RequestIdFilter,
+)
+from src.tests.benchmarks.common import compare_to_baseline, print_table, save_results
+
+
+class SlowStream:
+    """A stream whose writes block for `latency` seconds."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def write(self, data: str) -> int:
+        time.sleep(self.latency)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+async def _ticker(lags: list, stop: asyncio.Event, interval: float = 0.001) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(loop.time() - expected, 0.0))
+
+
+async def _error_storm(log: logging.Logger, records: int) -> None:
+    for i in range(records):
+        log.error("Request %s failed: %s", i, "upstream timeout")
+        if i % 50 == 0:
+            await asyncio.sleep(0)
+
+
+def run_case(name: str, handler: logging.Handler, records: int) -> dict:
+    log = logging.getLogger(f"bench.{name}")
+    log.propagate = False
+    log.handlers = [handler]
+    log.setLevel(logging.INFO)
+
+    async def scenario() -> dict:
+        lags: list = []
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_ticker(lags, stop))
+        await asyncio.sleep(0.01)
+        start = time.perf_counter()
+        await _error_storm(log, records)
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0.01)
+        stop.set()
+        await ticker
+        lags.sort()
+        return {
+            "log_seconds": elapsed,
+            "max_lag_ms": lags[-1] * 1000,
+            "p99_lag_ms": lags[int(len(lags) * 0.99) - 1] * 1000,
+            "mean_lag_ms": statistics.fmean(lags) * 1000,
+        }
+
+    return asyncio.run(scenario())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--write-latency-ms", type=float, default=0.2)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument(
+        "--baseline", help="Fail if worse than this earlier JSON result"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    args = parser.parse_args()
+
+    stream = SlowStream(args.write_latency_ms / 1000)
+    results = {}
+
+    sync_handler = logging.StreamHandler(stream)
+    sync_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    results["sync_stream_handler"] = run_case("sync", sync_handler, args.records)
+
+    queue_handler = LazyQueueHandler(queue.Queue(maxsize=args.records * 2))
+    queue_handler.addFilter(RequestIdFilter())
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(JsonFormatter())
+    listener = QueueListener(queue_handler.queue, stream_handler)
+    listener.start()
+    results["queue_handler"] = run_case("queue", queue_handler, args.records)
+    listener.stop()
+
+    queue_handler = LazyQueueHandler(queue.Queue(maxsize=args.records * 2))
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(RateLimitFilter(sample_rate=1.0, rate=10, burst=20))
+    listener = QueueListener(queue_handler.queue, stream_handler)
+    listener.start()
+    results["queue_handler_rate_limited"] = run_case(
+        "limited", queue_handler, args.records
+    )
+    listener.stop()
+
+    print_table(
+        [
+            [
+                name,
+                f"{r['log_seconds'] * 1000:.1f}",
+                f"{r['max_lag_ms']:.2f}",
+                f"{r['p99_lag_ms']:.2f}",
+                f"{r['mean_lag_ms']:.3f}",
+            ]
+            for name, r in results.items()
+        ],
+        ["case", "logging ms", "max lag ms", "p99 lag ms", "mean lag ms"],
+    )
+    save_results(results, args.output)
+
+    regressions = compare_to_baseline(
+        results, args.baseline, "p99_lag_ms", args.tolerance
+    )
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
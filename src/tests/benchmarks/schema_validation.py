@@ -0,0 +1,118 @@
+"""
+ORM → schema conversion throughput.
+
+Compares the legacy pydantic v1 compatibility path (`orm_mode` + `from_orm`)
+with native v2 per-row `model_validate` and the list `TypeAdapter` used by
+`CoreSchema.validate_many`.
+
+    python -m src.tests.benchmarks.schema_validation --rows 10000 \\
+        --output schema.json --baseline previous.json
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Optional
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+
+import pydantic.v1 as pydantic_v1
+from sqlalchemy import Column, Integer, String
+
+from src.models.base import BaseModel
+from src.models.schemas.base import BaseSchema
+from src.tests.benchmarks.common import (
+    compare_to_baseline,
+    measure,
+    print_table,
+    save_results,
+)
+
+
+class BenchRow(BaseModel):
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+    score = Column(Integer, nullable=False)
+
+
+class BenchSchema(BaseSchema):
+    id: int
+    name: str
+    score: int
+
+
+class BenchSchemaV1(pydantic_v1.BaseModel):
+    id: int
+    name: str
+    score: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    deleted_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+
+def build_rows(count: int):
+    now = datetime(2025, 1, 1)
+    return [
+        BenchRow(
+            id=i,
+            name=f"row-{i}",
+            score=i % 100,
+            created_at=now + timedelta(seconds=i),
+            updated_at=now + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument(
+        "--baseline", help="Fail if slower than this earlier JSON result"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    cases = {
+        "v1_from_orm": lambda: [BenchSchemaV1.from_orm(r) for r in rows],
+        "v2_model_validate": lambda: [BenchSchema.model_validate(r) for r in rows],
+        "v2_validate_many": lambda: BenchSchema.validate_many(rows),
+    }
+
+    results = {}
+    for name, fn in cases.items():
+        timing = measure(fn, repeat=args.repeat)
+        timing["rows_per_second"] = args.rows / timing["best"]
+        results[name] = timing
+
+    print_table(
+        [
+            [
+                name,
+                f"{r['best'] * 1000:.1f}",
+                f"{r['median'] * 1000:.1f}",
+                f"{r['rows_per_second']:,.0f}",
+            ]
+            for name, r in results.items()
+        ],
+        ["case", "best ms", "median ms", "rows/s"],
+    )
+    save_results(results, args.output)
+
+    regressions = compare_to_baseline(
+        results, args.baseline, "rows_per_second", args.tolerance, higher_is_better=True
+    )
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Cold-start cost: import time of `src.main` and time to the first response.
+
+Each sample runs in a fresh interpreter so nothing is already imported:
+
+- `import_seconds`: wall time of `import src.main`.
+- `first_request_seconds`: interpreter start to the first `GET /metrics`
+  answered through the lifespan (engine warm-up, replica checks) in-process.
+
+With `--importtime` the slowest modules from `python -X importtime` are
+listed as well, to see what an import-time regression pulled in.
+
+    python -m src.tests.benchmarks.startup --repeat 5 --importtime
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+
+from src.tests.benchmarks.common import compare_to_baseline, print_table, save_results
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import src.main
+print(time.perf_counter() - start)
+"""
+
+FIRST_REQUEST_SNIPPET = """
+import time
+start = time.perf_counter()
+import asyncio
+import httpx
+from src.main import app
+
+async def first_request():
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.get("/metrics")
+            assert response.status_code == 200, response.status_code
+            print(time.perf_counter() - start)
+    from src.core.logger import shutdown_logging
+    shutdown_logging()
+
+asyncio.run(first_request())
+"""
+
+
+def _run(snippet: str, *flags: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=os.getcwd(), PYTHONDONTWRITEBYTECODE="0")
+    return subprocess.run(
+        [sys.executable, *flags, "-c", snippet],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def _sample(snippet: str, repeat: int) -> Dict[str, float]:
+    timings = [
+        float(_run(snippet).stdout.strip().splitlines()[-1]) for _ in range(repeat)
+    ]
+    return {"best": min(timings), "median": statistics.median(timings)}
+
+
+def import_profile(top: int) -> List[Tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) for the `top` slowest imports of `src.main`."""
+    stderr = _run("import src.main", "-X", "importtime").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [part.strip() for part in line[len("import time:") :].split("|")]
+        if not parts[0].isdigit():
+            continue
+        rows.append((parts[2], int(parts[0]), int(parts[1])))
+    return sorted(rows, key=lambda row: row[2], reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--importtime", action="store_true", help="Show slowest imports"
+    )
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument(
+        "--baseline", help="Fail if worse than this earlier JSON result"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    args = parser.parse_args()
+
+    # Populate bytecode caches so the samples measure imports, not compilation
+    _run(IMPORT_SNIPPET)
+
+    results = {
+        "import_seconds": _sample(IMPORT_SNIPPET, args.repeat),
+        "first_request_seconds": _sample(FIRST_REQUEST_SNIPPET, args.repeat),
+    }
+
+    print_table(
+        [
+            [name, f"{r['best'] * 1000:.1f}", f"{r['median'] * 1000:.1f}"]
+            for name, r in results.items()
+        ],
+        ["phase", "best ms", "median ms"],
+    )
+
+    if args.importtime:
+        print()
+        print_table(
+            [
+                [module, f"{own / 1000:.1f}", f"{cumulative / 1000:.1f}"]
+                for module, own, cumulative in import_profile(args.top)
+            ],
+            ["module", "self ms", "cumulative ms"],
+        )
+
+    save_results(results, args.output)
+
+    regressions = compare_to_baseline(results, args.baseline, "median", args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
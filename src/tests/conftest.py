@@ -0,0 +1,4 @@
+import os
+
+# Settings are read at import time; tests never need a real database server
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
@@ -0,0 +1,146 @@
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+from jose import jwt
+
+from src.app.config import settings
+from src.core.common.exceptions import ExpiredTokenException, UnauthorizedApiException
+from src.core.dependencies.auth import KeyStore, TokenCache, verify_token
+
+SECRET = "test-secret"
+
+
+@pytest.fixture(autouse=True)
+def _hs256(monkeypatch):
+    monkeypatch.setattr(settings, "JWT_ALGORITHMS", "HS256")
+    monkeypatch.setattr(settings, "JWT_AUDIENCE", "")
+    monkeypatch.setattr(settings, "JWT_ISSUER", "")
+
+
+def _token(secret: str = SECRET, kid: str = None, **claims) -> str:
+    claims.setdefault("sub", "1")
+    claims.setdefault("exp", int(time.time()) + 60)
+    headers = {"kid": kid} if kid else None
+    return jwt.encode(claims, secret, algorithm="HS256", headers=headers)
+
+
+def _jwks(*kids: str) -> str:
+    k = base64.urlsafe_b64encode(SECRET.encode()).rstrip(b"=").decode()
+    return json.dumps(
+        {"keys": [{"kty": "oct", "kid": kid, "k": k, "alg": "HS256"} for kid in kids]}
+    )
+
+
+def _verify(token: str, keys: KeyStore, cache: TokenCache = None):
+    cache = cache or TokenCache(max_entries=10, ttl=60)
+    return asyncio.run(verify_token(token, keys, cache))
+
+
+# -----------------------------------------------------------------------------
+# 🔐 Verification
+# -----------------------------------------------------------------------------
+def test_valid_token_returns_claims():
+    assert _verify(_token(), KeyStore(secret=SECRET))["sub"] == "1"
+
+
+def test_expired_token():
+    with pytest.raises(ExpiredTokenException):
+        _verify(_token(exp=int(time.time()) - 10), KeyStore(secret=SECRET))
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["not-a-jwt", _token(secret="other-secret")],
+    ids=["malformed", "bad-signature"],
+)
+def test_invalid_token(token):
+    with pytest.raises(UnauthorizedApiException):
+        _verify(token, KeyStore(secret=SECRET))
+
+
+def test_verified_tokens_are_served_from_cache():
+    cache = TokenCache(max_entries=10, ttl=60)
+    token = _token()
+    _verify(token, KeyStore(secret=SECRET), cache)
+
+    # A key store that could no longer verify it is not consulted again
+    assert _verify(token, KeyStore(secret="rotated"), cache)["sub"] == "1"
+
+
+# -----------------------------------------------------------------------------
+# 🗃️ Token cache
+# -----------------------------------------------------------------------------
+def test_cache_entry_never_outlives_exp():
+    cache = TokenCache(max_entries=10, ttl=3600)
+    cache.set("token", {"sub": "1", "exp": time.time() + 0.05})
+
+    assert cache.get("token") is not None
+    time.sleep(0.1)
+    assert cache.get("token") is None
+
+
+def test_cache_is_bounded_lru():
+    cache = TokenCache(max_entries=2, ttl=60)
+    cache.set("a", {"sub": "a"})
+    cache.set("b", {"sub": "b"})
+    cache.get("a")
+    cache.set("c", {"sub": "c"})
+
+    assert [cache.get(token) is not None for token in "abc"] == [True, False, True]
+
+
+def test_cached_claims_are_not_shared_between_requests():
+    cache = TokenCache(max_entries=10, ttl=60)
+    claims = {"sub": "1", "roles": ["user"], "exp": time.time() + 60}
+    cache.set("token", claims)
+
+    claims["roles"].append("admin")
+    first = cache.get("token")
+    first["roles"].append("admin")
+    first["sub"] = "2"
+
+    assert cache.get("token")["roles"] == ["user"]
+    assert cache.get("token")["sub"] == "1"
+
+
+# -----------------------------------------------------------------------------
+# 🗝️ Key rotation
+# -----------------------------------------------------------------------------
+def test_unknown_kid_triggers_a_refresh(tmp_path):
+    jwks = tmp_path / "jwks.json"
+    jwks.write_text(_jwks("old"))
+    keys = KeyStore(path=str(jwks), min_refresh_interval=0)
+    assert _verify(_token(kid="old"), keys)["sub"] == "1"
+
+    jwks.write_text(_jwks("new"))
+    assert _verify(_token(kid="new"), keys)["sub"] == "1"
+
+
+def test_unknown_kid_refreshes_are_rate_limited(tmp_path):
+    jwks = tmp_path / "jwks.json"
+    jwks.write_text(_jwks("old", "older"))
+    keys = KeyStore(path=str(jwks), min_refresh_interval=3600)
+    _verify(_token(kid="old"), keys)
+
+    jwks.write_text(_jwks("new", "old"))
+    with pytest.raises(UnauthorizedApiException):
+        _verify(_token(kid="new"), keys)
+
+
+def test_background_refresh_rereads_the_key_file(tmp_path):
+    jwks = tmp_path / "jwks.json"
+    jwks.write_text(_jwks("old"))
+
+    async def run():
+        keys = KeyStore(path=str(jwks), refresh_interval=0.01, min_refresh_interval=0)
+        await keys.refresh()
+        keys.start()
+        jwks.write_text(_jwks("new"))
+        await asyncio.sleep(0.1)
+        await keys.stop()
+        return set(keys.keys)
+
+    assert asyncio.run(run()) == {"new"}
@@ -0,0 +1,17 @@
+import pytest
+
+from src.core.common.exceptions import BadRequestApiException
+from src.services.batch import BatchItem, _validate
+
+
+def test_non_latin1_header_is_a_bad_request():
+    items = [BatchItem(id="a", path="/base_URL/jobs", headers={"X-Name": "Zoë ✓"})]
+
+    with pytest.raises(BadRequestApiException):
+        _validate(items, max_requests=10, batch_path="/base_URL/batch")
+
+
+def test_latin1_header_is_accepted():
+    items = [BatchItem(id="a", path="/base_URL/jobs", headers={"X-Name": "Zoë"})]
+
+    _validate(items, max_requests=10, batch_path="/base_URL/batch")
@@ -0,0 +1,282 @@
+import asyncio
+from types import SimpleNamespace
+from typing import List, Tuple
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel as Schema
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core import cache as cache_module
+from src.core.cache import MemoryBackend, RedisBackend, ResponseCache, model_tag
+from src.models.base import BaseModel
+
+
+def _cache() -> ResponseCache:
+    return ResponseCache(
+        MemoryBackend(max_entries=100, max_bytes=1 << 20), default_ttl=60
+    )
+
+
+# -----------------------------------------------------------------------------
+# ⚡ Single-flight
+# -----------------------------------------------------------------------------
+def test_concurrent_misses_compute_once():
+    calls = []
+
+    async def compute() -> bytes:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return b"value"
+
+    async def run():
+        cache = _cache()
+        return await asyncio.gather(*(cache.get_or_set("k", compute) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert [value for value, _ in results] == [b"value"] * 5
+    assert sorted(hit for _, hit in results) == [False] + [True] * 4
+
+
+def test_errors_are_shared_with_followers():
+    async def compute() -> bytes:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run():
+        cache = _cache()
+        return await asyncio.gather(
+            *(cache.get_or_set("k", compute) for _ in range(3)), return_exceptions=True
+        )
+
+    assert all(isinstance(result, ValueError) for result in asyncio.run(run()))
+
+
+def test_cancelled_leader_does_not_fail_followers():
+    started = []
+
+    async def compute() -> bytes:
+        started.append(1)
+        await asyncio.sleep(0.05)
+        return b"value"
+
+    async def run():
+        cache = _cache()
+        leader = asyncio.create_task(cache.get_or_set("k", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_set("k", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == (b"value", False)
+    assert len(started) == 2
+
+
+# -----------------------------------------------------------------------------
+# 🗃️ Memory backend
+# -----------------------------------------------------------------------------
+def test_memory_backend_evicts_least_recently_used_past_max_bytes():
+    backend = MemoryBackend(max_entries=100, max_bytes=10)
+
+    async def run():
+        await backend.set("a", b"1234", ttl=60)
+        await backend.set("b", b"1234", ttl=60)
+        await backend.get("a")
+        await backend.set("c", b"1234", ttl=60)
+        return [await backend.get(key) for key in "abc"]
+
+    assert asyncio.run(run()) == [b"1234", None, b"1234"]
+    assert backend.size == 8
+
+
+def test_memory_backend_drops_values_larger_than_max_bytes():
+    backend = MemoryBackend(max_entries=100, max_bytes=10)
+
+    async def run():
+        await backend.set("a", b"1234", ttl=60)
+        await backend.set("big", b"x" * 11, ttl=60)
+        return await backend.get("a"), await backend.get("big")
+
+    assert asyncio.run(run()) == (b"1234", None)
+    assert backend.size <= 10
+
+
+# -----------------------------------------------------------------------------
+# 🧹 Invalidation on commit
+# -----------------------------------------------------------------------------
+class Gadget(BaseModel):
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+def test_commit_invalidates_tagged_entries(monkeypatch):
+    backend = MemoryBackend(max_entries=100, max_bytes=1 << 20)
+    monkeypatch.setattr(cache_module.cache, "backend", backend)
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Gadget.__table__.create)
+        await backend.set("gadgets", b"[]", ttl=60, tags=[model_tag(Gadget)])
+        await backend.set("other", b"[]", ttl=60, tags=["other"])
+
+        async with async_sessionmaker(engine)() as session:
+            session.add(Gadget(name="new"))
+            await session.flush()
+            await asyncio.sleep(0)
+            assert await backend.get("gadgets") == b"[]"  # not before the commit
+            await session.commit()
+        await asyncio.sleep(0)
+        await engine.dispose()
+        return await backend.get("gadgets"), await backend.get("other")
+
+    assert asyncio.run(run()) == (None, b"[]")
+
+
+def test_rollback_keeps_tagged_entries(monkeypatch):
+    backend = MemoryBackend(max_entries=100, max_bytes=1 << 20)
+    monkeypatch.setattr(cache_module.cache, "backend", backend)
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Gadget.__table__.create)
+        await backend.set("gadgets", b"[]", ttl=60, tags=[model_tag(Gadget)])
+        async with async_sessionmaker(engine)() as session:
+            session.add(Gadget(name="new"))
+            await session.flush()
+            await session.rollback()
+        await asyncio.sleep(0)
+        await engine.dispose()
+        return await backend.get("gadgets")
+
+    assert asyncio.run(run()) == b"[]"
+
+
+# -----------------------------------------------------------------------------
+# 🎀 cached() decorator
+# -----------------------------------------------------------------------------
+class UserOut(Schema):
+    id: int
+    name: str
+
+
+def _client(response_cache: ResponseCache) -> Tuple[TestClient, List[int]]:
+    router = APIRouter()
+    calls = []
+
+    @router.get("/users", response_model=List[UserOut])
+    @response_cache.cached(response_model=List[UserOut])
+    async def list_users():
+        calls.append(1)
+        return [SimpleNamespace(id=1, name="a", password="secret")]
+
+    @router.get("/orm")
+    @response_cache.cached()
+    async def list_orm():
+        return [Gadget(id=1, name="a")]
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app), calls
+
+
+def test_cached_serializes_through_response_model():
+    client, calls = _client(_cache())
+
+    first, second = client.get("/users"), client.get("/users")
+
+    assert first.json() == second.json() == [{"id": 1, "name": "a"}]
+    assert [first.headers["x-cache"], second.headers["x-cache"]] == ["MISS", "HIT"]
+    assert len(calls) == 1
+
+
+def test_cached_refuses_orm_objects_without_response_model():
+    client, _ = _client(_cache())
+
+    with pytest.raises(TypeError):
+        client.get("/orm")
+
+
+# -----------------------------------------------------------------------------
+# 🗄️ Redis tag sets
+# -----------------------------------------------------------------------------
+class _FakeRedis:
+    """Just enough of redis.asyncio for `RedisBackend`, with TTLs as plain numbers."""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def pipeline(self, transaction: bool = True) -> "_FakePipeline":
+        return _FakePipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def smembers(self, key):
+        return set(self.values.get(key, ()))
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.ttls.pop(key, None)
+
+
+class _FakePipeline:
+    def __init__(self, client: _FakeRedis):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def set(self, key, value, ex):
+        self.commands.append(
+            lambda c: (c.values.__setitem__(key, value), c.ttls.__setitem__(key, ex))
+        )
+
+    def sadd(self, key, member):
+        self.commands.append(lambda c: c.values.setdefault(key, set()).add(member))
+
+    def expire(self, key, seconds, nx=False, gt=False):
+        def run(c):
+            current = c.ttls.get(key)
+            if (nx and current is not None) or (
+                gt and (current is None or seconds <= current)
+            ):
+                return
+            c.ttls[key] = seconds
+
+        self.commands.append(run)
+
+    async def execute(self):
+        for command in self.commands:
+            command(self.client)
+
+
+def test_redis_tag_set_ttl_is_only_extended():
+    client = _FakeRedis()
+    backend = RedisBackend(client=client, prefix="c:")
+
+    async def run():
+        await backend.set("long", b"1", ttl=300, tags=["item"])
+        await backend.set("short", b"2", ttl=5, tags=["item"])
+        assert client.ttls["c:tag:item"] == 300
+        await backend.set("longer", b"3", ttl=600, tags=["item"])
+        assert client.ttls["c:tag:item"] == 600
+
+        await backend.invalidate_tags(["item"])
+        assert client.values == {}
+
+    asyncio.run(run())
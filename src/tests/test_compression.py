@@ -0,0 +1,53 @@
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.app.middleware.compression import CompressionMiddleware
+from src.core.cache import MemoryBackend
+
+
+def _resource(body: bytes):
+    async def endpoint(request):
+        return Response(body, media_type="application/json", headers={"ETag": '"1"'})
+
+    return endpoint
+
+
+async def events(request):
+    async def stream():
+        for i in range(3):
+            yield f"data: {i}\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+app = Starlette(
+    routes=[
+        Route("/a", _resource(b'{"a":"' + b"a" * 2000 + b'"}')),
+        Route("/b", _resource(b'{"b":"' + b"b" * 2000 + b'"}')),
+        Route("/events", events),
+    ]
+)
+client = TestClient(
+    CompressionMiddleware(
+        app, encodings=["gzip"], cache=MemoryBackend(max_entries=10, max_bytes=1 << 20)
+    )
+)
+
+
+def test_same_route_etag_on_two_urls_never_shares_a_compressed_body():
+    for _ in range(2):
+        a = client.get("/a", headers={"Accept-Encoding": "gzip"})
+        b = client.get("/b", headers={"Accept-Encoding": "gzip"})
+
+        assert a.headers["content-encoding"] == b.headers["content-encoding"] == "gzip"
+        assert a.json() == {"a": "a" * 2000}
+        assert b.json() == {"b": "b" * 2000}
+
+
+def test_event_streams_are_not_compressed():
+    response = client.get("/events", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
@@ -0,0 +1,41 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from src.core.count import _estimated_count
+
+items = Table("items", MetaData(), Column("id", Integer), Column("name", String))
+
+
+class _Connection:
+    def __init__(self):
+        self.statements = []
+
+    async def exec_driver_sql(self, statement):
+        self.statements.append(statement)
+        plan = json.dumps([{"Plan": {"Plan Rows": 1234}}])
+        return SimpleNamespace(scalar_one=lambda: plan)
+
+
+class _Session:
+    def __init__(self):
+        self.bind = SimpleNamespace(dialect=PGDialect_asyncpg())
+        self.conn = _Connection()
+
+    async def connection(self):
+        return self.conn
+
+
+def test_estimate_keeps_colons_in_filter_values():
+    session = _Session()
+    stmt = select(items).where(items.c.name == "a :foo")
+
+    estimate = asyncio.run(_estimated_count(session, stmt))
+
+    assert estimate == 1234
+    (statement,) = session.conn.statements
+    assert statement.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "'a :foo'" in statement
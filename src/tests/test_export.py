@@ -0,0 +1,21 @@
+from sqlalchemy import column, select
+
+from src.core.export import ExportFormat, export_response
+
+stmt = select(column("id"))
+
+
+def _encoding(accept_encoding: str):
+    response = export_response(
+        stmt, ExportFormat.NDJSON, accept_encoding=accept_encoding
+    )
+    return response.headers.get("content-encoding")
+
+
+def test_gzip_when_accepted():
+    assert _encoding("gzip, deflate") == "gzip"
+
+
+def test_no_gzip_when_refused_by_q_value():
+    assert _encoding("gzip;q=0, br") is None
+    assert _encoding("identity") is None
@@ -0,0 +1,84 @@
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.app.config import settings
+from src.services.jobs import JobQueue, JobStatus, Offloader, default_process_workers
+
+
+def _crash() -> None:
+    os._exit(1)
+
+
+def _double(value: int) -> int:
+    return value * 2
+
+
+def _queue() -> JobQueue:
+    queue = JobQueue(Offloader(process_workers=1, thread_workers=1), concurrency=1)
+
+    @queue.task()
+    async def sleep(seconds: float) -> float:
+        await asyncio.sleep(seconds)
+        return seconds
+
+    return queue
+
+
+def test_stop_drains_queued_jobs():
+    async def scenario():
+        queue = _queue()
+        queue.start()
+        jobs = [await queue.submit("sleep", args=[0.05]) for _ in range(3)]
+        await queue.stop(timeout=5)
+        return jobs
+
+    jobs = asyncio.run(scenario())
+    assert [job.status for job in jobs] == [JobStatus.SUCCEEDED] * 3
+    assert [job.result for job in jobs] == [0.05] * 3
+
+
+def test_submit_kwargs_may_use_option_names():
+    async def scenario():
+        queue = JobQueue(Offloader(process_workers=1, thread_workers=1), concurrency=1)
+
+        @queue.task()
+        async def echo(**kwargs):
+            return kwargs
+
+        queue.start()
+        job = await queue.submit(
+            "echo", kwargs={"task": "t", "priority": 1, "max_retries": 2}
+        )
+        await queue.stop(timeout=5)
+        return job
+
+    job = asyncio.run(scenario())
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.result == {"task": "t", "priority": 1, "max_retries": 2}
+
+
+def test_broken_process_pool_is_replaced():
+    async def scenario():
+        offloader = Offloader(process_workers=1, thread_workers=1)
+        offloader.start()
+        try:
+            with pytest.raises(BrokenProcessPool):
+                await offloader.run_in_process(_crash)
+            return await offloader.run_in_process(_double, 21)
+        finally:
+            await offloader.shutdown()
+
+    assert asyncio.run(scenario()) == 42
+
+
+def test_default_process_workers_are_split_across_server_workers(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(settings, "WORKERS", 0)
+    assert default_process_workers() == 1
+    monkeypatch.setattr(settings, "WORKERS", 2)
+    assert default_process_workers() == 3
+    monkeypatch.setattr(settings, "WORKERS", 1)
+    assert default_process_workers() == 7
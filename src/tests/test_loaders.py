@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from src.core.loaders import DataLoader
+
+
+def test_loads_in_one_tick_are_batched():
+    batches = []
+
+    async def batch_fn(keys):
+        batches.append(keys)
+        return {key: key * 10 for key in keys}
+
+    async def run():
+        loader = DataLoader(batch_fn)
+        return await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+
+    assert asyncio.run(run()) == [10, 20, 10]
+    assert batches == [[1, 2]]
+
+
+def test_failed_batch_is_retried_on_next_load():
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(keys)
+        if len(calls) == 1:
+            raise ValueError("boom")
+        return {key: key for key in keys}
+
+    async def run():
+        loader = DataLoader(batch_fn)
+        with pytest.raises(ValueError):
+            await loader.load(1)
+        return await loader.load(1)
+
+    assert asyncio.run(run()) == 1
+
+
+def test_cancelled_batch_never_leaves_keys_pending():
+    async def run():
+        blocked = asyncio.Event()
+        calls = []
+
+        async def batch_fn(keys):
+            calls.append(keys)
+            if len(calls) == 1:
+                await blocked.wait()
+            return {key: key for key in keys}
+
+        loader = DataLoader(batch_fn)
+        first = loader.load(1)
+        await asyncio.sleep(0.01)
+        (task,) = loader._tasks
+        task.cancel()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert first.cancelled()
+        assert not loader._tasks
+        return await asyncio.wait_for(loader.load(1), timeout=1)
+
+    assert asyncio.run(run()) == 1
@@ -0,0 +1,19 @@
+import logging
+
+from src.core.logger import RateLimitFilter
+
+
+def _record(kind: str) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "app", logging.ERROR, __file__, 1, "%s at %s", (kind, "/"), None
+    )
+    record.rate_limit_key = kind
+    return record
+
+
+def test_rate_limit_buckets_are_per_error_kind():
+    limiter = RateLimitFilter(sample_rate=1.0, rate=0.001, burst=1)
+
+    assert limiter.filter(_record("NotFoundApiException"))
+    assert not limiter.filter(_record("NotFoundApiException"))
+    assert limiter.filter(_record("InternalErrorApiException"))
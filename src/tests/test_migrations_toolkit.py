@@ -0,0 +1,43 @@
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, event, text
+
+from src.migrations.toolkit import _quote, backfill
+
+
+def test_quote_schema_qualified_names():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        with Operations.context(MigrationContext.configure(connection)):
+            assert _quote("orders") == "orders"
+            assert _quote("billing.Orders") == 'billing."Orders"'
+
+
+def test_backfill_binds_only_the_params_each_batch_uses():
+    engine = create_engine("sqlite://")
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    with engine.connect() as connection:
+        connection.execute(
+            text("CREATE TABLE orders (id INTEGER PRIMARY KEY, total INTEGER)")
+        )
+        connection.execute(
+            text("INSERT INTO orders (id, total) VALUES (:id, 1)"),
+            [{"id": i} for i in range(5)],
+        )
+        connection.commit()
+        with Operations.context(MigrationContext.configure(connection)):
+            done = backfill("orders", "total = total * 100", batch_size=2, pause=0)
+
+        assert done == 5
+        assert connection.execute(text("SELECT sum(total) FROM orders")).scalar() == 500
+
+    selects = [
+        params for statement, params in statements if statement.startswith("SELECT id")
+    ]
+    assert len(selects[0]) == 1
+    assert all(len(params) == 2 for params in selects[1:])
@@ -0,0 +1,45 @@
+import asyncio
+
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.count import CountStrategy, _estimated_count, count_rows
+from src.models.base import BaseModel
+from src.services.repository import Repository
+from src.tests.test_count import _Session
+
+
+class Widget(BaseModel):
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+def test_estimated_count_skips_soft_deleted_rows():
+    session = _Session()
+    stmt = Repository(session, model=Widget).query()
+
+    estimate = asyncio.run(_estimated_count(session, stmt))
+
+    # The planner is asked about live rows, never `pg_class.reltuples` of the table
+    assert estimate == 1234
+    (statement,) = session.conn.statements
+    assert "widget.deleted_at IS NULL" in statement
+
+
+def test_counts_skip_soft_deleted_rows():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Widget.__table__.create)
+        async with async_sessionmaker(engine)() as session:
+            widgets = Repository(session, model=Widget)
+            await widgets.bulk_create([{"name": str(i)} for i in range(5)])
+            await widgets.soft_delete([1, 2])
+            stmt = widgets.query()
+            counts = [
+                await count_rows(session, stmt, strategy) for strategy in CountStrategy
+            ]
+        await engine.dispose()
+        return counts
+
+    assert [count.total for count in asyncio.run(run())] == [3, 3, 3]
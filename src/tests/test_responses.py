@@ -0,0 +1,85 @@
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.core.responses import FastJSONResponse, FastJSONRoute
+
+
+class UserOut(BaseModel):
+    id: int
+    nickname: Optional[str] = None
+
+
+router = APIRouter(route_class=FastJSONRoute)
+
+
+@router.get("/users", response_model=List[UserOut], response_model_exclude_none=True)
+async def list_users():
+    # ORM-like objects with attributes the response model must drop
+    return [
+        SimpleNamespace(id=1, nickname="a", password="secret"),
+        SimpleNamespace(id=2, nickname=None, password="secret"),
+    ]
+
+
+@router.post("/users", response_model=UserOut, status_code=201)
+def create_user():
+    return {"id": 3, "password": "secret"}
+
+
+@router.get("/plain")
+async def plain():
+    return {"at": datetime(2024, 1, 2, 3, 4, 5)}
+
+
+@router.get("/text", response_class=PlainTextResponse)
+async def text():
+    return "ok"
+
+
+@router.get("/broken", response_model=UserOut)
+async def broken():
+    return {"nickname": "no id"}
+
+
+app = FastAPI(default_response_class=FastJSONResponse)
+app.include_router(router)
+client = TestClient(app)
+
+
+def test_response_model_filters_and_options_apply():
+    response = client.get("/users")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == b'[{"id":1,"nickname":"a"},{"id":2}]'
+
+
+def test_sync_endpoint_keeps_status_code():
+    response = client.post("/users")
+
+    assert response.status_code == 201
+    assert response.json() == {"id": 3, "nickname": None}
+
+
+def test_without_response_model_content_is_encoded_directly():
+    assert client.get("/plain").json() == {"at": "2024-01-02T03:04:05"}
+
+
+def test_non_json_response_class_is_left_alone():
+    response = client.get("/text")
+
+    assert response.text == "ok"
+    assert response.headers["content-type"].startswith("text/plain")
+
+
+def test_invalid_return_value_is_a_response_validation_error():
+    with pytest.raises(ResponseValidationError):
+        client.get("/broken")
@@ -0,0 +1,9 @@
+from src.app.server import _MAX_RESTART_DELAY, _restart_delay
+
+
+def test_restart_delay_backs_off_on_crash_loops():
+    delays = [_restart_delay(crashes) for crashes in range(8)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2:5] == [0.5, 1.0, 2.0]
+    assert _restart_delay(100) == _MAX_RESTART_DELAY